@@ -1,49 +1,340 @@
 # Configuration file for job recommender system
+import functools
+import json
+import pickle
 import yaml
 import os
+import sys
+from types import MappingProxyType
+from typing import Mapping, NamedTuple, Optional
 
-def load_yaml_config(config_path: str = "configs/settings.yaml") -> dict:
-    """Load configuration from YAML file"""
+# Prefer the libyaml-backed loader, fall back to the pure-Python one
+try:
+    from yaml import CSafeLoader as _YamlLoader
+    HAS_LIBYAML = True
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+    HAS_LIBYAML = False
+
+DEFAULT_CONFIG_PATH = "configs/settings.yaml"
+JSON_CACHE_SUFFIX = ".cache.json"
+
+
+def _frozen_config_path(config_path: str) -> str:
+    """Path of the precompiled pickle for a YAML config (settings.yaml -> settings.pkl)"""
+    return os.path.splitext(config_path)[0] + ".pkl"
+
+
+def _read_frozen_config(frozen_path: str, mtime: float) -> Optional[dict]:
+    """Return the precompiled config if present and at least as new as the YAML"""
     try:
-        with open(config_path, 'r') as file:
-            return yaml.safe_load(file)
-    except FileNotFoundError:
+        if os.path.getmtime(frozen_path) < mtime:
+            return None
+        with open(frozen_path, 'rb') as file:
+            return pickle.load(file)
+    except (OSError, pickle.UnpicklingError, EOFError):
+        return None
+
+
+def _read_json_cache(cache_path: str, key: list) -> Optional[dict]:
+    """Return the JSON snapshot of a config if it was written for this YAML stat key"""
+    try:
+        with open(cache_path, 'r', encoding='utf-8') as file:
+            snapshot = json.load(file)
+    except (OSError, ValueError):
+        return None
+    # Compare against the recorded (mtime_ns, size) rather than the sidecar's
+    # own mtime, so a checkout that moves the YAML back in time is noticed
+    if not isinstance(snapshot, dict) or snapshot.get('key') != key:
+        return None
+    return snapshot.get('data')
+
+
+def _write_json_cache(cache_path: str, key: list, config: dict):
+    """Best-effort write of a JSON snapshot next to the YAML file"""
+    try:
+        with open(cache_path, 'w', encoding='utf-8') as file:
+            json.dump({'key': key, 'data': config}, file)
+    except (OSError, TypeError, ValueError):
+        # Read-only config dir or values JSON can't represent (e.g. YAML dates)
+        try:
+            os.remove(cache_path)
+        except OSError:
+            pass
+
+
+@functools.lru_cache(maxsize=4)
+def _parse_yaml_config(config_path: str, mtime_ns: int, size: int) -> dict:
+    """Parse a YAML file; memoized on (path, mtime_ns, size) so edits are picked up"""
+    cache_path = config_path + JSON_CACHE_SUFFIX
+    cache_key = [mtime_ns, size]
+    config = _read_frozen_config(_frozen_config_path(config_path), mtime_ns / 1e9)
+    if config is None:
+        config = _read_json_cache(cache_path, cache_key)
+    if config is None:
+        config = _read_yaml_file(config_path)
+        _write_json_cache(cache_path, cache_key, config)
+    
+    _validate_config(config, config_path)
+    return config
+
+
+def _read_yaml_file(config_path: str) -> dict:
+    """Parse a YAML file without consulting any snapshot"""
+    # libyaml reads bytes directly and detects the encoding itself. The
+    # file is streamed from the handle rather than read into a string;
+    # settings.yaml is a few KB, so a streaming parser such as ruamel.yaml
+    # would add a dependency without a measurable memory win
+    with open(config_path, 'rb') as file:
+        return yaml.load(file, Loader=_YamlLoader) or {}
+
+
+def precompile_config(config_path: str = DEFAULT_CONFIG_PATH) -> str:
+    """
+    Parse the YAML config once and freeze it into a pickle next to it.
+    
+    Meant to run at build/deploy time; load_yaml_config() prefers the
+    pickle while it is at least as new as the YAML. Only load pickles you
+    built yourself - unpickling runs arbitrary code.
+    
+    Args:
+        config_path: Path to the YAML config
+        
+    Returns:
+        Path to the written pickle
+    """
+    config = _read_yaml_file(config_path)
+    _validate_config(config, config_path)
+    
+    frozen_path = _frozen_config_path(config_path)
+    with open(frozen_path, 'wb') as file:
+        pickle.dump(config, file, protocol=pickle.HIGHEST_PROTOCOL)
+    return frozen_path
+
+
+def load_yaml_config(config_path: str = DEFAULT_CONFIG_PATH) -> dict:
+    """Load configuration from YAML file (cached; treat the result as read-only)"""
+    if not os.path.isfile(config_path):
         return {}
+    stat = os.stat(config_path)
+    return _parse_yaml_config(config_path, stat.st_mtime_ns, stat.st_size)
 
-# Load YAML config if available
-YAML_CONFIG = load_yaml_config()
 
-# Email configuration (can be overridden by YAML)
-EMAIL_CONFIG = YAML_CONFIG.get('email', {
+_EMAIL_DEFAULTS = {
     'smtp_server': 'smtp.gmail.com',
     'smtp_port': 587,
     'use_tls': True,
     'sender_email': 'your-email@gmail.com',
     'sender_password': 'your-app-password',
-})
-
-# User preferences template
-DEFAULT_USER_PREFERENCES = {
-    'job_titles': YAML_CONFIG.get('search', {}).get('terms', []),
-    'locations': YAML_CONFIG.get('search', {}).get('locations', []),
-    'experience_levels': ['entry', 'mid', 'senior'],
-    'companies_to_include': [],
-    'companies_to_exclude': [],
-    'keywords': [],
-    'max_age_hours': 72,
-    'sites_to_scrape': YAML_CONFIG.get('scrapers', {}).get('enabled', ['linkedin', 'indeed', 'glassdoor']),
-    'pages_per_site': YAML_CONFIG.get('search', {}).get('pages_per_source', 2),
-    'email': '',
-    'notification_frequency': 'daily',
-    'output_format': YAML_CONFIG.get('output', {}).get('format', 'csv'),
 }
 
-# Scoring weights for job recommendations
-SCORING_WEIGHTS = {
-    'title_match': 0.3,
-    'location_match': 0.2,
-    'company_preference': 0.2,
-    'experience_match': 0.15,
-    'keyword_match': 0.1,
-    'freshness': 0.05,
-}
\ No newline at end of file
+# Environment variables that override email settings (e.g. secrets in CI)
+_EMAIL_ENV = {
+    'smtp_server': 'SMTP_SERVER',
+    'smtp_port': 'SMTP_PORT',
+    'sender_email': 'SMTP_USER',
+    'sender_password': 'SMTP_PASSWORD',
+}
+
+
+@functools.lru_cache(maxsize=None)
+def get_email_config() -> Mapping:
+    """
+    Email configuration: defaults, overlaid by YAML, overlaid by environment.
+    
+    Merged once and returned read-only; call reload_config() to pick up
+    changes to the YAML or environment.
+    """
+    env_overrides = {key: os.environ[var] for key, var in _EMAIL_ENV.items() if var in os.environ}
+    if 'smtp_port' in env_overrides:
+        env_overrides['smtp_port'] = int(env_overrides['smtp_port'])
+    
+    return MappingProxyType({
+        **_EMAIL_DEFAULTS,
+        **(load_yaml_config().get('email') or {}),
+        **env_overrides,
+    })
+
+
+def _intern_tuple(values) -> tuple:
+    """Freeze a list of strings into a tuple of interned strings"""
+    return tuple(sys.intern(v) for v in values or ())
+
+
+_EXPERIENCE_LEVELS = _intern_tuple(('entry', 'mid', 'senior'))
+_DEFAULT_SITES = _intern_tuple(('linkedin', 'indeed', 'glassdoor'))
+
+
+@functools.lru_cache(maxsize=None)
+def get_user_preferences() -> dict:
+    """
+    User preferences template.
+    
+    List-valued defaults are shared tuples; use new_user_preferences()
+    to get a mutable per-user copy.
+    """
+    yaml_config = load_yaml_config()
+    search = yaml_config.get('search') or {}
+    scrapers = yaml_config.get('scrapers') or {}
+    output = yaml_config.get('output') or {}
+    return {
+        'job_titles': _intern_tuple(search.get('terms')),
+        'locations': _intern_tuple(search.get('locations')),
+        'experience_levels': _EXPERIENCE_LEVELS,
+        'companies_to_include': (),
+        'companies_to_exclude': (),
+        'keywords': (),
+        'max_age_hours': 72,
+        'sites_to_scrape': _intern_tuple(scrapers.get('enabled', _DEFAULT_SITES)),
+        'pages_per_site': search.get('pages_per_source', 2),
+        'email': '',
+        'notification_frequency': 'daily',
+        'output_format': output.get('format', 'csv'),
+    }
+
+
+def new_user_preferences(**overrides) -> dict:
+    """
+    Create a mutable copy of the default user preferences.
+    
+    Args:
+        **overrides: Preference values to set on the copy
+        
+    Returns:
+        Preferences dictionary with list values safe to mutate
+    """
+    preferences = {key: list(value) if isinstance(value, tuple) else value
+                   for key, value in get_user_preferences().items()}
+    preferences.update(overrides)
+    return preferences
+
+
+class ScoringWeights(NamedTuple):
+    """Scoring weights for job recommendations (immutable, attribute access)"""
+    title_match: float = 0.3
+    location_match: float = 0.2
+    company_preference: float = 0.2
+    experience_match: float = 0.15
+    keyword_match: float = 0.1
+    freshness: float = 0.05
+    
+    def as_dict(self) -> dict:
+        """Return the weights as a plain dictionary"""
+        return dict(self._asdict())
+
+
+_NUMBER = (int, float)
+
+# Expected value types per section; None is accepted for any key ("unset")
+# and every list is a list of strings
+_CONFIG_SCHEMA = {
+    'search': {'terms': list, 'locations': list, 'pages_per_source': int},
+    'scrapers': {'enabled': list, 'parallel': bool, 'max_workers': int, 'delay': _NUMBER},
+    'filters': {
+        'min_salary': _NUMBER, 'max_salary': _NUMBER, 'experience_levels': list,
+        'exclude_companies': list, 'include_companies': list, 'keywords': list,
+        'exclude_keywords': list, 'max_age_days': _NUMBER, 'remote_only': bool,
+        'full_time_only': bool,
+    },
+    'output': {
+        'format': str, 'filename': str, 'include_duplicates': bool,
+        'sort_by': str, 'sort_order': str,
+    },
+    'email': {
+        'enabled': bool, 'recipient': str, 'sender': str, 'sender_email': str,
+        'sender_password': str, 'smtp_server': str, 'smtp_port': int, 'use_tls': bool,
+        'subject_template': str, 'include_attachments': bool, 'max_jobs_in_email': int,
+    },
+    'logging': {'level': str, 'file': str, 'max_size_mb': _NUMBER, 'backup_count': int},
+    'rate_limiting': {'requests_per_minute': _NUMBER, 'burst_limit': int, 'respect_robots_txt': bool},
+    'advanced': {'user_agents': list, 'timeout': _NUMBER, 'retry_attempts': int, 'retry_delay': _NUMBER},
+    'scoring': {field: _NUMBER for field in ScoringWeights._fields},
+}
+
+
+def _validate_config(config: dict, config_path: str):
+    """
+    Check a parsed config against _CONFIG_SCHEMA once, at load time.
+    
+    Unknown keys are allowed; known keys with the wrong type are not.
+    
+    Raises:
+        ValueError: If the config does not match the schema
+    """
+    def fail(location: str, expected: str):
+        raise ValueError(f"Invalid configuration in {config_path}: {location} must be {expected}")
+    
+    if not isinstance(config, dict):
+        fail("top level", "a mapping")
+    
+    for section, fields in _CONFIG_SCHEMA.items():
+        values = config.get(section)
+        if values is None:
+            continue
+        if not isinstance(values, dict):
+            fail(section, "a mapping")
+        
+        for key, value in values.items():
+            expected = fields.get(key)
+            if expected is None:
+                if section == 'scoring':
+                    fail(f"{section}.{key}", f"one of {', '.join(ScoringWeights._fields)}")
+                continue
+            if value is None:
+                continue
+            if not isinstance(value, expected) or (isinstance(value, bool) and expected is not bool):
+                names = ' or '.join(t.__name__ for t in (expected if isinstance(expected, tuple) else (expected,)))
+                fail(f"{section}.{key}", f"of type {names}")
+            if expected is list and not all(isinstance(item, str) for item in value):
+                fail(f"{section}.{key}", "a list of strings")
+
+
+@functools.lru_cache(maxsize=None)
+def get_scoring_weights() -> ScoringWeights:
+    """Scoring weights, with per-field overrides from the YAML 'scoring' section"""
+    return ScoringWeights(**(load_yaml_config().get('scoring') or {}))
+
+
+def reload_config():
+    """Drop all cached configuration so the next access re-reads settings.yaml"""
+    _parse_yaml_config.cache_clear()
+    get_email_config.cache_clear()
+    get_user_preferences.cache_clear()
+    get_scoring_weights.cache_clear()
+
+
+def install_reload_signal_handler() -> bool:
+    """
+    Reload configuration on SIGHUP (POSIX only, must run in the main thread).
+    
+    Returns:
+        True if the handler was installed, False otherwise
+    """
+    import signal
+    
+    if not hasattr(signal, 'SIGHUP'):
+        return False
+    signal.signal(signal.SIGHUP, lambda signum, frame: reload_config())
+    return True
+
+
+# Legacy module attributes, resolved on access through the cached builders
+# so importing config does no file I/O and reload_config() takes effect
+_LAZY_ATTRIBUTES = {
+    'YAML_CONFIG': load_yaml_config,
+    'EMAIL_CONFIG': get_email_config,
+    'DEFAULT_USER_PREFERENCES': get_user_preferences,
+    'SCORING_WEIGHTS': get_scoring_weights,
+}
+
+
+def __getattr__(name: str):
+    builder = _LAZY_ATTRIBUTES.get(name)
+    if builder is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return builder()
+
+
+if __name__ == "__main__":
+    # python -m config [path/to/settings.yaml] -> writes path/to/settings.pkl
+    print(f"Frozen config written to {precompile_config(*sys.argv[1:2])}")
@@ -1,14 +1,40 @@
 """
 Filters package initialization.
+
+Filter classes are resolved lazily on first access so importing the
+package does not load every filter module up front.
 """
 
-from .job_filter import JobFilter, DuplicateRemover, ExperienceFilter, CompanyFilter, LocationFilter, DateFilter
+import importlib
+
+_LAZY_IMPORTS = {
+    'JobFilter': 'job_filter',
+    'DuplicateRemover': 'job_filter',
+    'ExperienceFilter': 'job_filter',
+    'CompanyFilter': 'job_filter',
+    'LocationFilter': 'job_filter',
+    'DateFilter': 'job_filter',
+}
 
 __all__ = [
     'JobFilter',
-    'DuplicateRemover', 
+    'DuplicateRemover',
     'ExperienceFilter',
     'CompanyFilter',
     'LocationFilter',
     'DateFilter'
 ]
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(f".{module_name}", __name__)
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -2,10 +2,16 @@
 Job filtering and deduplication utilities.
 """
 
+import copy
+import functools
+import json
+import os
 import re
-import hashlib
 from abc import ABC, abstractmethod
-from typing import List, Dict, Set, Optional, Any
+from typing import List, Dict, Set, FrozenSet, Optional, Any, Union
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from itertools import compress, repeat
 from datetime import datetime, timedelta
 import logging
 
@@ -16,6 +22,301 @@ try:
 except ImportError:
     HAS_DATEUTIL = False
 
+# Try to import datasketch for MinHash-LSH candidate search in DuplicateRemover
+try:
+    from datasketch import MinHash, MinHashLSH
+    HAS_DATASKETCH = True
+except ImportError:
+    HAS_DATASKETCH = False
+
+# Try to import pandas for column-wise filtering of large job lists
+try:
+    import pandas as pd
+    HAS_PANDAS = True
+except ImportError:
+    HAS_PANDAS = False
+
+# With pyarrow, pandas string methods run in Arrow's C kernels; on plain
+# object columns they loop in Python and are slower than the per-job path
+try:
+    import pyarrow
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+
+# Try to import pyahocorasick for multi-keyword matching, fallback to a regex alternation
+try:
+    import ahocorasick
+    HAS_AHOCORASICK = True
+except ImportError:
+    HAS_AHOCORASICK = False
+
+# Precompiled patterns shared by the filters below
+_WHITESPACE_RE = re.compile(r'\s+')
+_PUNCTUATION_RE = re.compile(r'[^\w\s]')
+# Deletes the ASCII characters _PUNCTUATION_RE matches
+_ASCII_PUNCTUATION_TABLE = {code: None for code in range(128) if _PUNCTUATION_RE.match(chr(code))}
+_COMPANY_SUFFIX_RE = re.compile(
+    r'\b(inc|incorporated|corp|corporation|ltd|limited|llc|co|company)\b')
+_NUMBER_RE = re.compile(r'\d+')
+_LOCATION_SEPARATOR_RE = re.compile(r'[,\-\(\)]')
+
+# Fast path for the common posting dates: "today", "yesterday", "N <unit>s ago"
+_UNIT_TO_DELTA = {
+    'hour': lambda n: timedelta(hours=n),
+    'day': lambda n: timedelta(days=n),
+    'week': lambda n: timedelta(weeks=n),
+    'month': lambda n: timedelta(days=n * 30),
+}
+# The unit word of "N <unit> ago", singular or plural
+_RELATIVE_UNIT_DELTAS = {unit + suffix: to_delta
+                         for unit, to_delta in _UNIT_TO_DELTA.items() for suffix in ('', 's')}
+_LITERAL_DATE_DELTAS = {
+    'today': timedelta(0),
+    'yesterday': timedelta(days=1),
+}
+
+# Absolute posting-date formats, tried in order, with the shortest and
+# longest (lowercased) strings each can match; strptime accepts unpadded
+# day/month numbers, hence the ranges
+_DATE_FORMATS = (
+    ('%Y-%m-%d', 8, 10),
+    ('%m/%d/%Y', 8, 10),
+    ('%d/%m/%Y', 8, 10),
+    ('%Y-%m-%d %H:%M:%S', 14, 19),
+    ('%Y-%m-%dt%H:%M:%S', 14, 19),
+    ('%b %d, %Y', 10, 12),
+    ('%B %d, %Y', 10, 18),
+    ('%d %b %Y', 10, 11),
+)
+
+# dateutil parses far more formats but costs many regex passes per string
+USE_DATEUTIL = bool(os.environ.get('USE_DATEUTIL'))
+
+# (pattern, replacement) pairs applied in order by LocationFilter._normalize_location
+_LOCATION_REWRITES = (
+    (re.compile(r'\b(usa|us|united states)\b'), ''),
+    (re.compile(r'\b(ca|california)\b'), 'california'),
+    (re.compile(r'\b(ny|new york)\b'), 'new york'),
+    (re.compile(r'\b(fl|florida)\b'), 'florida'),
+    (re.compile(r'\b(tx|texas)\b'), 'texas'),
+)
+
+# MainJobFilter switches to pandas masks (Arrow-backed) at this many jobs;
+# below it building the columns costs more than the per-job loop
+VECTORIZE_MIN_JOBS = 1024
+
+
+def _alternation(keywords: List[str]) -> str:
+    """Regex matching any of the keywords literally"""
+    return '|'.join(map(re.escape, dict.fromkeys(keywords)))
+
+
+def _string_column(jobs: List[Dict], key: str) -> 'pd.Series':
+    """String column of a job field (missing fields become '', non-strings NA)"""
+    values = [job.get(key, '') for job in jobs]
+    values = [value if isinstance(value, str) else None for value in values]
+    return pd.Series(values, dtype='string[pyarrow]' if HAS_PYARROW else object)
+
+
+def _contains_any(column: 'pd.Series', keywords: List[str]) -> 'pd.Series':
+    """Boolean Series, True where the column contains any of the keywords"""
+    found = pd.Series(False, index=column.index)
+    for keyword in dict.fromkeys(keywords):
+        found |= column.str.contains(keyword, regex=False, na=False).astype(bool)
+    return found
+
+
+class _KeywordMatcher:
+    """
+    Match any of a fixed set of substrings with a single scan of the text.
+    
+    Built once per keyword list; uses an Aho-Corasick automaton when
+    pyahocorasick is installed, otherwise an escaped regex alternation.
+    """
+    
+    def __init__(self, keywords: List[str]):
+        """
+        Initialize the matcher.
+        
+        Args:
+            keywords: Substrings to look for (matched case-sensitively)
+        """
+        keywords = list(dict.fromkeys(keywords))
+        # An empty keyword is a substring of everything
+        self._always = '' in keywords
+        keywords = [k for k in keywords if k]
+        
+        self._automaton = None
+        self._pattern = None
+        if not keywords or self._always:
+            return
+        
+        if HAS_AHOCORASICK:
+            self._automaton = ahocorasick.Automaton()
+            for keyword in keywords:
+                self._automaton.add_word(keyword, keyword)
+            self._automaton.make_automaton()
+        else:
+            self._pattern = re.compile(_alternation(keywords))
+    
+    def search(self, text: str) -> bool:
+        """Return True if any keyword occurs in the text"""
+        if self._always:
+            return True
+        if self._automaton is not None:
+            return next(self._automaton.iter(text), None) is not None
+        if self._pattern is not None:
+            return self._pattern.search(text) is not None
+        return False
+
+
+_REMOTE_KEYWORDS = _KeywordMatcher([
+    'remote', 'work from home', 'wfh', 'telecommute',
+    'distributed', 'anywhere', 'virtual', 'home-based'
+])
+
+
+# Experience level keywords, checked in order entry > senior > mid
+_ENTRY_KEYWORDS = frozenset([
+    'junior', 'trainee', 'intern', 'entry', 'graduate', 'fresher',
+    'associate', 'beginner', 'apprentice', '0-1 year', '0-2 year',
+    'new grad', 'recent graduate', 'jr.', 'jr '
+])
+_SENIOR_KEYWORDS = frozenset([
+    'senior', 'sr.', 'sr ', 'lead', 'principal', 'architect', 'manager',
+    'head', 'director', 'chief', 'expert', '5+ year', '7+ year',
+    'team lead', 'tech lead', 'technical lead', 'staff'
+])
+_MID_KEYWORDS = frozenset([
+    'mid', 'intermediate', 'regular', '2-5 year', '3-6 year',
+    'experienced', 'specialist', 'developer ii', 'engineer ii'
+])
+_LEVEL_KEYWORDS = (
+    ('entry', _ENTRY_KEYWORDS),
+    ('senior', _SENIOR_KEYWORDS),
+    ('mid', _MID_KEYWORDS),
+)
+_LEVEL_RANK = {level: rank for rank, (level, _) in enumerate(_LEVEL_KEYWORDS)}
+_LEVEL_MATCHERS = tuple((level, _KeywordMatcher(sorted(keywords)))
+                        for level, keywords in _LEVEL_KEYWORDS)
+
+# With pyahocorasick, one automaton over every level's keywords finds all of
+# them in a single scan of the title instead of one scan per level
+_LEVEL_AUTOMATON = None
+if HAS_AHOCORASICK:
+    _LEVEL_AUTOMATON = ahocorasick.Automaton()
+    for _level, _keywords in reversed(_LEVEL_KEYWORDS):
+        for _keyword in _keywords:
+            # Higher-precedence levels are added last, so they win shared keywords
+            _LEVEL_AUTOMATON.add_word(_keyword, _level)
+    _LEVEL_AUTOMATON.make_automaton()
+
+
+@functools.lru_cache(maxsize=4096)
+def _detect_level(title_lower: str) -> str:
+    """Experience level for a lowercased title (titles repeat a lot, so cached)"""
+    if _LEVEL_AUTOMATON is not None:
+        best = None
+        for _, level in _LEVEL_AUTOMATON.iter(title_lower):
+            if level == 'entry':
+                return level
+            if best is None or _LEVEL_RANK[level] < _LEVEL_RANK[best]:
+                best = level
+        return best or 'mid'
+    
+    for level, matcher in _LEVEL_MATCHERS:
+        if matcher.search(title_lower):
+            return level
+    
+    # Default to mid if no clear indicators
+    return 'mid'
+
+
+# Drops '$' and ',' and expands 'k'/'K' to '000' in one pass over the string
+_SALARY_TRANSLATION = str.maketrans({'$': None, ',': None, 'k': '000', 'K': '000'})
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_salary(salary_str: str) -> Optional[int]:
+    """First number in a salary string (salary strings repeat a lot, so cached)"""
+    number = _NUMBER_RE.search(salary_str.translate(_SALARY_TRANSLATION))
+    # Take the first number (often the minimum or average)
+    return int(number.group()) if number else None
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_absolute_date(date_str: str) -> Optional[datetime]:
+    """Parse a cleaned (stripped, lowercased) absolute posting date, or None"""
+    # Try the absolute formats job boards use, skipping those whose
+    # length range rules the string out
+    length = len(date_str)
+    for fmt, min_length, max_length in _DATE_FORMATS:
+        if min_length <= length <= max_length:
+            try:
+                return datetime.strptime(date_str, fmt)
+            except ValueError:
+                continue
+    
+    # dateutil handles anything else, but is much slower; opt in with USE_DATEUTIL=1
+    if HAS_DATEUTIL and USE_DATEUTIL:
+        try:
+            return dateutil.parser.parse(date_str)
+        except (ValueError, OverflowError):
+            pass
+    
+    return None
+
+
+class JobColumns:
+    """
+    Column view of a batch of jobs, shared by the filters of a FilterPipeline.
+    
+    Lowercased fields are built once per batch, on first use, and only for
+    the jobs still kept at that point, so later filters reuse them instead
+    of lowercasing the same strings again.
+    """
+    
+    def __init__(self, jobs: List[Dict], keep: Optional[List[bool]] = None):
+        """
+        Initialize the column view.
+        
+        Args:
+            jobs: List of job dictionaries
+            keep: Per-job flags, cleared by filters as jobs are rejected
+                (None = all jobs kept)
+        """
+        self.jobs = jobs
+        self.keep = keep if keep is not None else [True] * len(jobs)
+        self._lowered = {}
+        self._series = {}
+    
+    def lower(self, key: str) -> List[Optional[str]]:
+        """Lowercased values of a job field (None for jobs already rejected)"""
+        column = self._lowered.get(key)
+        if column is None:
+            column = [job.get(key, '').lower() if kept else None
+                      for job, kept in zip(self.jobs, self.keep)]
+            self._lowered[key] = column
+        return column
+    
+    def series(self, key: str, lowered: bool = False) -> 'pd.Series':
+        """
+        String column of a job field for the filters' pandas masks.
+        
+        Covers every job regardless of keep, and is built once per batch,
+        so masks evaluated one after another share the extracted columns.
+        
+        Args:
+            key: Job field
+            lowered: Return the lowercased column
+        """
+        column = self._series.get((key, lowered))
+        if column is None:
+            column = self.series(key).str.lower() if lowered else _string_column(self.jobs, key)
+            self._series[(key, lowered)] = column
+        return column
+
 
 class JobFilter(ABC):
     """Abstract base class for job filters"""
@@ -36,6 +337,38 @@ class JobFilter(ABC):
         """
         pass
     
+    def matches(self, job: Dict) -> bool:
+        """
+        Check a single job.
+        
+        Filters that can only judge a job against the rest of the list
+        (e.g. DuplicateRemover) don't implement this.
+        """
+        raise NotImplementedError
+    
+    def filter_columns(self, columns: JobColumns):
+        """
+        Clear columns.keep for every kept job this filter rejects.
+        
+        The default checks each kept job with matches(); filters override
+        it to read the shared lowercased columns instead.
+        
+        Args:
+            columns: Column view of the batch being filtered
+        """
+        keep = columns.keep
+        for index, job in enumerate(columns.jobs):
+            if keep[index] and not self.matches(job):
+                keep[index] = False
+    
+    def _record_counts(self, original_count: int, final_count: int):
+        """Update the standard stats counters after a filter_columns() run"""
+        stats = getattr(self, '_stats', None)
+        if stats is not None:
+            stats.update(original_count=original_count,
+                         filtered_out=original_count - final_count,
+                         final_count=final_count)
+    
     def get_stats(self) -> Dict:
         """Get filtering statistics"""
         return getattr(self, '_stats', {})
@@ -53,147 +386,333 @@ class MainJobFilter(JobFilter):
         """
         super().__init__()
         self.config = filter_config or {}
+        # Sub-filters built from a snapshot of the config; rebuilt when it changes
+        self._stages = None
+        self._stages_config = None
+        self._get_stages()
         self._stats = {
             'original_count': 0,
-            'after_experience_filter': 0,
+            'after_date_filter': 0,
+            'after_salary_filter': 0,
             'after_company_filter': 0,
             'after_location_filter': 0,
+            'after_experience_filter': 0,
             'after_keyword_filter': 0,
-            'after_date_filter': 0,
-            'after_salary_filter': 0,
             'final_count': 0
         }
     
-    def filter(self, jobs: List[Dict]) -> List[Dict]:
-        """Apply all configured filters"""
-        self._stats['original_count'] = len(jobs)
-        filtered_jobs = jobs
+    def _build_filters(self) -> List[tuple]:
+        """
+        Create the configured sub-filters in the order they are applied.
         
-        # Apply experience level filter
-        if self.config.get('experience_levels'):
-            experience_filter = ExperienceFilter(self.config['experience_levels'])
-            filtered_jobs = experience_filter.filter(filtered_jobs)
-            self._stats['after_experience_filter'] = len(filtered_jobs)
+        Cheap per-job checks come first so the description scan in the
+        keyword filter only sees the jobs that survive them. Jobs dropped
+        before the experience filter are not given an experience_level.
         
-        # Apply company filter
-        if self.config.get('include_companies') or self.config.get('exclude_companies'):
-            company_filter = CompanyFilter(
-                include_companies=self.config.get('include_companies'),
-                exclude_companies=self.config.get('exclude_companies')
-            )
-            filtered_jobs = company_filter.filter(filtered_jobs)
-            self._stats['after_company_filter'] = len(filtered_jobs)
-        
-        # Apply keyword filter
-        if self.config.get('keywords') or self.config.get('exclude_keywords'):
-            keyword_filter = KeywordFilter(
-                required_keywords=self.config.get('keywords', []),
-                excluded_keywords=self.config.get('exclude_keywords', [])
-            )
-            filtered_jobs = keyword_filter.filter(filtered_jobs)
-            self._stats['after_keyword_filter'] = len(filtered_jobs)
+        Returns:
+            List of (stats key or None, filter) tuples
+        """
+        filters = []
         
         # Apply date filter
         if self.config.get('max_age_days'):
-            date_filter = DateFilter(max_age_hours=self.config['max_age_days'] * 24)
-            filtered_jobs = date_filter.filter(filtered_jobs)
-            self._stats['after_date_filter'] = len(filtered_jobs)
+            filters.append(('after_date_filter',
+                            DateFilter(max_age_hours=self.config['max_age_days'] * 24)))
         
         # Apply salary filter
         if self.config.get('min_salary') or self.config.get('max_salary'):
-            salary_filter = SalaryFilter(
+            filters.append(('after_salary_filter', SalaryFilter(
                 min_salary=self.config.get('min_salary'),
                 max_salary=self.config.get('max_salary')
-            )
-            filtered_jobs = salary_filter.filter(filtered_jobs)
-            self._stats['after_salary_filter'] = len(filtered_jobs)
+            )))
         
         # Apply remote/full-time filters
         if self.config.get('remote_only') or self.config.get('full_time_only'):
-            job_type_filter = JobTypeFilter(
+            filters.append((None, JobTypeFilter(
                 remote_only=self.config.get('remote_only', False),
                 full_time_only=self.config.get('full_time_only', False)
-            )
-            filtered_jobs = job_type_filter.filter(filtered_jobs)
+            )))
+        
+        # Apply company filter
+        if self.config.get('include_companies') or self.config.get('exclude_companies'):
+            filters.append(('after_company_filter', CompanyFilter(
+                include_companies=self.config.get('include_companies'),
+                exclude_companies=self.config.get('exclude_companies')
+            )))
+        
+        # Apply experience level filter
+        if self.config.get('experience_levels'):
+            filters.append(('after_experience_filter',
+                            ExperienceFilter(self.config['experience_levels'])))
+        
+        # Apply keyword filter
+        if self.config.get('keywords') or self.config.get('exclude_keywords'):
+            filters.append(('after_keyword_filter', KeywordFilter(
+                required_keywords=self.config.get('keywords', []),
+                excluded_keywords=self.config.get('exclude_keywords', [])
+            )))
+        
+        return filters
+    
+    def _get_stages(self) -> List[tuple]:
+        """
+        Sub-filters for the current config, built once and reused.
+        
+        Keyword matchers are compiled when the sub-filters are built, so
+        rebuilding them on every call would repeat that work. The config is
+        compared against a deep copy, so in-place edits are still picked up.
+        """
+        if self._stages is None or self._stages_config != self.config:
+            self._stages = self._build_filters()
+            self._stages_config = copy.deepcopy(self.config)
+        return self._stages
+    
+    def filter(self, jobs: List[Dict]) -> List[Dict]:
+        """Apply all configured filters"""
+        self._stats['original_count'] = len(jobs)
+        vectorized = HAS_PANDAS and HAS_PYARROW and len(jobs) >= VECTORIZE_MIN_JOBS
+        filtered_jobs = jobs
+        
+        stages = self._get_stages()
+        
+        if vectorized:
+            # Column-wise string operations instead of a per-job loop. Masks of
+            # consecutive stages are ANDed and the surviving jobs are only
+            # materialized before a stage without a mask (and at the end)
+            keep = None
+            columns = None  # columns of filtered_jobs, shared by consecutive masks
+            for stats_key, job_filter in stages:
+                if hasattr(job_filter, 'mask'):
+                    if columns is None:
+                        columns = JobColumns(filtered_jobs)
+                    stage_keep = job_filter.mask(columns).to_numpy(dtype=bool)
+                    keep = stage_keep if keep is None else keep & stage_keep
+                    count = int(keep.sum())
+                else:
+                    if keep is not None:
+                        filtered_jobs = list(compress(filtered_jobs, keep))
+                        keep = None
+                    columns = None
+                    filtered_jobs = job_filter.filter(filtered_jobs)
+                    count = len(filtered_jobs)
+                if stats_key:
+                    self._stats[stats_key] = count
+            if keep is not None:
+                filtered_jobs = list(compress(filtered_jobs, keep))
+        elif stages:
+            filtered_jobs = self._filter_single_pass(jobs, stages)
         
         self._stats['final_count'] = len(filtered_jobs)
         
-        self.logger.info(f"Main filter: {self._stats['original_count']} → {self._stats['final_count']} jobs")
+        self.logger.info("Main filter: %d → %d jobs",
+                         self._stats['original_count'], self._stats['final_count'])
         return filtered_jobs
     
-    def filter_jobs(self, jobs: List[Dict], filter_config: Dict[str, Any]) -> List[Dict]:
+    def _filter_single_pass(self, jobs: List[Dict], stages: List[tuple]) -> List[Dict]:
+        """
+        Run every job through all stages in one loop, stopping at the first
+        stage that rejects it, instead of building a list per stage.
+        
+        Args:
+            jobs: List of job dictionaries
+            stages: (stats key or None, filter) tuples from _build_filters()
+            
+        Returns:
+            Jobs that passed every stage
+        """
+        now = datetime.now()
+        predicates = [functools.partial(job_filter.matches, now=now) if isinstance(job_filter, DateFilter)
+                      else job_filter.matches for _, job_filter in stages]
+        rejected = [0] * len(stages)  # jobs dropped by each stage
+        filtered_jobs = []
+        
+        if len(predicates) == 1:
+            predicate = predicates[0]
+            filtered_jobs = [job for job in jobs if predicate(job)]
+            rejected[0] = len(jobs) - len(filtered_jobs)
+        else:
+            # Only rejections are counted, so a job that passes every stage
+            # costs one predicate call per stage and nothing else
+            for job in jobs:
+                for index, predicate in enumerate(predicates):
+                    if not predicate(job):
+                        rejected[index] += 1
+                        break
+                else:
+                    filtered_jobs.append(job)
+        
+        passed = len(jobs)
+        for (stats_key, _), count in zip(stages, rejected):
+            passed -= count
+            if stats_key:
+                self._stats[stats_key] = passed
+        
+        return filtered_jobs
+    
+    def filter_jobs(self, jobs: List[Dict],
+                    filter_config: Optional[Dict[str, Any]] = None) -> List[Dict]:
         """
         Filter jobs based on configuration (for backward compatibility).
         
         Args:
             jobs: List of job dictionaries
-            filter_config: Filter configuration
+            filter_config: Filter configuration replacing the current one;
+                the sub-filters are only rebuilt if it differs
             
         Returns:
             Filtered list of job dictionaries
         """
-        self.config = filter_config
+        if filter_config is not None:
+            self.config = filter_config
         return self.filter(jobs)
 
 
+@functools.lru_cache(maxsize=16384)
+def _normalize(text: str) -> str:
+    """Normalized form of a title/company/location (these repeat a lot, so cached)"""
+    if not text or text == 'N/A':
+        return ""
+    
+    # Convert to lowercase and remove extra whitespace
+    text = ' '.join(text.lower().split())
+    
+    # Remove common variations
+    if text.isascii():
+        text = text.translate(_ASCII_PUNCTUATION_TABLE)  # Remove punctuation in one pass
+    else:
+        text = _PUNCTUATION_RE.sub('', text)
+    text = _COMPANY_SUFFIX_RE.sub('', text)  # Remove company suffixes
+    
+    return text
+
+
+@functools.lru_cache(maxsize=16384)
+def _word_set(title: str, company: str) -> FrozenSet[str]:
+    """Words of the normalized title and company, used for job similarity"""
+    return frozenset(f"{_normalize(title)} {_normalize(company)}".split())
+
+
+# Postings key for jobs whose word set is empty (real word ids are >= 0)
+_EMPTY_WORD_SET = -1
+
+# Number of MinHash permutations used when DuplicateRemover runs with use_lsh
+LSH_NUM_PERM = 128
+
+# DuplicateRemover only shards across processes above this many jobs;
+# below it process start-up and pickling cost more than they save
+PARALLEL_MIN_JOBS = 10_000
+
+
+def _dedupe_shard(jobs: List[Dict], similarity_threshold: float, use_lsh: bool) -> List[int]:
+    """Worker for DuplicateRemover: positions of the jobs kept within one shard"""
+    kept = DuplicateRemover(similarity_threshold, use_lsh=use_lsh)._dedupe(jobs)
+    kept_ids = {id(job) for job in kept}
+    return [position for position, job in enumerate(jobs) if id(job) in kept_ids]
+
+
 class DuplicateRemover(JobFilter):
     """Remove duplicate job postings"""
     
-    def __init__(self, similarity_threshold: float = 0.9):
+    def __init__(self, similarity_threshold: float = 0.9, use_lsh: bool = False,
+                 workers: int = 1):
         """
         Initialize duplicate remover.
         
         Args:
             similarity_threshold: Threshold for considering jobs as duplicates (0.0-1.0)
+            use_lsh: Find candidate duplicates with MinHash-LSH (requires datasketch).
+                Bounds the work per job on large batches, but may miss a few
+                near-duplicates; candidates are still checked with exact Jaccard
+            workers: Processes to shard batches over PARALLEL_MIN_JOBS jobs.
+                Sharding can drop a job that the sequential pass would keep
+                (when the job it resembled was itself removed in another shard)
         """
         super().__init__()
         self.similarity_threshold = similarity_threshold
+        self.use_lsh = use_lsh
+        self.workers = max(1, workers)
+        if use_lsh and not HAS_DATASKETCH:
+            self.logger.warning("datasketch not available - using exact candidate search")
         self._stats = {'original_count': 0, 'duplicates_removed': 0, 'final_count': 0}
     
     def _normalize_text(self, text: str) -> str:
         """Normalize text for comparison"""
-        if not text or text == 'N/A':
-            return ""
-        
-        # Convert to lowercase and remove extra whitespace
-        text = re.sub(r'\s+', ' ', text.lower().strip())
-        
-        # Remove common variations
-        text = re.sub(r'[^\w\s]', '', text)  # Remove punctuation
-        text = re.sub(r'\b(inc|corp|ltd|llc|co)\b', '', text)  # Remove company suffixes
-        
-        return text
+        return _normalize(text)
     
-    def _create_job_signature(self, job: Dict) -> str:
+    def _create_job_signature(self, job: Dict) -> int:
         """Create a unique signature for a job"""
         title = self._normalize_text(job.get('title', ''))
         company = self._normalize_text(job.get('company', ''))
         location = self._normalize_text(job.get('location', ''))
         
-        # Create a hash of the normalized fields
-        signature_text = f"{title}|{company}|{location}"
-        return hashlib.md5(signature_text.encode()).hexdigest()
+        # Only used as an in-process set key, so the built-in 64-bit hash is
+        # enough (string hashes are salted per process - don't persist it)
+        return hash((title, company, location))
     
-    def _calculate_similarity(self, job1: Dict, job2: Dict) -> float:
-        """Calculate similarity between two jobs"""
-        # Simple Jaccard similarity based on word sets
-        def get_words(job: Dict) -> Set[str]:
-            title = self._normalize_text(job.get('title', ''))
-            company = self._normalize_text(job.get('company', ''))
-            return set(f"{title} {company}".split())
-        
-        words1 = get_words(job1)
-        words2 = get_words(job2)
-        
+    def _job_tokens(self, job: Dict) -> FrozenSet[str]:
+        """Get the word set used for similarity (normalized title and company)"""
+        # Cached per (title, company), so comparing a job again is a lookup
+        return _word_set(job.get('title', ''), job.get('company', ''))
+    
+    @staticmethod
+    def _jaccard(words1: FrozenSet[str], words2: FrozenSet[str]) -> float:
+        """Jaccard similarity of two word sets"""
         if not words1 and not words2:
             return 1.0
         if not words1 or not words2:
             return 0.0
         
-        intersection = len(words1.intersection(words2))
-        union = len(words1.union(words2))
+        # |A ∪ B| = |A| + |B| - |A ∩ B|, so no union set is built
+        intersection = len(words1 & words2)
+        return intersection / (len(words1) + len(words2) - intersection)
+    
+    def _calculate_similarity(self, job1: Dict, job2: Dict) -> float:
+        """Calculate similarity between two jobs"""
+        # Simple Jaccard similarity based on word sets
+        return self._jaccard(self._job_tokens(job1), self._job_tokens(job2))
+    
+    def _minhash(self, tokens: FrozenSet[str]) -> 'MinHash':
+        """MinHash signature of a job's word set"""
+        minhash = MinHash(num_perm=LSH_NUM_PERM, seed=0)
+        for token in tokens:
+            minhash.update(token.encode('utf-8'))
+        return minhash
+    
+    def _is_near_duplicate(self, word_ids: List[int], bits: int, kept_bits: List[int],
+                           postings: Dict[int, List[int]],
+                           lsh_candidates: Optional[List[str]] = None) -> bool:
+        """
+        Check a job's word bitset against the jobs kept so far.
         
-        return intersection / union if union > 0 else 0.0
+        Only kept jobs sharing at least one word (found through the
+        inverted index) can reach a positive similarity, so only those
+        are compared. With LSH, the candidates are the kept jobs whose
+        MinHash collided with this one instead.
+        """
+        if not kept_bits:
+            return False
+        if self.similarity_threshold <= 0:
+            # Every pair reaches a zero threshold
+            return True
+        if not bits:
+            # Two empty word sets are identical; empty vs non-empty scores 0
+            return self.similarity_threshold <= 1.0 and _EMPTY_WORD_SET in postings
+        
+        if lsh_candidates is not None:
+            candidates = set(map(int, lsh_candidates))
+        else:
+            candidates = set()
+            for word_id in word_ids:
+                candidates.update(postings.get(word_id, ()))
+        
+        # Jaccard on bitsets: |A & B| / (|A| + |B| - |A & B|) from popcounts
+        size = len(word_ids)
+        for index in candidates:
+            other = kept_bits[index]
+            intersection = (bits & other).bit_count()
+            if intersection / (size + other.bit_count() - intersection) >= self.similarity_threshold:
+                return True
+        return False
     
     def filter(self, jobs: List[Dict]) -> List[Dict]:
         """Remove duplicate jobs"""
@@ -202,31 +721,97 @@ class DuplicateRemover(JobFilter):
         if not jobs:
             return jobs
         
+        if self.workers > 1 and len(jobs) > PARALLEL_MIN_JOBS:
+            unique_jobs = self._dedupe_sharded(jobs)
+        else:
+            unique_jobs = self._dedupe(jobs)
+        
+        self._stats['duplicates_removed'] = len(jobs) - len(unique_jobs)
+        self._stats['final_count'] = len(unique_jobs)
+        
+        self.logger.info("Removed %d duplicates from %d jobs",
+                         self._stats['duplicates_removed'], self._stats['original_count'])
+        
+        return unique_jobs
+    
+    def _dedupe_sharded(self, jobs: List[Dict]) -> List[Dict]:
+        """
+        Deduplicate shards in worker processes, then merge the survivors.
+        
+        Jobs are sharded by signature, so exact duplicates always meet in
+        one shard; near-duplicates that land in different shards are caught
+        by a final pass over the (much smaller) set of shard survivors.
+        """
+        shards = [[] for _ in range(self.workers)]
+        for index, job in enumerate(jobs):
+            shards[self._create_job_signature(job) % self.workers].append(index)
+        
+        # Workers only need the fields used for comparison
+        payloads = [[{key: jobs[index].get(key, '') for key in ('title', 'company', 'location')}
+                     for index in shard] for shard in shards]
+        
+        with ProcessPoolExecutor(max_workers=self.workers) as executor:
+            kept_positions = executor.map(_dedupe_shard, payloads,
+                                          [self.similarity_threshold] * self.workers,
+                                          [self.use_lsh] * self.workers)
+            survivors = sorted(shard[position]
+                               for shard, positions in zip(shards, kept_positions)
+                               for position in positions)
+        
+        return self._dedupe([jobs[index] for index in survivors])
+    
+    def _dedupe(self, jobs: List[Dict]) -> List[Dict]:
+        """Keep each job unless it matches one already kept (input order wins)"""
         unique_jobs = []
-        seen_signatures = set()
+        # Words are numbered as they are first seen and each job's word set
+        # becomes an int with one bit per word, so intersections are a
+        # bitwise AND and a popcount instead of a set operation
+        vocabulary: Dict[str, int] = {}
+        kept_bits = []  # word bitset of each kept job, by position in unique_jobs
+        postings = defaultdict(list)  # word id -> positions in unique_jobs
+        seen_signatures: Set[int] = set()
+        # Word sets of the kept jobs. A job with the same word set as a kept
+        # one scores 1.0 against it, so for thresholds up to 1 it is dropped
+        # by this set lookup without building its bitset or scanning postings
+        seen_word_sets: Set[FrozenSet[str]] = set()
+        exact_words_match = self.similarity_threshold <= 1
+        
+        # MinHash-LSH only works for thresholds in (0, 1]; the exact
+        # checks in _is_near_duplicate handle the other values
+        lsh = None
+        if self.use_lsh and HAS_DATASKETCH and 0 < self.similarity_threshold <= 1:
+            lsh = MinHashLSH(threshold=self.similarity_threshold, num_perm=LSH_NUM_PERM)
         
         for job in jobs:
             signature = self._create_job_signature(job)
+            if signature in seen_signatures:
+                continue
             
-            if signature not in seen_signatures:
-                # Check for similar jobs using similarity threshold
-                is_duplicate = False
-                
-                for existing_job in unique_jobs:
-                    similarity = self._calculate_similarity(job, existing_job)
-                    if similarity >= self.similarity_threshold:
-                        is_duplicate = True
-                        break
-                
-                if not is_duplicate:
-                    unique_jobs.append(job)
-                    seen_signatures.add(signature)
-        
-        self._stats['duplicates_removed'] = len(jobs) - len(unique_jobs)
-        self._stats['final_count'] = len(unique_jobs)
-        
-        self.logger.info(f"Removed {self._stats['duplicates_removed']} duplicates "
-                        f"from {self._stats['original_count']} jobs")
+            # Check for similar jobs using similarity threshold
+            tokens = self._job_tokens(job)
+            if exact_words_match and tokens in seen_word_sets:
+                continue
+            word_ids = [vocabulary.setdefault(token, len(vocabulary)) for token in tokens]
+            bits = 0
+            for word_id in word_ids:
+                bits |= 1 << word_id
+            
+            minhash = lsh_candidates = None
+            if lsh is not None and tokens:
+                minhash = self._minhash(tokens)
+                lsh_candidates = lsh.query(minhash)
+            if self._is_near_duplicate(word_ids, bits, kept_bits, postings, lsh_candidates):
+                continue
+            
+            position = len(unique_jobs)
+            if minhash is not None:
+                lsh.insert(str(position), minhash)
+            for word_id in word_ids or (_EMPTY_WORD_SET,):
+                postings[word_id].append(position)
+            unique_jobs.append(job)
+            kept_bits.append(bits)
+            seen_signatures.add(signature)
+            seen_word_sets.add(tokens)
         
         return unique_jobs
 
@@ -250,42 +835,20 @@ class ExperienceFilter(JobFilter):
         if not job_title:
             return 'mid'
             
-        title_lower = job_title.lower()
-        
-        # Entry level keywords
-        entry_keywords = [
-            'junior', 'trainee', 'intern', 'entry', 'graduate', 'fresher',
-            'associate', 'beginner', 'apprentice', '0-1 year', '0-2 year',
-            'new grad', 'recent graduate', 'jr.', 'jr '
-        ]
-        
-        # Senior level keywords
-        senior_keywords = [
-            'senior', 'sr.', 'sr ', 'lead', 'principal', 'architect', 'manager',
-            'head', 'director', 'chief', 'expert', '5+ year', '7+ year',
-            'team lead', 'tech lead', 'technical lead', 'staff', 'principal'
-        ]
-        
-        # Mid level keywords
-        mid_keywords = [
-            'mid', 'intermediate', 'regular', '2-5 year', '3-6 year',
-            'experienced', 'specialist', 'developer ii', 'engineer ii'
-        ]
-        
-        # Check for entry level
-        if any(keyword in title_lower for keyword in entry_keywords):
-            return 'entry'
-        
-        # Check for senior level
-        if any(keyword in title_lower for keyword in senior_keywords):
-            return 'senior'
-        
-        # Check for mid level
-        if any(keyword in title_lower for keyword in mid_keywords):
-            return 'mid'
+        return _detect_level(job_title.lower())
+    
+    def matches(self, job: Dict) -> bool:
+        """Check a single job (sets its experience_level if missing)"""
+        if not self.allowed_levels:
+            return True
+        
+        # Detect or use existing experience level
+        if 'experience_level' not in job:
+            job['experience_level'] = self._detect_experience_level(
+                job.get('title', ''), job.get('company', '')
+            )
         
-        # Default to mid if no clear indicators
-        return 'mid'
+        return job['experience_level'].lower() in self.allowed_levels
     
     def filter(self, jobs: List[Dict]) -> List[Dict]:
         """Filter jobs by experience level"""
@@ -294,23 +857,13 @@ class ExperienceFilter(JobFilter):
         if not self.allowed_levels:
             return jobs
         
-        filtered_jobs = []
-        
-        for job in jobs:
-            # Detect or use existing experience level
-            if 'experience_level' not in job:
-                job['experience_level'] = self._detect_experience_level(
-                    job.get('title', ''), job.get('company', '')
-                )
-            
-            if job['experience_level'].lower() in self.allowed_levels:
-                filtered_jobs.append(job)
+        filtered_jobs = [job for job in jobs if self.matches(job)]
         
         self._stats['filtered_out'] = len(jobs) - len(filtered_jobs)
         self._stats['final_count'] = len(filtered_jobs)
         
-        self.logger.info(f"Experience filter: kept {len(filtered_jobs)} jobs "
-                        f"(filtered out {self._stats['filtered_out']})")
+        self.logger.info("Experience filter: kept %d jobs (filtered out %d)",
+                         len(filtered_jobs), self._stats['filtered_out'])
         
         return filtered_jobs
 
@@ -330,8 +883,37 @@ class CompanyFilter(JobFilter):
         super().__init__()
         self.include_companies = [c.lower().strip() for c in include_companies] if include_companies else None
         self.exclude_companies = [c.lower().strip() for c in exclude_companies] if exclude_companies else []
+        self._include_matcher = _KeywordMatcher(self.include_companies or [])
+        self._exclude_matcher = _KeywordMatcher(self.exclude_companies)
         self._stats = {'original_count': 0, 'filtered_out': 0, 'final_count': 0}
     
+    def matches(self, job: Dict) -> bool:
+        """Check a single job against the company lists"""
+        return self._company_allowed(job.get('company', '').lower())
+    
+    def filter_columns(self, columns: JobColumns):
+        """Check the kept jobs using the shared lowercased company column"""
+        keep = columns.keep
+        for index, company_lower in enumerate(columns.lower('company')):
+            if keep[index] and not self._company_allowed(company_lower):
+                keep[index] = False
+    
+    def _company_allowed(self, company_lower: str) -> bool:
+        """Check a lowercased company name against the include/exclude lists"""
+        company_name = company_lower.strip()
+        
+        # Check exclude list first
+        if self.exclude_companies:
+            if self._exclude_matcher.search(company_name):
+                return False
+        
+        # Check include list
+        if self.include_companies:
+            if not self._include_matcher.search(company_name):
+                return False
+        
+        return True
+    
     def filter(self, jobs: List[Dict]) -> List[Dict]:
         """Filter jobs by company preferences"""
         self._stats['original_count'] = len(jobs)
@@ -339,30 +921,36 @@ class CompanyFilter(JobFilter):
         if not self.include_companies and not self.exclude_companies:
             return jobs
         
-        filtered_jobs = []
-        
-        for job in jobs:
-            company_name = job.get('company', '').lower().strip()
-            
-            # Check exclude list first
-            if self.exclude_companies:
-                if any(excluded in company_name for excluded in self.exclude_companies):
-                    continue
-            
-            # Check include list
-            if self.include_companies:
-                if not any(included in company_name for included in self.include_companies):
-                    continue
-            
-            filtered_jobs.append(job)
+        filtered_jobs = [job for job in jobs if self.matches(job)]
         
         self._stats['filtered_out'] = len(jobs) - len(filtered_jobs)
         self._stats['final_count'] = len(filtered_jobs)
         
-        self.logger.info(f"Company filter: kept {len(filtered_jobs)} jobs "
-                        f"(filtered out {self._stats['filtered_out']})")
+        self.logger.info("Company filter: kept %d jobs (filtered out %d)",
+                         len(filtered_jobs), self._stats['filtered_out'])
         
         return filtered_jobs
+    
+    def mask(self, jobs: Union[List[Dict], JobColumns]) -> 'pd.Series':
+        """
+        Column-wise equivalent of filter() (requires pandas).
+        
+        Args:
+            jobs: List of job dictionaries, or a JobColumns view of them
+            
+        Returns:
+            Boolean Series, True for jobs filter() would keep
+        """
+        columns = jobs if isinstance(jobs, JobColumns) else JobColumns(jobs)
+        company_name = columns.series('company', lowered=True).str.strip()
+        keep = pd.Series(True, index=company_name.index)
+        
+        if self.exclude_companies:
+            keep &= ~_contains_any(company_name, self.exclude_companies)
+        if self.include_companies:
+            keep &= _contains_any(company_name, self.include_companies)
+        
+        return keep
 
 
 class KeywordFilter(JobFilter):
@@ -379,8 +967,53 @@ class KeywordFilter(JobFilter):
         super().__init__()
         self.required_keywords = [k.lower().strip() for k in required_keywords] if required_keywords else []
         self.excluded_keywords = [k.lower().strip() for k in excluded_keywords] if excluded_keywords else []
+        self._required_matcher = _KeywordMatcher(self.required_keywords)
+        self._excluded_matcher = _KeywordMatcher(self.excluded_keywords)
         self._stats = {'original_count': 0, 'filtered_out': 0, 'final_count': 0}
     
+    def matches(self, job: Dict) -> bool:
+        """Check a single job's title and description against the keywords"""
+        return self._content_allowed(job.get('title', '').lower(), job)
+    
+    def filter_columns(self, columns: JobColumns):
+        """Check the kept jobs using the shared lowercased title column"""
+        keep = columns.keep
+        for index, (title, job) in enumerate(zip(columns.lower('title'), columns.jobs)):
+            if keep[index] and not self._content_allowed(title, job):
+                keep[index] = False
+    
+    def _content_allowed(self, title: str, job: Dict) -> bool:
+        """
+        Check a job against the keywords, deciding on the title alone when possible.
+        
+        The description is usually much longer than the title, so it is only
+        lowercased and scanned when the title can't settle the result.
+        
+        Args:
+            title: Lowercased job title
+            job: Job dictionary (for its description)
+        """
+        # An excluded keyword in the title rejects the job outright
+        if self.excluded_keywords and self._excluded_matcher.search(title):
+            return False
+        
+        content = None
+        
+        # Check required keywords (the title alone is enough for a hit)
+        if self.required_keywords and not self._required_matcher.search(title):
+            content = f"{title} {job.get('description', '').lower()}"
+            if not self._required_matcher.search(content):
+                return False
+        
+        # Check excluded keywords
+        if self.excluded_keywords:
+            if content is None:
+                content = f"{title} {job.get('description', '').lower()}"
+            if self._excluded_matcher.search(content):
+                return False
+        
+        return True
+    
     def filter(self, jobs: List[Dict]) -> List[Dict]:
         """Filter jobs by keywords"""
         self._stats['original_count'] = len(jobs)
@@ -388,32 +1021,37 @@ class KeywordFilter(JobFilter):
         if not self.required_keywords and not self.excluded_keywords:
             return jobs
         
-        filtered_jobs = []
-        
-        for job in jobs:
-            title = job.get('title', '').lower()
-            description = job.get('description', '').lower()
-            content = f"{title} {description}"
-            
-            # Check required keywords
-            if self.required_keywords:
-                if not any(keyword in content for keyword in self.required_keywords):
-                    continue
-            
-            # Check excluded keywords
-            if self.excluded_keywords:
-                if any(keyword in content for keyword in self.excluded_keywords):
-                    continue
-            
-            filtered_jobs.append(job)
+        filtered_jobs = [job for job in jobs if self.matches(job)]
         
         self._stats['filtered_out'] = len(jobs) - len(filtered_jobs)
         self._stats['final_count'] = len(filtered_jobs)
         
-        self.logger.info(f"Keyword filter: kept {len(filtered_jobs)} jobs "
-                        f"(filtered out {self._stats['filtered_out']})")
+        self.logger.info("Keyword filter: kept %d jobs (filtered out %d)",
+                         len(filtered_jobs), self._stats['filtered_out'])
         
         return filtered_jobs
+    
+    def mask(self, jobs: Union[List[Dict], JobColumns]) -> 'pd.Series':
+        """
+        Column-wise equivalent of filter() (requires pandas).
+        
+        Args:
+            jobs: List of job dictionaries, or a JobColumns view of them
+            
+        Returns:
+            Boolean Series, True for jobs filter() would keep
+        """
+        columns = jobs if isinstance(jobs, JobColumns) else JobColumns(jobs)
+        content = columns.series('title', lowered=True).str.cat(
+            columns.series('description', lowered=True), sep=' ')
+        keep = pd.Series(True, index=content.index)
+        
+        if self.required_keywords:
+            keep &= _contains_any(content, self.required_keywords)
+        if self.excluded_keywords:
+            keep &= ~_contains_any(content, self.excluded_keywords)
+        
+        return keep
 
 
 class SalaryFilter(JobFilter):
@@ -437,16 +1075,23 @@ class SalaryFilter(JobFilter):
         if not salary_str or salary_str == 'N/A':
             return None
         
-        # Remove common prefixes and suffixes
-        salary_str = salary_str.replace('$', '').replace(',', '').replace('k', '000').replace('K', '000')
+        return _parse_salary(salary_str)
+    
+    def matches(self, job: Dict) -> bool:
+        """Check a single job's salary against the range"""
+        salary_num = self._extract_salary_numbers(job.get('salary', ''))
+        
+        # If no salary info, include the job (better to be inclusive)
+        if salary_num is None:
+            return True
         
-        # Extract numbers
-        numbers = re.findall(r'\d+', salary_str)
-        if numbers:
-            # Take the first number (often the minimum or average)
-            return int(numbers[0])
+        # Check salary range
+        if self.min_salary and salary_num < self.min_salary:
+            return False
+        if self.max_salary and salary_num > self.max_salary:
+            return False
         
-        return None
+        return True
     
     def filter(self, jobs: List[Dict]) -> List[Dict]:
         """Filter jobs by salary range"""
@@ -455,32 +1100,41 @@ class SalaryFilter(JobFilter):
         if not self.min_salary and not self.max_salary:
             return jobs
         
-        filtered_jobs = []
-        
-        for job in jobs:
-            salary_str = job.get('salary', '')
-            salary_num = self._extract_salary_numbers(salary_str)
-            
-            # If no salary info, include the job (better to be inclusive)
-            if salary_num is None:
-                filtered_jobs.append(job)
-                continue
-            
-            # Check salary range
-            if self.min_salary and salary_num < self.min_salary:
-                continue
-            if self.max_salary and salary_num > self.max_salary:
-                continue
-            
-            filtered_jobs.append(job)
+        filtered_jobs = [job for job in jobs if self.matches(job)]
         
         self._stats['filtered_out'] = len(jobs) - len(filtered_jobs)
         self._stats['final_count'] = len(filtered_jobs)
         
-        self.logger.info(f"Salary filter: kept {len(filtered_jobs)} jobs "
-                        f"(filtered out {self._stats['filtered_out']})")
+        self.logger.info("Salary filter: kept %d jobs (filtered out %d)",
+                         len(filtered_jobs), self._stats['filtered_out'])
         
         return filtered_jobs
+    
+    def mask(self, jobs: Union[List[Dict], JobColumns]) -> 'pd.Series':
+        """
+        Column-wise equivalent of filter() (requires pandas).
+        
+        Args:
+            jobs: List of job dictionaries, or a JobColumns view of them
+            
+        Returns:
+            Boolean Series, True for jobs filter() would keep
+        """
+        columns = jobs if isinstance(jobs, JobColumns) else JobColumns(jobs)
+        salary = columns.series('salary').str.translate(_SALARY_TRANSLATION)
+        # extract() stops at the first number, like _parse_salary()
+        salary_num = pd.to_numeric(salary.str.extract(f'({_NUMBER_RE.pattern})', expand=False),
+                                   errors='coerce')
+        
+        # Jobs without salary info are kept, as in filter()
+        keep = salary_num.isna().to_numpy()
+        in_range = ~keep
+        if self.min_salary:
+            in_range &= (salary_num >= self.min_salary).fillna(False).to_numpy(dtype=bool)
+        if self.max_salary:
+            in_range &= (salary_num <= self.max_salary).fillna(False).to_numpy(dtype=bool)
+        
+        return pd.Series(keep | in_range)
 
 
 class JobTypeFilter(JobFilter):
@@ -499,6 +1153,38 @@ class JobTypeFilter(JobFilter):
         self.full_time_only = full_time_only
         self._stats = {'original_count': 0, 'filtered_out': 0, 'final_count': 0}
     
+    def matches(self, job: Dict) -> bool:
+        """Check a single job's remote/full-time status"""
+        # Only lowercase the fields the enabled checks read
+        return self._type_allowed(job.get('location', '').lower() if self.remote_only else '',
+                                  job.get('job_type', '').lower(),
+                                  job.get('title', '').lower() if self.full_time_only else '')
+    
+    def filter_columns(self, columns: JobColumns):
+        """Check the kept jobs using the shared lowercased columns"""
+        keep = columns.keep
+        locations = columns.lower('location') if self.remote_only else repeat('')
+        titles = columns.lower('title') if self.full_time_only else repeat('')
+        for index, fields in enumerate(zip(locations, columns.lower('job_type'), titles)):
+            if keep[index] and not self._type_allowed(*fields):
+                keep[index] = False
+    
+    def _type_allowed(self, location: str, job_type: str, title: str) -> bool:
+        """Check lowercased location, job type and title against the requirements"""
+        # Check remote requirement
+        if self.remote_only:
+            if 'remote' not in location and 'remote' not in job_type:
+                return False
+        
+        # Check full-time requirement
+        if self.full_time_only:
+            if 'full' not in job_type and 'full-time' not in title:
+                # If no job type info, assume it's full-time
+                if job_type and 'part' in job_type:
+                    return False
+        
+        return True
+    
     def filter(self, jobs: List[Dict]) -> List[Dict]:
         """Filter jobs by type"""
         self._stats['original_count'] = len(jobs)
@@ -506,34 +1192,41 @@ class JobTypeFilter(JobFilter):
         if not self.remote_only and not self.full_time_only:
             return jobs
         
-        filtered_jobs = []
-        
-        for job in jobs:
-            location = job.get('location', '').lower()
-            job_type = job.get('job_type', '').lower()
-            title = job.get('title', '').lower()
-            
-            # Check remote requirement
-            if self.remote_only:
-                if 'remote' not in location and 'remote' not in job_type:
-                    continue
-            
-            # Check full-time requirement
-            if self.full_time_only:
-                if 'full' not in job_type and 'full-time' not in title:
-                    # If no job type info, assume it's full-time
-                    if job_type and 'part' in job_type:
-                        continue
-            
-            filtered_jobs.append(job)
+        filtered_jobs = [job for job in jobs if self.matches(job)]
         
         self._stats['filtered_out'] = len(jobs) - len(filtered_jobs)
         self._stats['final_count'] = len(filtered_jobs)
         
-        self.logger.info(f"Job type filter: kept {len(filtered_jobs)} jobs "
-                        f"(filtered out {self._stats['filtered_out']})")
+        self.logger.info("Job type filter: kept %d jobs (filtered out %d)",
+                         len(filtered_jobs), self._stats['filtered_out'])
         
         return filtered_jobs
+    
+    def mask(self, jobs: Union[List[Dict], JobColumns]) -> 'pd.Series':
+        """
+        Column-wise equivalent of filter() (requires pandas).
+        
+        Args:
+            jobs: List of job dictionaries, or a JobColumns view of them
+            
+        Returns:
+            Boolean Series, True for jobs filter() would keep
+        """
+        columns = jobs if isinstance(jobs, JobColumns) else JobColumns(jobs)
+        job_type = columns.series('job_type', lowered=True)
+        keep = pd.Series(True, index=job_type.index)
+        
+        if self.remote_only:
+            keep &= (_contains_any(columns.series('location', lowered=True), ['remote'])
+                     | _contains_any(job_type, ['remote']))
+        if self.full_time_only:
+            # Only jobs explicitly marked part-time (and not full-time) are dropped
+            part_time = (_contains_any(job_type, ['part'])
+                         & ~_contains_any(job_type, ['full'])
+                         & ~_contains_any(columns.series('title', lowered=True), ['full-time']))
+            keep &= ~part_time
+        
+        return keep
 
 
 class DateFilter(JobFilter):
@@ -549,34 +1242,53 @@ class DateFilter(JobFilter):
         super().__init__()
         self.max_age_hours = max_age_hours
         self._stats = {'original_count': 0, 'filtered_out': 0, 'final_count': 0}
+        # (reference time, oldest posted_ts kept), reused while callers pass the same now
+        self._cutoff = (None, None)
     
-    def _parse_posting_date(self, date_str: str) -> Optional[datetime]:
-        """Parse various date formats and return datetime object"""
+    def _cutoff_ts(self, now: datetime) -> float:
+        """Oldest posted_ts within max_age_hours of now, computed once per reference time"""
+        cutoff_now, cutoff_ts = self._cutoff
+        if cutoff_now is not now:
+            cutoff_ts = now.timestamp() - self.max_age_hours * 3600
+            self._cutoff = (now, cutoff_ts)
+        return cutoff_ts
+    
+    def _parse_posting_date(self, date_str: str, now: Optional[datetime] = None) -> Optional[datetime]:
+        """
+        Parse various date formats and return datetime object.
+        
+        Args:
+            date_str: Posting date as scraped
+            now: Reference time for relative dates (defaults to the current time)
+        """
         if not date_str or date_str == 'N/A':
             return None
         
         # Clean the date string
         date_str = date_str.strip().lower()
-        now = datetime.now()
-        
-        # Handle relative dates (e.g., "2 days ago", "1 hour ago")
+        if now is None:
+            now = datetime.now()
+        
+        # Fast path: exact literals and "N units ago" with dict lookups on
+        # the split words, no regex
+        delta = _LITERAL_DATE_DELTAS.get(date_str)
+        if delta is not None:
+            return now - delta
+        words = date_str.split()
+        if len(words) == 3 and words[2] == 'ago' and words[0].isdecimal():
+            to_delta = _RELATIVE_UNIT_DELTAS.get(words[1])
+            if to_delta is not None:
+                return now - to_delta(int(words[0]))
+        
+        # Handle other relative dates (e.g., "Posted 2 days ago", "30+ days ago"):
+        # the first unit named, in _UNIT_TO_DELTA order, with the first number
         if 'ago' in date_str:
-            if 'hour' in date_str:
-                hours = re.search(r'(\d+)', date_str)
-                if hours:
-                    return now - timedelta(hours=int(hours.group(1)))
-            elif 'day' in date_str:
-                days = re.search(r'(\d+)', date_str)
-                if days:
-                    return now - timedelta(days=int(days.group(1)))
-            elif 'week' in date_str:
-                weeks = re.search(r'(\d+)', date_str)
-                if weeks:
-                    return now - timedelta(weeks=int(weeks.group(1)))
-            elif 'month' in date_str:
-                months = re.search(r'(\d+)', date_str)
-                if months:
-                    return now - timedelta(days=int(months.group(1)) * 30)
+            number = _NUMBER_RE.search(date_str)
+            for unit, to_delta in _UNIT_TO_DELTA.items():
+                if unit in date_str:
+                    if number:
+                        return now - to_delta(int(number.group()))
+                    break
         
         # Handle "today" and "yesterday"
         if 'today' in date_str:
@@ -584,55 +1296,92 @@ class DateFilter(JobFilter):
         elif 'yesterday' in date_str:
             return now - timedelta(days=1)
         
-        # Try to parse absolute dates using dateutil if available
-        if HAS_DATEUTIL:
-            try:
-                return dateutil.parser.parse(date_str)
-            except:
-                pass
-        
-        # Basic date parsing fallback
-        try:
-            # Try common formats
-            for fmt in ['%Y-%m-%d', '%m/%d/%Y', '%d/%m/%Y', '%Y-%m-%d %H:%M:%S']:
-                try:
-                    return datetime.strptime(date_str, fmt)
-                except ValueError:
-                    continue
-        except:
-            pass
-        
-        return None
+        return _parse_absolute_date(date_str)
     
-    def _is_within_time_filter(self, posted_date: datetime) -> bool:
+    def _is_within_time_filter(self, posted_date: datetime, now: Optional[datetime] = None) -> bool:
         """Check if job was posted within the specified hours"""
         if not posted_date:
             return False
         
-        now = datetime.now()
+        if now is None:
+            now = datetime.now()
         time_diff = now - posted_date
         return time_diff.total_seconds() / 3600 <= self.max_age_hours
     
+    def matches(self, job: Dict, now: Optional[datetime] = None) -> bool:
+        """Check a single job's posting date (relative to now, default the current time)"""
+        if 'posted_ts' in job:
+            # Parsed once at ingestion by add_posting_timestamps()
+            posted_ts = job['posted_ts']
+            if posted_ts is None:
+                return True
+            if now is None:
+                now = datetime.now()
+            return posted_ts >= self._cutoff_ts(now)
+        
+        posted_date = self._parse_posting_date(job.get('posted_date', ''), now)
+        
+        # If we can't parse the date, include the job (better to be inclusive)
+        if posted_date is None:
+            return True
+        return self._is_within_time_filter(posted_date, now)
+    
+    def filter_columns(self, columns: JobColumns):
+        """Check the kept jobs against one reference time"""
+        now = datetime.now()
+        keep = columns.keep
+        for index, job in enumerate(columns.jobs):
+            if keep[index] and not self.matches(job, now):
+                keep[index] = False
+    
+    def mask(self, jobs: Union[List[Dict], JobColumns]) -> 'pd.Series':
+        """
+        Column-wise equivalent of filter() (requires pandas).
+        
+        Vectorized over posted_ts when every job has it (see
+        add_posting_timestamps()); otherwise each distinct posted_date
+        string is checked once.
+        
+        Args:
+            jobs: List of job dictionaries, or a JobColumns view of them
+            
+        Returns:
+            Boolean Series, True for jobs filter() would keep
+        """
+        columns = jobs if isinstance(jobs, JobColumns) else JobColumns(jobs)
+        now = datetime.now()
+        
+        if all('posted_ts' in job for job in columns.jobs):
+            # Unparsed dates (None) become NaN and are kept, as in matches()
+            posted_ts = pd.Series([job['posted_ts'] for job in columns.jobs], dtype='float64')
+            return posted_ts.isna() | (posted_ts >= self._cutoff_ts(now))
+        
+        decided = {}
+        keep = []
+        for job in columns.jobs:
+            if 'posted_ts' in job:
+                keep.append(self.matches(job, now))
+                continue
+            posted_date = job.get('posted_date', '')
+            allowed = decided.get(posted_date)
+            if allowed is None:
+                allowed = decided[posted_date] = self.matches(job, now)
+            keep.append(allowed)
+        return pd.Series(keep, dtype=bool)
+    
     def filter(self, jobs: List[Dict]) -> List[Dict]:
         """Filter jobs by posting date"""
         self._stats['original_count'] = len(jobs)
         
-        filtered_jobs = []
-        
-        for job in jobs:
-            posted_date = self._parse_posting_date(job.get('posted_date', ''))
-            
-            if posted_date is None:
-                # If we can't parse the date, include the job (better to be inclusive)
-                filtered_jobs.append(job)
-            elif self._is_within_time_filter(posted_date):
-                filtered_jobs.append(job)
+        # One reference time for the whole batch
+        now = datetime.now()
+        filtered_jobs = [job for job in jobs if self.matches(job, now)]
         
         self._stats['filtered_out'] = len(jobs) - len(filtered_jobs)
         self._stats['final_count'] = len(filtered_jobs)
         
-        self.logger.info(f"Date filter: kept {len(filtered_jobs)} jobs posted within "
-                        f"{self.max_age_hours} hours (filtered out {self._stats['filtered_out']})")
+        self.logger.info("Date filter: kept %d jobs posted within %s hours (filtered out %d)",
+                         len(filtered_jobs), self.max_age_hours, self._stats['filtered_out'])
         
         return filtered_jobs
 
@@ -658,6 +1407,9 @@ class LocationFilter(JobFilter):
         self.excluded_locations = [loc.lower().strip() for loc in excluded_locations] if excluded_locations else []
         self.allow_remote = allow_remote
         self.exact_match = exact_match
+        # Normalized once here rather than once per job (empty entries never match)
+        self._preferred_normalized = [self._normalize_location(loc) for loc in self.preferred_locations or [] if loc]
+        self._excluded_normalized = [self._normalize_location(loc) for loc in self.excluded_locations if loc]
         self._stats = {'original_count': 0, 'filtered_out': 0, 'final_count': 0}
     
     def _normalize_location(self, location: str) -> str:
@@ -669,15 +1421,12 @@ class LocationFilter(JobFilter):
         location = location.lower().strip()
         
         # Remove common location suffixes and prefixes
-        location = re.sub(r'\b(usa|us|united states)\b', '', location)
-        location = re.sub(r'\b(ca|california)\b', 'california', location)
-        location = re.sub(r'\b(ny|new york)\b', 'new york', location)
-        location = re.sub(r'\b(fl|florida)\b', 'florida', location)
-        location = re.sub(r'\b(tx|texas)\b', 'texas', location)
+        for pattern, replacement in _LOCATION_REWRITES:
+            location = pattern.sub(replacement, location)
         
         # Remove common separators and extra spaces
-        location = re.sub(r'[,\-\(\)]', ' ', location)
-        location = re.sub(r'\s+', ' ', location).strip()
+        location = _LOCATION_SEPARATOR_RE.sub(' ', location)
+        location = _WHITESPACE_RE.sub(' ', location).strip()
         
         return location
     
@@ -686,27 +1435,23 @@ class LocationFilter(JobFilter):
         if not location:
             return False
         
-        location_lower = location.lower()
-        remote_keywords = [
-            'remote', 'work from home', 'wfh', 'telecommute', 
-            'distributed', 'anywhere', 'virtual', 'home-based'
-        ]
-        
-        return any(keyword in location_lower for keyword in remote_keywords)
+        return _REMOTE_KEYWORDS.search(location.lower())
     
     def _location_matches(self, job_location: str, preferred_location: str) -> bool:
         """Check if job location matches preferred location"""
         if not job_location or not preferred_location:
             return False
         
-        job_loc = self._normalize_location(job_location)
-        pref_loc = self._normalize_location(preferred_location)
-        
+        return self._matches_any(self._normalize_location(job_location),
+                                 [self._normalize_location(preferred_location)])
+    
+    def _matches_any(self, job_loc: str, normalized_locations: List[str]) -> bool:
+        """Check a normalized job location against already-normalized locations"""
         if self.exact_match:
-            return job_loc == pref_loc
-        else:
-            # Check if preferred location is contained in job location or vice versa
-            return pref_loc in job_loc or job_loc in pref_loc
+            return job_loc in normalized_locations
+        
+        # Check if preferred location is contained in job location or vice versa
+        return any(loc in job_loc or job_loc in loc for loc in normalized_locations)
     
     def filter(self, jobs: List[Dict]) -> List[Dict]:
         """Filter jobs by location preferences"""
@@ -729,24 +1474,16 @@ class LocationFilter(JobFilter):
                 filtered_jobs.append(job)
                 continue
             
+            job_loc = self._normalize_location(location) if location else None
+            
             # Check excluded locations first
             if self.excluded_locations:
-                excluded = False
-                for excluded_loc in self.excluded_locations:
-                    if self._location_matches(location, excluded_loc):
-                        excluded = True
-                        break
-                if excluded:
+                if job_loc is not None and self._matches_any(job_loc, self._excluded_normalized):
                     continue
             
             # Check preferred locations
             if self.preferred_locations:
-                matched = False
-                for preferred_loc in self.preferred_locations:
-                    if self._location_matches(location, preferred_loc):
-                        matched = True
-                        break
-                if matched:
+                if job_loc is not None and self._matches_any(job_loc, self._preferred_normalized):
                     filtered_jobs.append(job)
             else:
                 # If no preferred locations specified, include the job
@@ -756,25 +1493,140 @@ class LocationFilter(JobFilter):
         self._stats['filtered_out'] = len(jobs) - len(filtered_jobs)
         self._stats['final_count'] = len(filtered_jobs)
         
-        self.logger.info(f"Location filter: kept {len(filtered_jobs)} jobs "
-                        f"(filtered out {self._stats['filtered_out']})")
+        self.logger.info("Location filter: kept %d jobs (filtered out %d)",
+                         len(filtered_jobs), self._stats['filtered_out'])
         
         return filtered_jobs
 
 
 # Convenience functions for backward compatibility
-def deduplicate_jobs(jobs: List[Dict], similarity_threshold: float = 0.9) -> List[Dict]:
+def deduplicate_jobs(jobs: List[Dict], similarity_threshold: float = 0.9,
+                     use_lsh: bool = False) -> List[Dict]:
     """Remove duplicate jobs from a list"""
-    deduplicator = DuplicateRemover(similarity_threshold)
+    deduplicator = DuplicateRemover(similarity_threshold, use_lsh=use_lsh)
     return deduplicator.filter(jobs)
 
 
+@functools.lru_cache(maxsize=16)
+def _build_main_filter(config_key: str) -> MainJobFilter:
+    """
+    MainJobFilter for a JSON-encoded config, built once per distinct config.
+    
+    Only used as a template for get_main_filter(); never handed out itself.
+    """
+    return MainJobFilter(json.loads(config_key))
+
+
+def get_main_filter(filter_config: Dict[str, Any]) -> MainJobFilter:
+    """
+    Get a MainJobFilter for a config, reusing one built for an equal config.
+    
+    Building compiles the keyword matchers and lowercases the company
+    lists, so callers that filter new batches with the same config (e.g. a
+    scheduler calling main() repeatedly) skip that work. Each call returns
+    a new filter sharing those built sub-filters, so changing one filter's
+    config (e.g. through filter_jobs()) doesn't affect other callers.
+    
+    Args:
+        filter_config: Filter configuration
+        
+    Returns:
+        MainJobFilter for the config
+    """
+    try:
+        config_key = json.dumps(filter_config, sort_keys=True)
+    except TypeError:
+        # Not JSON-serializable, so it can't be used as a cache key
+        return MainJobFilter(filter_config)
+    
+    template = _build_main_filter(config_key)
+    main_filter = copy.copy(template)
+    main_filter.config = copy.deepcopy(template.config)
+    main_filter._stats = dict(template._stats)
+    return main_filter
+
+
 def filter_jobs_by_criteria(jobs: List[Dict], criteria: Dict[str, Any]) -> List[Dict]:
     """Filter jobs by multiple criteria"""
-    main_filter = MainJobFilter(criteria)
+    main_filter = get_main_filter(criteria)
     return main_filter.filter(jobs)
 
 
+def _posting_timestamps(dates: List[Any], now: Optional[datetime] = None) -> List[Optional[int]]:
+    """Epoch seconds of each posted_date string (None when it can't be parsed)"""
+    date_filter = DateFilter()
+    if now is None:
+        now = datetime.now()
+    # Few distinct strings ("2 days ago", "today", ...), so parse each once
+    parsed = {}
+    for value in set(dates):
+        posted = date_filter._parse_posting_date(value, now) if isinstance(value, str) else None
+        parsed[value] = int(posted.timestamp()) if posted else None
+    return [parsed[value] for value in dates]
+
+
+def add_posting_timestamps(jobs: List[Dict], now: Optional[datetime] = None) -> List[Dict]:
+    """
+    Parse each job's posted_date once into a posted_ts field.
+    
+    posted_ts holds epoch seconds (None if the date can't be parsed).
+    DateFilter and sort_jobs() use it instead of re-parsing posted_date.
+    
+    Args:
+        jobs: List of job dictionaries (updated in place)
+        now: Reference time for relative dates (defaults to the current time)
+        
+    Returns:
+        The same list of jobs
+    """
+    timestamps = _posting_timestamps([job.get('posted_date') for job in jobs], now)
+    for job, posted_ts in zip(jobs, timestamps):
+        job['posted_ts'] = posted_ts
+    return jobs
+
+
+def _sort_keys(jobs: List[Dict], sort_by: str) -> List[Any]:
+    """Sort key of each job for sort_jobs() (None when the value can't be parsed)"""
+    if sort_by == 'posted_date':
+        # Relative dates ("3 hours ago") compare by the time they stand for
+        if all('posted_ts' in job for job in jobs):
+            return [job['posted_ts'] for job in jobs]
+        return _posting_timestamps([job.get(sort_by) for job in jobs])
+    
+    values = [job.get(sort_by) for job in jobs]
+    
+    if sort_by == 'salary':
+        return [_parse_salary(value) if isinstance(value, str) else None for value in values]
+    
+    return ['' if value is None else value for value in values]
+
+
+def sort_jobs(jobs: List[Dict], sort_by: str, descending: bool = False) -> List[Dict]:
+    """
+    Sort jobs by a field.
+    
+    Posting dates sort by the time they stand for and salaries by their
+    amount; other fields sort by value. Keys are computed once per job,
+    and jobs whose date or salary can't be parsed go last in input order.
+    
+    Args:
+        jobs: List of job dictionaries
+        sort_by: Field to sort by
+        descending: Sort from largest/newest to smallest/oldest
+        
+    Returns:
+        New sorted list of job dictionaries
+    """
+    keys = _sort_keys(jobs, sort_by)
+    order = [index for index, key in enumerate(keys) if key is not None]
+    order.sort(key=keys.__getitem__, reverse=descending)
+    
+    sorted_jobs = [jobs[index] for index in order]
+    if len(order) < len(jobs):
+        sorted_jobs.extend(job for job, key in zip(jobs, keys) if key is None)
+    return sorted_jobs
+
+
 class FilterPipeline:
     """Pipeline for applying multiple filters in sequence"""
     
@@ -787,18 +1639,35 @@ class FilterPipeline:
         self.filters.append(filter_instance)
     
     def apply_filters(self, jobs: List[Dict]) -> List[Dict]:
-        """Apply all filters in the pipeline"""
-        self.logger.info(f"Starting filter pipeline with {len(jobs)} jobs")
+        """
+        Apply all filters in the pipeline.
+        
+        Runs of per-job filters share one JobColumns view and only clear
+        keep flags; the surviving jobs are collected once the run ends.
+        List-level filters (e.g. DuplicateRemover) get the collected list.
+        """
+        self.logger.info("Starting filter pipeline with %d jobs", len(jobs))
         
         filtered_jobs = jobs
         total_stats = {}
+        columns = None
+        before_count = len(jobs)
         
         for i, filter_instance in enumerate(self.filters):
             filter_name = filter_instance.__class__.__name__
-            before_count = len(filtered_jobs)
             
-            filtered_jobs = filter_instance.filter(filtered_jobs)
-            after_count = len(filtered_jobs)
+            if type(filter_instance).matches is JobFilter.matches:
+                if columns is not None:
+                    filtered_jobs = list(compress(columns.jobs, columns.keep))
+                    columns = None
+                filtered_jobs = filter_instance.filter(filtered_jobs)
+                after_count = len(filtered_jobs)
+            else:
+                if columns is None:
+                    columns = JobColumns(filtered_jobs, [True] * len(filtered_jobs))
+                filter_instance.filter_columns(columns)
+                after_count = sum(columns.keep)
+                filter_instance._record_counts(before_count, after_count)
             
             filtered_out = before_count - after_count
             total_stats[filter_name] = {
@@ -807,10 +1676,14 @@ class FilterPipeline:
                 'filtered_out': filtered_out
             }
             
-            self.logger.info(f"Filter {i+1}/{len(self.filters)} ({filter_name}): "
-                           f"{before_count} → {after_count} jobs")
+            self.logger.info("Filter %d/%d (%s): %d → %d jobs",
+                             i + 1, len(self.filters), filter_name, before_count, after_count)
+            before_count = after_count
+        
+        if columns is not None:
+            filtered_jobs = list(compress(columns.jobs, columns.keep))
         
-        self.logger.info(f"Filter pipeline completed: {len(jobs)} → {len(filtered_jobs)} jobs")
+        self.logger.info("Filter pipeline completed: %d → %d jobs", len(jobs), len(filtered_jobs))
         return filtered_jobs
     
     def get_pipeline_stats(self) -> Dict:
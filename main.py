@@ -4,23 +4,30 @@ Job Scraper Project - Main Entry Point
 Orchestrates job scraping from multiple sources with filtering and export capabilities.
 """
 
+import copy
+import itertools
 import logging
 import argparse
 import yaml
 import sys
 import os
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from datetime import datetime
 from typing import List, Dict, Any
 
 # Add current directory to Python path for imports
-sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+_PROJECT_DIR = os.path.dirname(os.path.abspath(__file__))
+if _PROJECT_DIR not in sys.path:
+    sys.path.append(_PROJECT_DIR)
 
 try:
     from manager.scraper_manager import ScraperManager
-    from filters.job_filter import MainJobFilter, deduplicate_jobs
+    from filters.job_filter import get_main_filter, deduplicate_jobs, sort_jobs, add_posting_timestamps
     from utils.exporter import CSVExporter, JSONExporter, ExcelExporter  # Fixed import
     from utils.logger import setup_logger
+    from config import load_yaml_config, HAS_LIBYAML
     # Email sender commented out as it's not implemented yet
     # from utils.emailer import EmailSender
 except ImportError as e:
@@ -28,20 +35,61 @@ except ImportError as e:
     print("Please ensure all required modules are in place.")
     sys.exit(1)
 
+# Prefer the libyaml-backed dumper, fall back to the pure-Python one
+if HAS_LIBYAML:
+    from yaml import CSafeDumper as _YamlDumper
+else:
+    from yaml import SafeDumper as _YamlDumper
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 
 def load_config(config_path: str = "configs/settings.yaml") -> dict:
-    """Load configuration from YAML file"""
-    try:
-        with open(config_path, 'r') as file:
-            config = yaml.safe_load(file)
-            print(f"✅ Configuration loaded from {config_path}")
-            return config
-    except FileNotFoundError:
+    """
+    Load configuration from YAML file.
+    
+    Parsing goes through config.load_yaml_config, which memoizes the result
+    per (path, mtime, size) and keeps a JSON snapshot next to the YAML, so
+    repeated CLI runs skip the YAML parser while the file is unchanged.
+    """
+    if not os.path.isfile(config_path):
         print(f"⚠️  Config file {config_path} not found. Using default settings.")
         return get_default_config()
-    except yaml.YAMLError as e:
+    
+    try:
+        # The cached dict is shared; main() overrides values from the CLI
+        config = copy.deepcopy(load_yaml_config(config_path))
+    except (OSError, yaml.YAMLError, ValueError) as e:
         print(f"❌ Error reading config file: {e}. Using default settings.")
         return get_default_config()
+    
+    print(f"✅ Configuration loaded from {config_path}")
+    return config
+
+
+def format_config(config: dict, output_format: str = 'json') -> str:
+    """
+    Render the configuration for display.
+    
+    Args:
+        config: Configuration dictionary
+        output_format: 'json' (uses orjson when installed, else YAML) or 'yaml'
+        
+    Returns:
+        Formatted configuration text
+    """
+    if output_format == 'json' and HAS_ORJSON:
+        try:
+            return orjson.dumps(config, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS
+                                                 | orjson.OPT_NON_STR_KEYS).decode()
+        except TypeError:
+            # A value orjson can't serialize; YAML can still show it
+            pass
+    return yaml.dump(config, Dumper=_YamlDumper, default_flow_style=False, indent=2)
 
 
 def get_default_config() -> dict:
@@ -56,7 +104,8 @@ def get_default_config() -> dict:
             'enabled': ['linkedin', 'indeed', 'google'],
             'parallel': True,
             'max_workers': 3,
-            'delay': 2.0
+            'delay': 2.0,
+            'http_cache': None
         },
         'filters': {
             'min_salary': None,
@@ -95,11 +144,19 @@ def get_default_config() -> dict:
     }
 
 
+# Working directories ensure_directories_exist() has already prepared
+_prepared_dirs = set()
+
+
 def ensure_directories_exist():
-    """Create necessary directories if they don't exist"""
-    directories = ['logs', 'data', 'data/output']
-    for directory in directories:
-        Path(directory).mkdir(parents=True, exist_ok=True)
+    """Create necessary directories if they don't exist (once per working directory)"""
+    cwd = os.getcwd()
+    if cwd in _prepared_dirs:
+        return
+    # makedirs creates 'data' along with 'data/output'
+    for directory in ('logs', 'data/output'):
+        os.makedirs(directory, exist_ok=True)
+    _prepared_dirs.add(cwd)
 
 
 def validate_config(config: dict) -> bool:
@@ -131,21 +188,24 @@ def validate_config(config: dict) -> bool:
 
 def display_config_summary(config: dict):
     """Display configuration summary"""
-    print("\n📋 Configuration Summary:")
-    print("=" * 50)
-    print(f"🔍 Search Terms: {', '.join(config['search']['terms'][:3])}")
+    lines = ["\n📋 Configuration Summary:", "=" * 50,
+             f"🔍 Search Terms: {', '.join(config['search']['terms'][:3])}"]
     if len(config['search']['terms']) > 3:
-        print(f"    ... and {len(config['search']['terms']) - 3} more")
+        lines.append(f"    ... and {len(config['search']['terms']) - 3} more")
     
-    print(f"📍 Locations: {', '.join(config['search']['locations'][:3])}")
+    lines.append(f"📍 Locations: {', '.join(config['search']['locations'][:3])}")
     if len(config['search']['locations']) > 3:
-        print(f"    ... and {len(config['search']['locations']) - 3} more")
+        lines.append(f"    ... and {len(config['search']['locations']) - 3} more")
     
-    print(f"🌐 Scrapers: {', '.join(config['scrapers']['enabled'])}")
-    print(f"📄 Pages per source: {config['search']['pages_per_source']}")
-    print(f"📊 Output format: {config['output']['format']}")
-    print(f"📧 Email enabled: {'Yes' if config['email']['enabled'] else 'No'}")
-    print("=" * 50)
+    lines += [
+        f"🌐 Scrapers: {', '.join(config['scrapers']['enabled'])}",
+        f"📄 Pages per source: {config['search']['pages_per_source']}",
+        f"📊 Output format: {config['output']['format']}",
+        f"📧 Email enabled: {'Yes' if config['email']['enabled'] else 'No'}",
+        "=" * 50,
+    ]
+    # One write for the whole block instead of one per line
+    print("\n".join(lines))
 
 
 def display_sample_jobs(jobs: List[Dict], max_display: int = 5):
@@ -154,8 +214,7 @@ def display_sample_jobs(jobs: List[Dict], max_display: int = 5):
         print("No jobs to display")
         return
     
-    print(f"\n📋 Sample Jobs (showing {min(len(jobs), max_display)} of {len(jobs)}):")
-    print("=" * 80)
+    lines = [f"\n📋 Sample Jobs (showing {min(len(jobs), max_display)} of {len(jobs)}):", "=" * 80]
     
     for i, job in enumerate(jobs[:max_display], 1):
         title = job.get('title', 'N/A')
@@ -165,20 +224,25 @@ def display_sample_jobs(jobs: List[Dict], max_display: int = 5):
         salary = job.get('salary', '')
         posted_date = job.get('posted_date', '')
         
-        print(f"{i}. {title}")
-        print(f"   🏢 {company}")
-        print(f"   📍 {location}")
-        print(f"   🌐 Source: {source}")
+        lines += [
+            f"{i}. {title}",
+            f"   🏢 {company}",
+            f"   📍 {location}",
+            f"   🌐 Source: {source}",
+        ]
         
         if salary:
-            print(f"   💰 {salary}")
+            lines.append(f"   💰 {salary}")
         if posted_date:
-            print(f"   📅 Posted: {posted_date}")
+            lines.append(f"   📅 Posted: {posted_date}")
         
         if job.get('url'):
-            print(f"   🔗 {job['url']}")
+            lines.append(f"   🔗 {job['url']}")
         
-        print("-" * 80)
+        lines.append("-" * 80)
+    
+    # One write for the whole block instead of one per line
+    print("\n".join(lines))
 
 
 def main():
@@ -208,7 +272,8 @@ Examples:
     parser.add_argument('--verbose', '-v', action='store_true', help='Verbose logging')
     parser.add_argument('--no-email', action='store_true', help='Disable email sending')
     parser.add_argument('--test', action='store_true', help='Run in test mode (minimal scraping)')
-    parser.add_argument('--show-config', action='store_true', help='Show configuration and exit')
+    parser.add_argument('--show-config', nargs='?', const='json', choices=['json', 'yaml'],
+                       help='Show configuration and exit (json by default, or yaml)')
     
     args = parser.parse_args()
     
@@ -241,13 +306,16 @@ Examples:
     # Setup logging
     log_level = logging.DEBUG if args.verbose else getattr(logging, config['logging']['level'].upper())
     logger = setup_logger("my_logger", level=log_level)
+    if not HAS_LIBYAML:
+        logger.warning("PyYAML was built without libyaml; config parsing uses the slower "
+                       "pure-Python loader (reinstall pyyaml with libyaml available to fix)")
     
     # Display configuration
     display_config_summary(config)
     
     if args.show_config:
         print("\n🔧 Full Configuration:")
-        print(yaml.dump(config, default_flow_style=False, indent=2))
+        print(format_config(config, args.show_config))
         return
     
     print(f"\n🚀 Starting Job Scraper")
@@ -255,69 +323,89 @@ Examples:
     try:
         # Initialize components
         logger.info("Initializing scraper components...")
-        scraper_manager = ScraperManager(
-            max_workers=config['scrapers']['max_workers'],
-            default_delay=config['scrapers']['delay']
-        )
-        
-        job_filter = MainJobFilter()  # Changed from JobFilter() to MainJobFilter()
-        
-        # Validate scrapers
-        print("🔍 Validating scrapers...")
-        validation_results = scraper_manager.validate_scrapers()
-        
-        valid_scrapers = []
-        for name, status in validation_results.items():
-            if name in config['scrapers']['enabled']:
-                status_icon = "✅" if status else "❌"
-                print(f"  {status_icon} {name}")
-                if status:
-                    valid_scrapers.append(name)
-        
-        if not valid_scrapers:
-            print("❌ No valid scrapers available. Exiting.")
-            sys.exit(1)
-        
-        config['scrapers']['enabled'] = valid_scrapers
-        
-        # Scrape jobs
-        all_jobs = []
-        total_combinations = len(config['search']['terms']) * len(config['search']['locations'])
-        current_combination = 0
-        
-        print(f"\n🔄 Starting scraping process...")
-        start_time = datetime.now()
+        job_filter = get_main_filter(config['filters'])  # Reused while the filter config is unchanged
         
-        for search_term in config['search']['terms']:
-            for location in config['search']['locations']:
-                current_combination += 1
-                print(f"\n📍 [{current_combination}/{total_combinations}] Scraping: '{search_term}' in '{location}'")
-                
-                jobs = scraper_manager.scrape_multiple_sources(
-                    scraper_names=config['scrapers']['enabled'],
-                    search_term=search_term,
-                    location=location,
-                    num_pages=config['search']['pages_per_source'],
-                    parallel=config['scrapers']['parallel']
-                )
+        # Leaving the block, even on an error or Ctrl-C, closes the scraper
+        # sessions and saves the page cache
+        with ScraperManager(
+            max_workers=config['scrapers']['max_workers'],
+            default_delay=config['scrapers']['delay'],
+            drop_duplicates=not config['output']['include_duplicates'],
+            http_cache_path=config['scrapers'].get('http_cache')
+        ) as scraper_manager:
+            # Validate scrapers
+            print("🔍 Validating scrapers...")
+            validation_results = scraper_manager.validate_scrapers(config['scrapers']['enabled'])
+            
+            valid_scrapers = []
+            for name, status in validation_results.items():
+                if name in config['scrapers']['enabled']:
+                    status_icon = "✅" if status else "❌"
+                    print(f"  {status_icon} {name}")
+                    if status:
+                        valid_scrapers.append(name)
+            
+            if not valid_scrapers:
+                print("❌ No valid scrapers available. Exiting.")
+                sys.exit(1)
+            
+            config['scrapers']['enabled'] = valid_scrapers
+            
+            # Scrape jobs
+            combinations = list(itertools.product(config['search']['terms'], config['search']['locations']))
+            total_combinations = len(combinations)
+            # Combinations are independent, so their network waits can overlap;
+            # ScraperManager still scrapes each site for one combination at a time
+            combination_workers = config['scrapers']['max_workers'] if config['scrapers']['parallel'] else 1
+            combination_workers = max(1, min(combination_workers, total_combinations))
+            results = [None] * total_combinations
+            
+            print(f"\n🔄 Starting scraping process...")
+            start_time = datetime.now()
+            
+            with ThreadPoolExecutor(max_workers=combination_workers) as executor:
+                future_to_index = {
+                    executor.submit(
+                        scraper_manager.scrape_multiple_sources,
+                        scraper_names=config['scrapers']['enabled'],
+                        search_term=search_term,
+                        location=location,
+                        num_pages=config['search']['pages_per_source'],
+                        parallel=config['scrapers']['parallel']
+                    ): index
+                    for index, (search_term, location) in enumerate(combinations)
+                }
                 
-                if jobs:
-                    print(f"  Found {len(jobs)} jobs")
-                    all_jobs.extend(jobs)
-                else:
-                    print("  No jobs found")
+                for current_combination, future in enumerate(as_completed(future_to_index), 1):
+                    index = future_to_index[future]
+                    search_term, location = combinations[index]
+                    results[index] = jobs = future.result()
+                    print(f"\n📍 [{current_combination}/{total_combinations}] Scraped: '{search_term}' in '{location}'")
+                    
+                    if jobs:
+                        print(f"  Found {len(jobs)} jobs")
+                    else:
+                        print("  No jobs found")
+        
+        # Keep the search order, so duplicate removal and sorting don't
+        # depend on which combination finished first
+        all_jobs = [job for jobs in results for job in jobs]
+        # Parse posting dates once; filtering and sorting reuse posted_ts
+        add_posting_timestamps(all_jobs)
         
         scraping_duration = (datetime.now() - start_time).total_seconds()
         
-        # Display statistics
-        stats = scraper_manager.get_scraping_stats()
+        # Display statistics. The manager's per-call counts are overwritten
+        # by whichever combination finished last, so total them from the jobs
+        jobs_by_source = dict(Counter(job.get('source', 'unknown') for job in all_jobs))
+        failed_scrapers = list(dict.fromkeys(scraper_manager.get_scraping_stats()['failed_scrapers']))
         print(f"\n📊 Scraping Summary:")
         print(f"  Total jobs found: {len(all_jobs)}")
-        print(f"  Jobs by source: {stats['jobs_by_source']}")
+        print(f"  Jobs by source: {jobs_by_source}")
         print(f"  Duration: {scraping_duration:.2f}s")
         
-        if stats['failed_scrapers']:
-            print(f"  ⚠️  Failed scrapers: {stats['failed_scrapers']}")
+        if failed_scrapers:
+            print(f"  ⚠️  Failed scrapers: {failed_scrapers}")
         
         if not all_jobs:
             print("❌ No jobs found. Try adjusting your search terms or locations.")
@@ -328,7 +416,7 @@ Examples:
         
         # Apply filters
         print("  Applying filters...")
-        filtered_jobs = job_filter.filter_jobs(all_jobs, config['filters'])  # This method exists in MainJobFilter
+        filtered_jobs = job_filter.filter_jobs(all_jobs)
         print(f"  After filtering: {len(filtered_jobs)} jobs")
         
         # Deduplicate
@@ -349,8 +437,7 @@ Examples:
         sort_order = config['output'].get('sort_order', 'desc')
         
         if sort_by and sort_by in ['title', 'company', 'location', 'posted_date', 'salary']:
-            reverse = (sort_order == 'desc')
-            final_jobs.sort(key=lambda x: x.get(sort_by, ''), reverse=reverse)
+            final_jobs = sort_jobs(final_jobs, sort_by, descending=(sort_order == 'desc'))
         
         # Export data
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
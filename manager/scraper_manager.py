@@ -2,46 +2,99 @@
 Scraper Manager - Orchestrates and unifies all job scrapers.
 """
 
+import asyncio
+import functools
 import logging
-from typing import List, Dict, Optional, Set
+import threading
+from typing import Callable, List, Dict, Optional, Set
 from concurrent.futures import ThreadPoolExecutor, as_completed
 import time
+from collections.abc import Mapping
 from datetime import datetime
+from urllib.parse import urlparse
 
 from scrapers import LinkedInScraper, IndeedScraper, CompanyScraper
+from scrapers.base_scraper import BaseScraper, HAS_AIOHTTP
+from scrapers.http_cache import ConditionalCache
+from scrapers.rate_limiter import HostRateLimiter
 from scrapers.company_scraper import GoogleCareers, MetaCareers, MicrosoftCareers
 
+if HAS_AIOHTTP:
+    import aiohttp
+
+
+class _LazyScrapers(Mapping):
+    """
+    Read-only view of a manager's scrapers that creates each one on first
+    access. Register new scrapers with ScraperManager.add_custom_scraper().
+    """
+    
+    def __init__(self, manager: 'ScraperManager'):
+        self._manager = manager
+    
+    def __getitem__(self, name: str) -> BaseScraper:
+        if name not in self._manager._scraper_factories:
+            raise KeyError(name)
+        return self._manager._get(name)
+    
+    def __iter__(self):
+        return iter(list(self._manager._scraper_factories))
+    
+    def __len__(self) -> int:
+        return len(self._manager._scraper_factories)
+
 
 class ScraperManager:
     """Manages and orchestrates multiple job scrapers"""
     
-    def __init__(self, max_workers: int = 3, default_delay: float = 2.0):
+    def __init__(self, max_workers: int = 3, default_delay: float = 2.0,
+                 drop_duplicates: bool = True, http_cache_path: Optional[str] = None):
         """
         Initialize the scraper manager.
         
         Args:
             max_workers: Maximum number of concurrent scrapers
             default_delay: Default delay between requests
+            drop_duplicates: Drop exact duplicates (same title, company and
+                location, ignoring case) while combining sources
+            http_cache_path: File for a conditional-GET cache shared by all
+                scrapers, so unchanged pages aren't downloaded or parsed
+                again on the next run (None = no cache)
         """
         self.max_workers = max_workers
         self.default_delay = default_delay
+        self.drop_duplicates = drop_duplicates
         self.logger = logging.getLogger(self.__class__.__name__)
         
-        # Initialize available scrapers
-        self.scrapers = {
-            'linkedin': LinkedInScraper(delay=default_delay),
-            'indeed': IndeedScraper(delay=default_delay),
-            'google': GoogleCareers(),
-            'meta': MetaCareers(),
-            'microsoft': MicrosoftCareers()
+        # Available scrapers, created on first use: a run that only scrapes
+        # one source doesn't set up sessions and pools for the others
+        self._scraper_factories: Dict[str, Callable[[], BaseScraper]] = {
+            'linkedin': functools.partial(LinkedInScraper, delay=default_delay),
+            'indeed': functools.partial(IndeedScraper, delay=default_delay),
+            'google': GoogleCareers,
+            'meta': MetaCareers,
+            'microsoft': MicrosoftCareers
         }
+        self._instances: Dict[str, BaseScraper] = {}
+        self._instances_lock = threading.Lock()
+        # One limiter for all scrapers, so parallel scrapers hitting the same
+        # host share its request budget while different hosts don't wait
+        self.rate_limiter = HostRateLimiter.from_delay(default_delay)
+        self.http_cache = ConditionalCache(http_cache_path) if http_cache_path else None
+        # One lock per scraper: callers may scrape several search combinations
+        # at once, but each site still only sees one request stream at a time
+        self._scraper_locks = {name: threading.Lock() for name in self._scraper_factories}
+        # Long-lived worker pool for parallel scrapes, so repeated calls (e.g.
+        # one per search term) don't start and stop threads every time
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='scraper')
         
         # Track scraping statistics
         self.stats = {
             'total_jobs': 0,
             'jobs_by_source': {},
             'scraping_duration': 0,
-            'failed_scrapers': []
+            'failed_scrapers': [],
+            'duplicates_dropped': 0
         }
     
     def add_custom_scraper(self, name: str, scraper):
@@ -52,12 +105,48 @@ class ScraperManager:
             name: Unique name for the scraper
             scraper: Scraper instance (must inherit from BaseScraper)
         """
-        self.scrapers[name] = scraper
-        self.logger.info(f"Added custom scraper: {name}")
+        scraper.rate_limiter = self.rate_limiter
+        scraper.http_cache = self.http_cache
+        with self._instances_lock:
+            self._scraper_factories[name] = lambda: scraper
+            self._instances[name] = scraper
+        self._scraper_locks.setdefault(name, threading.Lock())
+        self.logger.info("Added custom scraper: %s", name)
+    
+    def _get(self, name: str) -> BaseScraper:
+        """
+        Get a scraper by name, creating it on first use.
+        
+        Args:
+            name: Scraper name (must be one of get_available_scrapers())
+            
+        Returns:
+            The scraper instance
+        """
+        scraper = self._instances.get(name)
+        if scraper is None:
+            with self._instances_lock:
+                scraper = self._instances.get(name)
+                if scraper is None:
+                    scraper = self._scraper_factories[name]()
+                    scraper.rate_limiter = self.rate_limiter
+                    scraper.http_cache = self.http_cache
+                    self._instances[name] = scraper
+        return scraper
+    
+    @property
+    def scrapers(self) -> Mapping:
+        """
+        Read-only mapping of all available scrapers by name.
+        
+        Scrapers are only created when looked up; use add_custom_scraper()
+        to register new ones.
+        """
+        return _LazyScrapers(self)
     
     def get_available_scrapers(self) -> List[str]:
         """Get list of available scraper names"""
-        return list(self.scrapers.keys())
+        return list(self._scraper_factories.keys())
     
     def scrape_single_source(self, scraper_name: str, search_term: str = "", 
                            location: str = "", num_pages: int = 1, **kwargs) -> List[Dict]:
@@ -74,20 +163,21 @@ class ScraperManager:
         Returns:
             List of job dictionaries
         """
-        if scraper_name not in self.scrapers:
-            self.logger.error(f"Scraper '{scraper_name}' not found")
+        if scraper_name not in self._scraper_factories:
+            self.logger.error("Scraper '%s' not found", scraper_name)
             return []
         
         try:
-            scraper = self.scrapers[scraper_name]
-            self.logger.info(f"Starting scrape with {scraper.platform_name}")
+            scraper = self._get(scraper_name)
+            self.logger.info("Starting scrape with %s", scraper.platform_name)
             
-            start_time = time.time()
-            jobs = scraper.scrape_jobs(search_term, location, num_pages, **kwargs)
-            duration = time.time() - start_time
+            with self._scraper_locks[scraper_name]:
+                start_time = time.time()
+                jobs = scraper.scrape_jobs(search_term, location, num_pages, **kwargs)
+                duration = time.time() - start_time
             
-            self.logger.info(f"Completed {scraper.platform_name} scrape: "
-                           f"{len(jobs)} jobs in {duration:.2f}s")
+            self.logger.info("Completed %s scrape: %d jobs in %.2fs",
+                             scraper.platform_name, len(jobs), duration)
             
             # Update statistics
             self.stats['jobs_by_source'][scraper_name] = len(jobs)
@@ -95,10 +185,51 @@ class ScraperManager:
             return jobs
             
         except Exception as e:
-            self.logger.error(f"Error scraping {scraper_name}: {e}")
+            self.logger.error("Error scraping %s: %s", scraper_name, e)
             self.stats['failed_scrapers'].append(scraper_name)
             return []
     
+    @staticmethod
+    def _job_key(job: Dict) -> tuple:
+        """
+        Identity of a posting: its lowercased title, company and location.
+        
+        Links aren't used: the same job has a different link on each site,
+        and company pages fall back to the careers URL for every card
+        without one.
+        """
+        return (str(job.get('title', '')).lower(), str(job.get('company', '')).lower(),
+                str(job.get('location', '')).lower())
+    
+    def _combine(self, job_lists) -> List[Dict]:
+        """
+        Concatenate per-source job lists, dropping exact duplicates in one pass.
+        
+        Args:
+            job_lists: Iterable of job lists, in the order they should be combined
+            
+        Returns:
+            Combined list of job dictionaries (first posting of each duplicate kept)
+        """
+        all_jobs = []
+        if not self.drop_duplicates:
+            for jobs in job_lists:
+                all_jobs.extend(jobs)
+            return all_jobs
+        
+        seen = set()
+        dropped = 0
+        for jobs in job_lists:
+            for job in jobs:
+                key = self._job_key(job)
+                if key in seen:
+                    dropped += 1
+                    continue
+                seen.add(key)
+                all_jobs.append(job)
+        self.stats['duplicates_dropped'] = dropped
+        return all_jobs
+    
     def scrape_multiple_sources(self, scraper_names: List[str], search_term: str = "",
                               location: str = "", num_pages: int = 1, 
                               parallel: bool = True, **kwargs) -> List[Dict]:
@@ -116,50 +247,107 @@ class ScraperManager:
         Returns:
             Combined list of job dictionaries
         """
-        all_jobs = []
+        job_lists = []
         start_time = time.time()
         
         if parallel and len(scraper_names) > 1:
             # Parallel scraping
-            self.logger.info(f"Starting parallel scraping with {len(scraper_names)} scrapers")
+            self.logger.info("Starting parallel scraping with %d scrapers", len(scraper_names))
+            
+            # Submit scraping tasks
+            future_to_scraper = {
+                self._executor.submit(
+                    self.scrape_single_source, 
+                    scraper_name, search_term, location, num_pages, **kwargs
+                ): scraper_name
+                for scraper_name in scraper_names
+            }
             
-            with ThreadPoolExecutor(max_workers=min(self.max_workers, len(scraper_names))) as executor:
-                # Submit scraping tasks
-                future_to_scraper = {
-                    executor.submit(
-                        self.scrape_single_source, 
-                        scraper_name, search_term, location, num_pages, **kwargs
-                    ): scraper_name
-                    for scraper_name in scraper_names
-                }
-                
-                # Collect results
-                for future in as_completed(future_to_scraper):
-                    scraper_name = future_to_scraper[future]
-                    try:
-                        jobs = future.result()
-                        all_jobs.extend(jobs)
-                    except Exception as e:
-                        self.logger.error(f"Parallel scraping failed for {scraper_name}: {e}")
-                        self.stats['failed_scrapers'].append(scraper_name)
+            # Collect results
+            for future in as_completed(future_to_scraper):
+                scraper_name = future_to_scraper[future]
+                try:
+                    job_lists.append(future.result())
+                except Exception as e:
+                    self.logger.error("Parallel scraping failed for %s: %s", scraper_name, e)
+                    self.stats['failed_scrapers'].append(scraper_name)
         else:
             # Sequential scraping
-            self.logger.info(f"Starting sequential scraping with {len(scraper_names)} scrapers")
+            self.logger.info("Starting sequential scraping with %d scrapers", len(scraper_names))
             
             for scraper_name in scraper_names:
-                jobs = self.scrape_single_source(scraper_name, search_term, location, num_pages, **kwargs)
-                all_jobs.extend(jobs)
-                
-                # Add delay between scrapers to be respectful
-                if scraper_name != scraper_names[-1]:  # Don't delay after last scraper
-                    time.sleep(self.default_delay)
+                # No fixed delay between scrapers: the shared rate limiter
+                # only holds back requests to a host that was just hit
+                job_lists.append(
+                    self.scrape_single_source(scraper_name, search_term, location, num_pages, **kwargs)
+                )
+        
+        # Cross-posted jobs are dropped here rather than by every consumer
+        all_jobs = self._combine(job_lists)
         
         # Update final statistics
         self.stats['total_jobs'] = len(all_jobs)
         self.stats['scraping_duration'] = time.time() - start_time
         
-        self.logger.info(f"Scraping completed: {len(all_jobs)} total jobs from "
-                        f"{len(scraper_names)} sources in {self.stats['scraping_duration']:.2f}s")
+        self.logger.info("Scraping completed: %d total jobs from %d sources in %.2fs",
+                         len(all_jobs), len(scraper_names), self.stats['scraping_duration'])
+        
+        return all_jobs
+    
+    async def scrape_multiple_sources_async(self, scraper_names: List[str], search_term: str = "",
+                                            location: str = "", num_pages: int = 1,
+                                            **kwargs) -> List[Dict]:
+        """
+        Scrape jobs from multiple sources on one event loop (requires aiohttp).
+        
+        Every page of every source is requested concurrently, bounded per
+        site by BaseScraper.MAX_CONCURRENT_REQUESTS, over one shared
+        connection pool. Don't run this alongside threaded scrapes of the
+        same sources: the per-scraper locks only apply to the threaded path.
+        
+        Args:
+            scraper_names: List of scraper names to use
+            search_term: Job search term
+            location: Location to search in
+            num_pages: Number of pages to scrape per source
+            **kwargs: Additional scraper-specific parameters
+            
+        Returns:
+            Combined list of job dictionaries, in scraper_names order
+        """
+        start_time = time.time()
+        scraper_names = [name for name in scraper_names if name in self._scraper_factories]
+        self.logger.info("Starting async scraping with %d scrapers", len(scraper_names))
+        
+        # Scrapers that share a host (e.g. LinkedIn and its Glassdoor copy)
+        # also share its connections, so the per-site bound holds per host too
+        connector = aiohttp.TCPConnector(
+            limit_per_host=max((self._get(name).MAX_CONCURRENT_REQUESTS for name in scraper_names),
+                               default=BaseScraper.MAX_CONCURRENT_REQUESTS)
+        )
+        async with aiohttp.ClientSession(connector=connector) as session:
+            results = await asyncio.gather(
+                *(self._get(name).scrape_jobs_async(search_term, location, num_pages,
+                                                        session=session, **kwargs)
+                  for name in scraper_names),
+                return_exceptions=True
+            )
+        
+        job_lists = []
+        for name, jobs in zip(scraper_names, results):
+            if isinstance(jobs, Exception):
+                self.logger.error("Error scraping %s: %s", name, jobs)
+                self.stats['failed_scrapers'].append(name)
+                continue
+            self.stats['jobs_by_source'][name] = len(jobs)
+            job_lists.append(jobs)
+        all_jobs = self._combine(job_lists)
+        
+        self.stats['total_jobs'] = len(all_jobs)
+        self.stats['scraping_duration'] = time.time() - start_time
+        
+        self.logger.info("Scraping completed: %d total jobs from %d sources in %.2fs",
+                         len(all_jobs), len(scraper_names), self.stats['scraping_duration'])
         
         return all_jobs
     
@@ -172,14 +360,19 @@ class ScraperManager:
             search_term: Job search term
             location: Location to search in
             num_pages: Number of pages to scrape per source
-            parallel: Whether to scrape in parallel
+            parallel: Whether to scrape in parallel (on an asyncio event loop
+                when aiohttp is installed, otherwise in threads)
             **kwargs: Additional scraper-specific parameters
             
         Returns:
             Combined list of job dictionaries
         """
+        if parallel and HAS_AIOHTTP:
+            return asyncio.run(self.scrape_multiple_sources_async(
+                self.get_available_scrapers(), search_term, location, num_pages, **kwargs
+            ))
         return self.scrape_multiple_sources(
-            list(self.scrapers.keys()), search_term, location, num_pages, parallel, **kwargs
+            self.get_available_scrapers(), search_term, location, num_pages, parallel, **kwargs
         )
     
     def get_scraping_stats(self) -> Dict:
@@ -192,28 +385,73 @@ class ScraperManager:
             'total_jobs': 0,
             'jobs_by_source': {},
             'scraping_duration': 0,
-            'failed_scrapers': []
+            'failed_scrapers': [],
+            'duplicates_dropped': 0
         }
     
-    def validate_scrapers(self) -> Dict[str, bool]:
+    def _validate_one(self, scraper: BaseScraper, probe: bool = False) -> bool:
+        """
+        Check that a scraper can build a search URL and, optionally, reach it.
+        
+        Args:
+            scraper: Scraper to check
+            probe: Also send a HEAD request to the search URL
+            
+        Returns:
+            True if the scraper is working
+        """
+        # Try to build a URL and check if scraper is responsive
+        url = scraper.build_search_url("test", "test", 0)
+        if not url:
+            return False
+        if probe:
+            scraper.rate_limiter.acquire(urlparse(url).netloc)
+            return scraper.session.head(url, headers=scraper.headers, timeout=5,
+                                        allow_redirects=True).ok
+        return True
+    
+    def validate_scrapers(self, scraper_names: Optional[List[str]] = None,
+                          probe: bool = False) -> Dict[str, bool]:
         """
-        Validate that all scrapers are working properly.
+        Validate that scrapers are working properly.
         
+        Args:
+            scraper_names: Scrapers to check (None = all); unknown names are skipped
+            probe: Also send a HEAD request to each scraper's search URL;
+                probes run in parallel, up to max_workers at a time
+            
         Returns:
             Dictionary mapping scraper names to their status (True = working)
         """
-        results = {}
+        if scraper_names is None:
+            scraper_names = self._scraper_factories
+        names = [name for name in scraper_names if name in self._scraper_factories]
         
-        for name, scraper in self.scrapers.items():
+        def check(name: str) -> bool:
             try:
-                # Try to build a URL and check if scraper is responsive
-                url = scraper.build_search_url("test", "test", 0)
-                results[name] = bool(url)  # Simple validation
+                return self._validate_one(self._get(name), probe)
             except Exception as e:
-                self.logger.error(f"Validation failed for {name}: {e}")
-                results[name] = False
+                self.logger.error("Validation failed for %s: %s", name, e)
+                return False
         
-        return results
+        # Building URLs is pure CPU; only network probes are worth threads
+        if probe and len(names) > 1:
+            return dict(zip(names, self._executor.map(check, names)))
+        return {name: check(name) for name in names}
+    
+    def close(self):
+        """Shut down the worker pool, close every scraper's HTTP session and save the page cache"""
+        self._executor.shutdown(wait=True)
+        for scraper in list(self._instances.values()):
+            scraper.close()
+        if self.http_cache is not None:
+            self.http_cache.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
     
     def get_platform_info(self) -> Dict[str, str]:
         """Get information about all available platforms"""
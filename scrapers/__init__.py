@@ -5,7 +5,7 @@ Scrapers package initialization.
 from .base_scraper import BaseScraper
 from .linkedin_scraper import LinkedInScraper
 from .indeed_scraper import IndeedScraper
-from .company_scraper import CompanyScraper
+from .company_scraper import CompanyScraper, GoogleCareers
 
 __all__ = [
     'BaseScraper',
@@ -3,32 +3,197 @@ Base scraper class defining the interface for all job portal scrapers.
 """
 
 from abc import ABC, abstractmethod
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple, Union
+import asyncio
+import functools
+import random
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.request import ACCEPT_ENCODING
+from urllib3.util.retry import Retry
+import soupsieve
+from bs4 import BeautifulSoup, SoupStrainer
+import re
+import sys
 import time
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import quote_plus, urljoin, urlparse
+
+from .http_cache import ConditionalCache
+from .rate_limiter import HostRateLimiter
+from .user_agents import USER_AGENTS
+
+try:
+    import aiohttp
+    HAS_AIOHTTP = True
+except ImportError:
+    HAS_AIOHTTP = False
+
+try:
+    import lxml  # noqa: F401 -- BeautifulSoup's fast tree builder
+    HAS_LXML = True
+except ImportError:
+    HAS_LXML = False
+
+# lxml parses pages several times faster than the stdlib parser; it's a
+# requirement, so the fallback only keeps a broken install scraping
+HTML_PARSER = 'lxml' if HAS_LXML else 'html.parser'
+if not HAS_LXML:
+    logging.getLogger(__name__).warning("lxml is not installed; parsing pages with the slower html.parser")
+
+
+# Fields that take few distinct values across a run (including the 'N/A'
+# placeholder); interning them makes every job share one string object per
+# value. Titles, links and snippets are mostly unique and aren't interned
+INTERNED_FIELDS = ('company', 'location', 'posted_date', 'job_type', 'seniority', 'department')
+
+
+def compile_selectors(*selectors: str) -> tuple:
+    """
+    Compile CSS selectors once, at class definition time.
+    
+    Args:
+        *selectors: CSS selectors in priority order
+        
+    Returns:
+        Tuple of compiled selectors for select_first()/select_cards()
+    """
+    return tuple(soupsieve.compile(selector) for selector in selectors)
+
+
+def select_first(element, selectors: tuple):
+    """First match of the highest-priority selector that matches anything (or None)"""
+    for selector in selectors:
+        found = selector.select_one(element)
+        if found is not None:
+            return found
+    return None
+
+
+def select_cards(soup, selectors: tuple, min_count: int = 1) -> List:
+    """All matches of the highest-priority selector with at least min_count matches"""
+    for selector in selectors:
+        cards = selector.select(soup)
+        if len(cards) >= min_count:
+            return cards
+    return []
+
+
+def class_pattern(*names: str) -> 're.Pattern':
+    """
+    Attribute pattern matching a raw class attribute that contains any of names.
+    
+    SoupStrainer sees attributes before bs4 splits class into a list, so
+    class_='base-card' wouldn't match class="base-card relative".
+    
+    Args:
+        *names: CSS class names
+        
+    Returns:
+        Compiled regex for SoupStrainer(class_=...)
+    """
+    return re.compile(r'(?:^|\s)(?:%s)(?:\s|$)' % '|'.join(map(re.escape, names)))
+
+
+class AnyStrainer(SoupStrainer):
+    """
+    Keeps every top-level tag (with its whole subtree) that any of several
+    SoupStrainers would keep, and drops the rest of the page.
+    """
+    
+    def __init__(self, *strainers: SoupStrainer):
+        super().__init__()
+        self.strainers = strainers
+    
+    def allow_tag_creation(self, nsprefix, name, attrs) -> bool:
+        # bs4 >= 4.13
+        return any(strainer.allow_tag_creation(nsprefix, name, attrs) for strainer in self.strainers)
+    
+    def allow_string_creation(self, string) -> bool:
+        # bs4 >= 4.13: text outside the kept tags isn't needed
+        return False
+    
+    def search_tag(self, markup_name=None, markup_attrs={}):
+        # bs4 < 4.13
+        for strainer in self.strainers:
+            found = strainer.search_tag(markup_name, markup_attrs)
+            if found:
+                return found
+        return None
+
+
+@functools.lru_cache(maxsize=128)
+def quote_query(value: str) -> str:
+    """quote_plus() of a search term or location ('' if empty), cached across pages"""
+    return quote_plus(value) if value else ""
+
+
+_URL_STRIPPED_CHARS = frozenset('\t\r\n')
+
+
+def join_url(origin: str, href: str) -> str:
+    """
+    urljoin(origin, href) with a fast path for plain root-relative links.
+    
+    Args:
+        origin: Base URL without a path ('https://host')
+        href: Link as found on the page
+        
+    Returns:
+        Absolute URL
+    """
+    # '/jobs/123' just follows the origin; '//host/..', dot segments and the
+    # tabs/newlines urljoin strips need the full parse
+    if (href.startswith('/') and not href.startswith('//') and '/.' not in href
+            and not _URL_STRIPPED_CHARS.intersection(href)):
+        return origin + href
+    return urljoin(origin, href)
 
 
 class BaseScraper(ABC):
     """Abstract base class for all job scrapers"""
     
-    def __init__(self, delay: float = 2.0):
+    # Pages scrape_jobs()/scrape_jobs_async() fetch from this site at the same time
+    MAX_CONCURRENT_REQUESTS = 2
+    # Parse only the parts of a page this matches (None = whole page). It must
+    # keep every element CARD_SELECTORS can match, with any ancestors those
+    # selectors depend on
+    CARD_STRAINER: Optional[SoupStrainer] = None
+    
+    def __init__(self, delay: float = 2.0, rate_limiter: Optional[HostRateLimiter] = None):
         """
         Initialize the base scraper.
         
         Args:
             delay: Delay between requests in seconds
+            rate_limiter: Per-host limiter to share with other scrapers
+                (None = one request per host every `delay` seconds)
         """
         self.delay = delay
+        self.rate_limiter = rate_limiter or HostRateLimiter.from_delay(delay)
+        # Conditional-GET cache for result pages (None = always download)
+        self.http_cache: Optional[ConditionalCache] = None
         self.headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
+            'User-Agent': random.choice(USER_AGENTS),
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
             'Accept-Language': 'en-US,en;q=0.5',
-            'Accept-Encoding': 'gzip, deflate',
+            # gzip/deflate, plus br and zstd when brotli/zstandard are installed
+            'Accept-Encoding': ACCEPT_ENCODING,
             'Connection': 'keep-alive',
         }
         self.logger = logging.getLogger(self.__class__.__name__)
+        
+        # One session per scraper: keep-alive connections are reused across
+        # pages instead of a new TCP/TLS handshake per request. Rate limiting
+        # and transient server errors are retried with backoff (honouring
+        # Retry-After) on the same pooled connection
+        self.session = requests.Session()
+        retries = Retry(total=3, backoff_factor=0.5, status_forcelist=(429, 500, 502, 503, 504),
+                        allowed_methods=frozenset(['GET']))
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=retries)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
     
     @property
     @abstractmethod
@@ -77,25 +242,88 @@ class BaseScraper(ABC):
         """
         pass
     
-    def make_request(self, url: str, timeout: int = 15) -> Optional[requests.Response]:
+    def request_headers(self) -> Dict[str, str]:
+        """Headers for the next request, with a freshly picked User-Agent"""
+        headers = self.headers.copy()
+        headers['User-Agent'] = random.choice(USER_AGENTS)
+        return headers
+    
+    def make_request(self, url: str, timeout: int = 15,
+                     headers: Optional[Dict[str, str]] = None) -> Optional[requests.Response]:
         """
         Make HTTP request with error handling.
         
         Args:
             url: URL to request
             timeout: Request timeout in seconds
+            headers: Extra headers for this request
             
         Returns:
             Response object or None if request fails
         """
         try:
-            response = requests.get(url, headers=self.headers, timeout=timeout)
+            # Waits only as long as this host's request budget requires
+            self.rate_limiter.acquire(urlparse(url).netloc)
+            request_headers = self.request_headers()
+            if headers:
+                request_headers.update(headers)
+            response = self.session.get(url, headers=request_headers, timeout=timeout)
             response.raise_for_status()
+            self.logger.debug("Got %s (Content-Encoding: %s)", url, response.headers.get('Content-Encoding'))
             return response
         except requests.RequestException as e:
-            self.logger.error(f"Request failed for {url}: {e}")
+            self.logger.error("Request failed for %s: %s", url, e)
             return None
     
+    def close(self):
+        """Close the scraper's HTTP session and its pooled connections"""
+        self.session.close()
+    
+    def parse_jobs(self, html: Union[str, bytes], page: int = 0,
+                   encoding: Optional[str] = None) -> List[Dict]:
+        """
+        Parse one search results page into job dictionaries.
+        
+        Args:
+            html: Page HTML, as text or as the raw response body
+            page: Page number (0-indexed), for logging
+            encoding: Charset of a raw body, if the server declared one
+                (None = let the parser find it in the document)
+                
+        Returns:
+            List of job dictionaries
+        """
+        jobs_data = []
+        source = sys.intern(self.platform_name)
+        
+        # Only job-card subtrees are built when the scraper has a strainer
+        soup = BeautifulSoup(html, HTML_PARSER, from_encoding=encoding, parse_only=self.CARD_STRAINER)
+        job_cards = self.extract_job_cards(soup)
+        
+        self.logger.info("Found %d job cards on %s page %d", len(job_cards), self.platform_name, page + 1)
+        
+        # Every card on the page was fetched at once, so they share a timestamp
+        scraped_at = time.time()
+        for card in job_cards:
+            try:
+                job_info = self.extract_job_info(card)
+            except Exception as e:
+                # Odd markup on one card shouldn't cost the rest of the page
+                self.logger.warning("Skipping %s job card on page %d: %s", self.platform_name, page + 1, e)
+                continue
+            if job_info and job_info.get('title') != 'N/A':
+                job_info['source'] = source
+                for field in INTERNED_FIELDS:
+                    value = job_info.get(field)
+                    if isinstance(value, str):
+                        # str() also turns a bs4 NavigableString (which
+                        # keeps its parse tree alive) into a plain str
+                        job_info[field] = sys.intern(str(value))
+                job_info['scraped_at'] = scraped_at
+                jobs_data.append(job_info)
+        
+        return jobs_data
+    
     def scrape_jobs(self, search_term: str = "", location: str = "", 
                    num_pages: int = 1, **kwargs) -> List[Dict]:
         """
@@ -110,38 +338,170 @@ class BaseScraper(ABC):
         Returns:
             List of job dictionaries
         """
+        def fetch_page(page: int) -> Tuple[Optional[str], Optional[Dict], Optional[requests.Response]]:
+            try:
+                url = self.build_search_url(search_term, location, page)
+                self.logger.info("Scraping %s page %d: %s", self.platform_name, page + 1, url)
+                cached = self.http_cache.get(url) if self.http_cache is not None else None
+                # Pacing between pages is done by the rate limiter in make_request()
+                response = self.make_request(url, headers=ConditionalCache.conditional_headers(cached))
+                return url, cached, response
+            except Exception as e:
+                self.logger.error("Error scraping %s page %d: %s", self.platform_name, page + 1, e)
+                return None, None, None
+        
+        # Up to MAX_CONCURRENT_REQUESTS pages in flight, so one page's network
+        # wait overlaps the next page's rate-limit wait
+        workers = min(num_pages, self.MAX_CONCURRENT_REQUESTS)
+        if workers > 1:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                responses = list(executor.map(fetch_page, range(num_pages)))
+        else:
+            responses = [fetch_page(page) for page in range(num_pages)]
+        
+        # Parse in page order
         jobs_data = []
+        for page, (url, cached, response) in enumerate(responses):
+            if not response:
+                continue
+            if response.status_code == 304 and cached is not None:
+                # Page unchanged since it was cached: reuse its jobs
+                self.logger.info("%s page %d not modified, using cached jobs", self.platform_name, page + 1)
+                scraped_at = time.time()
+                jobs_data.extend(dict(job, scraped_at=scraped_at) for job in cached['jobs'])
+                continue
+            try:
+                # Hand lxml the raw bytes: it decodes them while parsing, rather
+                # than requests decoding a str copy of the page first (and
+                # guessing ISO-8859-1 for text/html without a charset)
+                charset = response.encoding if 'charset=' in response.headers.get('Content-Type', '').lower() else None
+                page_jobs = self.parse_jobs(response.content, page, encoding=charset)
+                if self.http_cache is not None:
+                    self.http_cache.put(url, response, page_jobs)
+                jobs_data.extend(page_jobs)
+            except Exception as e:
+                self.logger.error("Error scraping %s page %d: %s", self.platform_name, page + 1, e)
+        
+        self.logger.info("%s scraping completed. Found %d jobs.", self.platform_name, len(jobs_data))
+        return jobs_data
+    
+    async def fetch(self, url: str, session: 'aiohttp.ClientSession',
+                    timeout: int = 15) -> Optional[str]:
+        """
+        Fetch a page asynchronously (requires aiohttp).
+        
+        Args:
+            url: URL to request
+            session: Open aiohttp session
+            timeout: Request timeout in seconds
+            
+        Returns:
+            Page HTML or None if the request fails
+        """
+        try:
+            async with session.get(url, headers=self.request_headers(),
+                                   timeout=aiohttp.ClientTimeout(total=timeout)) as response:
+                response.raise_for_status()
+                return await response.text()
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            self.logger.error("Request failed for %s: %s", url, e)
+            return None
+    
+    async def _fetch_conditional(self, url: str, session: 'aiohttp.ClientSession',
+                                 cached: Optional[Dict],
+                                 timeout: int = 15) -> Tuple[Optional['aiohttp.ClientResponse'],
+                                                             Optional[bytes]]:
+        """
+        Fetch a page asynchronously, revalidating a cached copy if there is one.
+        
+        Args:
+            url: URL to request
+            session: Open aiohttp session
+            cached: Cache entry for the page (None = plain request)
+            timeout: Request timeout in seconds
+            
+        Returns:
+            (response, raw body) tuple; the body is None on 304 Not Modified,
+            and both are None if the request fails
+        """
+        headers = self.request_headers()
+        headers.update(ConditionalCache.conditional_headers(cached))
+        try:
+            async with session.get(url, headers=headers,
+                                   timeout=aiohttp.ClientTimeout(total=timeout)) as response:
+                if response.status == 304:
+                    return response, None
+                response.raise_for_status()
+                return response, await response.read()
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            self.logger.error("Request failed for %s: %s", url, e)
+            return None, None
+    
+    async def scrape_jobs_async(self, search_term: str = "", location: str = "",
+                                num_pages: int = 1,
+                                session: Optional['aiohttp.ClientSession'] = None,
+                                **kwargs) -> List[Dict]:
+        """
+        Scrape jobs from the platform, fetching pages concurrently (requires aiohttp).
         
-        for page in range(num_pages):
+        At most MAX_CONCURRENT_REQUESTS pages are in flight, and each
+        request first takes a token from the shared per-host rate limiter,
+        so the site sees the same request rate as on the threaded path.
+        Pages are parsed in a worker thread so parsing overlaps the
+        remaining fetches.
+        
+        Args:
+            search_term: Job title or keywords to search for
+            location: Location to search in
+            num_pages: Number of pages to scrape
+            session: aiohttp session to reuse (a new one is opened if None)
+            **kwargs: Additional platform-specific parameters
+            
+        Returns:
+            List of job dictionaries, in page order
+        """
+        if session is None:
+            async with aiohttp.ClientSession() as own_session:
+                return await self.scrape_jobs_async(search_term, location, num_pages,
+                                                    session=own_session, **kwargs)
+        
+        loop = asyncio.get_running_loop()
+        slots = asyncio.Semaphore(self.MAX_CONCURRENT_REQUESTS)
+        
+        def parse_page(url: str, response: 'aiohttp.ClientResponse', body: bytes,
+                       page: int) -> List[Dict]:
+            # Raw bytes plus the header charset, as in scrape_jobs()
+            page_jobs = self.parse_jobs(body, page, encoding=response.charset)
+            if self.http_cache is not None:
+                self.http_cache.put(url, response, page_jobs)
+            return page_jobs
+        
+        async def scrape_page(page: int) -> List[Dict]:
             try:
                 url = self.build_search_url(search_term, location, page)
-                self.logger.info(f"Scraping {self.platform_name} page {page + 1}: {url}")
-                
-                response = self.make_request(url)
-                if not response:
-                    continue
-                
-                soup = BeautifulSoup(response.text, 'lxml')
-                job_cards = self.extract_job_cards(soup)
-                
-                self.logger.info(f"Found {len(job_cards)} job cards on {self.platform_name} page {page + 1}")
-                
-                for card in job_cards:
-                    job_info = self.extract_job_info(card)
-                    if job_info and job_info.get('title') != 'N/A':
-                        job_info['source'] = self.platform_name
-                        job_info['scraped_at'] = time.time()
-                        jobs_data.append(job_info)
-                
-                # Respectful delay between requests
-                if page < num_pages - 1:  # Don't delay after the last page
-                    time.sleep(self.delay)
-                
+                cached = self.http_cache.get(url) if self.http_cache is not None else None
+                async with slots:
+                    await self.rate_limiter.acquire_async(urlparse(url).netloc)
+                    self.logger.info("Scraping %s page %d: %s", self.platform_name, page + 1, url)
+                    response, body = await self._fetch_conditional(url, session, cached)
+                if response is None:
+                    return []
+                if body is None and cached is not None:
+                    # Page unchanged since it was cached: reuse its jobs
+                    self.logger.info("%s page %d not modified, using cached jobs", self.platform_name, page + 1)
+                    scraped_at = time.time()
+                    return [dict(job, scraped_at=scraped_at) for job in cached['jobs']]
+                if body is None:
+                    return []
+                return await loop.run_in_executor(None, parse_page, url, response, body, page)
             except Exception as e:
-                self.logger.error(f"Error scraping {self.platform_name} page {page + 1}: {e}")
-                continue
+                self.logger.error("Error scraping %s page %d: %s", self.platform_name, page + 1, e)
+                return []
+        
+        pages = await asyncio.gather(*(scrape_page(page) for page in range(num_pages)))
+        jobs_data = [job for page_jobs in pages for job in page_jobs]
         
-        self.logger.info(f"{self.platform_name} scraping completed. Found {len(jobs_data)} jobs.")
+        self.logger.info("%s scraping completed. Found %d jobs.", self.platform_name, len(jobs_data))
         return jobs_data
     
     def validate_job_data(self, job_data: Dict) -> bool:
@@ -4,13 +4,67 @@ Generic company career page scraper.
 
 from typing import List, Dict, Optional
 from bs4 import BeautifulSoup
-from urllib.parse import urljoin, urlparse
-from .base_scraper import BaseScraper
+from urllib.parse import urlparse
+from .base_scraper import BaseScraper, compile_selectors, select_first, select_cards, join_url, quote_query
 
 
 class CompanyScraper(BaseScraper):
     """Generic scraper for company career pages"""
     
+    # Selectors in priority order, compiled once per class
+    CARD_SELECTORS = compile_selectors(
+        'div[class*="job"]',
+        'li[class*="job"]',
+        'article[class*="job"]',
+        'div[class*="position"]',
+        'li[class*="position"]',
+        'div[class*="opening"]',
+        'li[class*="opening"]',
+        'div[class*="career"]',
+        'tr[class*="job"]',  # Table rows
+        'a[href*="/job"]',
+        'a[href*="/career"]',
+        'a[href*="/position"]',
+    )
+    TITLE_SELECTORS = compile_selectors(
+        'h1', 'h2', 'h3', 'h4',
+        '[class*="title"]',
+        '[class*="name"]',
+        '[class*="position"]',
+        'a',
+    )
+    LOCATION_SELECTORS = compile_selectors(
+        '[class*="location"]',
+        '[class*="city"]',
+        '[class*="office"]',
+        '[class*="region"]',
+    )
+    DATE_SELECTORS = compile_selectors(
+        '[class*="date"]',
+        '[class*="posted"]',
+        'time',
+    )
+    DEPT_SELECTORS = compile_selectors(
+        '[class*="department"]',
+        '[class*="team"]',
+        '[class*="division"]',
+    )
+    TYPE_SELECTORS = compile_selectors(
+        '[class*="type"]',
+        '[class*="employment"]',
+    )
+    
+    # Locations looked for in the card text when no location element matches,
+    # in priority order
+    COMMON_LOCATIONS = (
+        'remote', 'san francisco', 'new york', 'seattle', 'austin',
+        'chicago', 'boston', 'los angeles', 'denver', 'atlanta'
+    )
+    
+    # Cards with less text than this are filter chrome, empty containers or
+    # tracking divs matched by the broad card selectors, not job postings
+    MIN_CARD_TEXT_LENGTH = 20
+    
     def __init__(self, company_name: str, career_url: str, delay: float = 2.0):
         """
         Initialize company scraper.
@@ -23,7 +77,10 @@ class CompanyScraper(BaseScraper):
         super().__init__(delay)
         self.company_name = company_name
         self.career_url = career_url
-        self.base_domain = f"{urlparse(career_url).scheme}://{urlparse(career_url).netloc}"
+        parsed_url = urlparse(career_url)
+        self.base_domain = f"{parsed_url.scheme}://{parsed_url.netloc}"
+        # Separator for the page parameter appended by build_search_url
+        self._pagination_sep = '&' if '?' in career_url else '?'
     
     @property
     def platform_name(self) -> str:
@@ -38,170 +95,164 @@ class CompanyScraper(BaseScraper):
         # Add page parameter if supported (this varies by company)
         if page > 0:
             # Common pagination patterns
-            if '?' in url:
-                url += f"&page={page + 1}"
-            else:
-                url += f"?page={page + 1}"
+            url += f"{self._pagination_sep}page={page + 1}"
         
         return url
     
     def extract_job_cards(self, soup: BeautifulSoup) -> List:
         """Extract job card elements from company career page"""
-        # Common selectors for job listings on career pages
-        job_selectors = [
-            'div[class*="job"]',
-            'li[class*="job"]',
-            'article[class*="job"]',
-            'div[class*="position"]',
-            'li[class*="position"]',
-            'div[class*="opening"]',
-            'li[class*="opening"]',
-            'div[class*="career"]',
-            'tr[class*="job"]',  # Table rows
-            'a[href*="/job"]',
-            'a[href*="/career"]',
-            'a[href*="/position"]'
-        ]
-        
-        job_cards = []
-        for selector in job_selectors:
-            cards = soup.select(selector)
-            if cards and len(cards) > 1:  # Make sure we found actual job listings
-                job_cards = cards
-                break
-        
-        return job_cards
+        # More than one match means we found actual job listings
+        return select_cards(soup, self.CARD_SELECTORS, min_count=2)
     
     def extract_job_info(self, job_card) -> Optional[Dict]:
         """Extract job information from a company career page job card"""
-        try:
-            job_info = {}
-            
-            # Job title - try multiple approaches
-            title_selectors = [
-                'h1', 'h2', 'h3', 'h4',
-                '[class*="title"]',
-                '[class*="name"]',
-                '[class*="position"]',
-                'a'
-            ]
-            
-            title_elem = None
-            for selector in title_selectors:
-                title_elem = job_card.select_one(selector)
-                if title_elem and title_elem.get_text(strip=True):
-                    break
-            
-            if title_elem:
-                job_info['title'] = title_elem.get_text(strip=True)
-            else:
-                # If job_card is a link itself, use its text
-                job_info['title'] = job_card.get_text(strip=True) if hasattr(job_card, 'get_text') else 'N/A'
-            
-            # Company name (we know this from initialization)
-            job_info['company'] = self.company_name
-            
-            # Location - try to find location info
-            location_selectors = [
-                '[class*="location"]',
-                '[class*="city"]',
-                '[class*="office"]',
-                '[class*="region"]'
-            ]
-            
-            location_elem = None
-            for selector in location_selectors:
-                location_elem = job_card.select_one(selector)
-                if location_elem:
-                    break
-            
-            if location_elem:
-                job_info['location'] = location_elem.get_text(strip=True)
-            else:
-                # Look for common location patterns in text
-                card_text = job_card.get_text(strip=True).lower()
-                common_locations = [
-                    'remote', 'san francisco', 'new york', 'seattle', 'austin',
-                    'chicago', 'boston', 'los angeles', 'denver', 'atlanta'
-                ]
-                
-                found_location = None
-                for loc in common_locations:
-                    if loc in card_text:
-                        found_location = loc.title()
-                        break
-                
-                job_info['location'] = found_location or 'Not specified'
+        # Skip non-job cards before running any selectors
+        card_text = job_card.get_text(strip=True)
+        if len(card_text) < self.MIN_CARD_TEXT_LENGTH or not any(c.isalpha() for c in card_text[:50]):
+            return None
+        
+        job_info = {}
+        
+        # Job title - try multiple approaches
+        title_elem = None
+        for selector in self.TITLE_SELECTORS:
+            title_elem = selector.select_one(job_card)
+            if title_elem and title_elem.get_text(strip=True):
+                break
+        
+        if title_elem:
+            job_info['title'] = title_elem.get_text(strip=True)
+        else:
+            # If job_card is a link itself, use its text
+            job_info['title'] = card_text
+        
+        # Company name (we know this from initialization)
+        job_info['company'] = self.company_name
+        
+        # Location - try to find location info
+        location_elem = select_first(job_card, self.LOCATION_SELECTORS)
+        
+        if location_elem:
+            job_info['location'] = location_elem.get_text(strip=True)
+        else:
+            # Look for common location patterns in text
+            card_text_lower = card_text.lower()
+            found_location = next((loc for loc in self.COMMON_LOCATIONS if loc in card_text_lower), None)
             
-            # Job link
-            link_elem = job_card if job_card.name == 'a' else job_card.find('a')
-            if link_elem and link_elem.get('href'):
-                href = link_elem.get('href')
-                if href.startswith('http'):
-                    job_info['link'] = href
-                else:
-                    job_info['link'] = urljoin(self.base_domain, href)
+            job_info['location'] = found_location.title() if found_location else 'Not specified'
+        
+        # Job link
+        link_elem = job_card if job_card.name == 'a' else job_card.find('a')
+        if link_elem and link_elem.get('href'):
+            href = link_elem.get('href')
+            if href.startswith('http'):
+                job_info['link'] = href
             else:
-                job_info['link'] = self.career_url
-            
-            # Posted date (often not available on company pages)
-            date_selectors = [
-                '[class*="date"]',
-                '[class*="posted"]',
-                'time'
-            ]
-            
-            date_elem = None
-            for selector in date_selectors:
-                date_elem = job_card.select_one(selector)
-                if date_elem:
-                    break
-            
-            job_info['posted_date'] = date_elem.get_text(strip=True) if date_elem else 'N/A'
-            
-            # Department/team (common on company pages)
-            dept_selectors = [
-                '[class*="department"]',
-                '[class*="team"]',
-                '[class*="division"]'
-            ]
-            
-            dept_elem = None
-            for selector in dept_selectors:
-                dept_elem = job_card.select_one(selector)
-                if dept_elem:
-                    break
-            
-            job_info['department'] = dept_elem.get_text(strip=True) if dept_elem else 'N/A'
-            
-            # Job type (full-time, contract, etc.)
-            type_selectors = [
-                '[class*="type"]',
-                '[class*="employment"]'
-            ]
-            
-            type_elem = None
-            for selector in type_selectors:
-                type_elem = job_card.select_one(selector)
-                if type_elem:
-                    break
-            
-            job_info['job_type'] = type_elem.get_text(strip=True) if type_elem else 'N/A'
-            
-            return job_info if self.validate_job_data(job_info) else None
-            
-        except Exception as e:
-            self.logger.error(f"Error extracting {self.company_name} job info: {e}")
-            return None
+                try:
+                    job_info['link'] = join_url(self.base_domain, href)
+                except ValueError:
+                    # Malformed href (e.g. a broken IPv6 host); fall back to the listing page
+                    job_info['link'] = self.career_url
+        else:
+            job_info['link'] = self.career_url
+        
+        # Posted date (often not available on company pages)
+        date_elem = select_first(job_card, self.DATE_SELECTORS)
+        
+        job_info['posted_date'] = date_elem.get_text(strip=True) if date_elem else 'N/A'
+        
+        # Department/team (common on company pages)
+        dept_elem = select_first(job_card, self.DEPT_SELECTORS)
+        
+        job_info['department'] = dept_elem.get_text(strip=True) if dept_elem else 'N/A'
+        
+        # Job type (full-time, contract, etc.)
+        type_elem = select_first(job_card, self.TYPE_SELECTORS)
+        
+        job_info['job_type'] = type_elem.get_text(strip=True) if type_elem else 'N/A'
+        
+        return job_info if self.validate_job_data(job_info) else None
 
 
 # Predefined company scrapers for popular tech companies
 class GoogleCareers(CompanyScraper):
-    def __init__(self):
-        super().__init__(
-            company_name="Google",
-            career_url="https://careers.google.com/jobs/results/"
-        )
+    """Google Careers scraper with search and pagination support"""
+    
+    # Selectors in priority order, compiled once per class
+    CARD_SELECTORS = compile_selectors(
+        'div.job-card',
+        'div[data-job-id]',
+        'li.job-listing',
+        'div[class*="job-listing"]',
+    )
+    TITLE_SELECTORS = compile_selectors(
+        'h2.job-title',
+        'a.job-title-link',
+        'div[data-job-title]',
+    )
+    LOCATION_SELECTORS = compile_selectors('div.job-location')
+    LINK_SELECTORS = compile_selectors('a.job-link')
+    
+    def __init__(self, delay: float = 2.0):
+        """Initialize Google Careers scraper"""
+        super().__init__(company_name="Google", career_url="https://careers.google.com", delay=delay)
+        self.base_url = self.career_url
+    
+    @property
+    def platform_name(self) -> str:
+        return "Google Careers"
+    
+    def build_search_url(self, search_term: str, location: str, page: int = 0) -> str:
+        """Build Google Careers job search URL"""
+        encoded_term = quote_query(search_term)
+        encoded_location = quote_query(location)
+        
+        url = f"{self.base_url}/jobs"
+        params = []
+        
+        if encoded_term:
+            params.append(f"q={encoded_term}")
+        if encoded_location:
+            params.append(f"location={encoded_location}")
+        if page > 0:
+            params.append(f"start={page * 10}")
+        
+        if params:
+            url += "?" + "&".join(params)
+        
+        return url
+    
+    def extract_job_cards(self, soup: BeautifulSoup) -> List:
+        """Extract job card elements from Google Careers page"""
+        return select_cards(soup, self.CARD_SELECTORS)
+    
+    def extract_job_info(self, job_card) -> Optional[Dict]:
+        """Extract job information from a Google Careers job card"""
+        job_info = {'company': self.company_name}
+        
+        # Job title - try multiple selectors
+        title_elem = select_first(job_card, self.TITLE_SELECTORS)
+        
+        if title_elem:
+            job_info['title'] = title_elem.get_text(strip=True)
+        
+        # Job location
+        location_elem = select_first(job_card, self.LOCATION_SELECTORS)
+        if location_elem:
+            job_info['location'] = location_elem.get_text(strip=True)
+        
+        # Job link
+        link_elem = select_first(job_card, self.LINK_SELECTORS)
+        if link_elem and 'href' in link_elem.attrs:
+            href = link_elem['href']
+            if isinstance(href, list):
+                href = href[0] if href else ""
+            try:
+                job_info['link'] = join_url(self.base_url, href)
+            except ValueError:
+                self.logger.debug("Skipping malformed job link: %s", href)
+        
+        return job_info if self.validate_job_data(job_info) else None
 
 
 class MetaCareers(CompanyScraper):
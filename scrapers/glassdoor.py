@@ -2,15 +2,54 @@
 LinkedIn job scraper implementation.
 """
 
+import re
 from typing import List, Dict, Optional
-from bs4 import BeautifulSoup
-from urllib.parse import quote_plus
-from .base_scraper import BaseScraper
+from bs4 import BeautifulSoup, SoupStrainer
+from .base_scraper import (BaseScraper, AnyStrainer, class_pattern, compile_selectors, select_first,
+                           select_cards, quote_query)
 
 
 class GlassDoorScraper(BaseScraper):
     """GlassDoor job scraper with enhanced features"""
     
+    # Selectors in priority order, compiled once per class
+    CARD_SELECTORS = compile_selectors(
+        'div.base-card',
+        'div.job-search-card',
+        'li.result-card',
+        'div[data-entity-urn*="jobPosting"]',
+    )
+    # Page parts parse_jobs() builds a tree for: everything CARD_SELECTORS can match
+    CARD_STRAINER = AnyStrainer(
+        SoupStrainer('div', class_=class_pattern('base-card', 'job-search-card')),
+        SoupStrainer('li', class_=class_pattern('result-card')),
+        SoupStrainer('div', attrs={'data-entity-urn': re.compile('jobPosting')}),
+    )
+    TITLE_SELECTORS = compile_selectors(
+        'h3.base-search-card__title a',
+        'h4.base-search-card__title a',
+        'a.base-card__full-link',
+        '.job-title a',
+    )
+    COMPANY_SELECTORS = compile_selectors(
+        'h4.base-search-card__subtitle a',
+        'a.hidden-nested-link',
+        '.job-result-card__company-name',
+        'span.job-result-card__company-name',
+    )
+    LOCATION_SELECTORS = compile_selectors(
+        'span.job-search-card__location',
+        '.job-result-card__location',
+        'span.job-result-card__location',
+    )
+    DATE_SELECTORS = compile_selectors(
+        'time.job-search-card__listdate',
+        'time[datetime]',
+        '.job-result-card__listdate',
+    )
+    SENIORITY_SELECTORS = compile_selectors('.job-flavors__item')
+    SALARY_SELECTORS = compile_selectors('.job-search-card__salary-info')
+    
     @property
     def platform_name(self) -> str:
         return "GlassDoor"
@@ -22,45 +61,25 @@ class GlassDoorScraper(BaseScraper):
     
     def build_search_url(self, search_term: str, location: str, page: int = 0) -> str:
         """Build GlassDoor job search URL"""
-        encoded_term = quote_plus(search_term) if search_term else ""
-        encoded_location = quote_plus(location) if location else ""
-        
-        url = f"{self.base_url}/jobs/search"
-        params = []
+        encoded_term = quote_query(search_term)
+        encoded_location = quote_query(location)
         
+        # The time filter param is always present, so every optional
+        # param can end in '&'
+        url = f"{self.base_url}/jobs/search?"
         if encoded_term:
-            params.append(f"keywords={encoded_term}")
+            url += f"keywords={encoded_term}&"
         if encoded_location:
-            params.append(f"location={encoded_location}")
+            url += f"location={encoded_location}&"
         if page > 0:
-            params.append(f"start={page * 25}")
-        
-        # Add time filter for recent jobs (last 24 hours)
-        params.append("f_TPR=r86400")
+            url += f"start={page * 25}&"
         
-        if params:
-            url += "?" + "&".join(params)
-        
-        return url
+        # Time filter for recent jobs (last 24 hours)
+        return url + "f_TPR=r86400"
     
     def extract_job_cards(self, soup: BeautifulSoup) -> List:
         """Extract job card elements from LinkedIn page"""
-        # Try multiple selectors as LinkedIn's structure may vary
-        selectors = [
-            'div.base-card',
-            'div.job-search-card',
-            'li.result-card',
-            'div[data-entity-urn*="jobPosting"]'
-        ]
-        
-        job_cards = []
-        for selector in selectors:
-            cards = soup.select(selector)
-            if cards:
-                job_cards = cards
-                break
-        
-        return job_cards
+        return select_cards(soup, self.CARD_SELECTORS)
     
     def extract_job_info(self, job_card) -> Optional[Dict]:
         """Extract job information from a LinkedIn job card"""
@@ -68,49 +87,17 @@ class GlassDoorScraper(BaseScraper):
             job_info = {}
             
             # Job title - try multiple selectors
-            title_selectors = [
-                'h3.base-search-card__title a',
-                'h4.base-search-card__title a',
-                'a.base-card__full-link',
-                '.job-title a'
-            ]
-            
-            title_elem = None
-            for selector in title_selectors:
-                title_elem = job_card.select_one(selector)
-                if title_elem:
-                    break
+            title_elem = select_first(job_card, self.TITLE_SELECTORS)
             
             job_info['title'] = title_elem.get_text(strip=True) if title_elem else 'N/A'
             
             # Company name
-            company_selectors = [
-                'h4.base-search-card__subtitle a',
-                'a.hidden-nested-link',
-                '.job-result-card__company-name',
-                'span.job-result-card__company-name'
-            ]
-            
-            company_elem = None
-            for selector in company_selectors:
-                company_elem = job_card.select_one(selector)
-                if company_elem:
-                    break
+            company_elem = select_first(job_card, self.COMPANY_SELECTORS)
             
             job_info['company'] = company_elem.get_text(strip=True) if company_elem else 'N/A'
             
             # Location
-            location_selectors = [
-                'span.job-search-card__location',
-                '.job-result-card__location',
-                'span.job-result-card__location'
-            ]
-            
-            location_elem = None
-            for selector in location_selectors:
-                location_elem = job_card.select_one(selector)
-                if location_elem:
-                    break
+            location_elem = select_first(job_card, self.LOCATION_SELECTORS)
             
             job_info['location'] = location_elem.get_text(strip=True) if location_elem else 'N/A'
             
@@ -125,17 +112,7 @@ class GlassDoorScraper(BaseScraper):
                 job_info['link'] = 'N/A'
             
             # Posted date
-            date_selectors = [
-                'time.job-search-card__listdate',
-                'time[datetime]',
-                '.job-result-card__listdate'
-            ]
-            
-            date_elem = None
-            for selector in date_selectors:
-                date_elem = job_card.select_one(selector)
-                if date_elem:
-                    break
+            date_elem = select_first(job_card, self.DATE_SELECTORS)
             
             if date_elem:
                 # Try to get datetime attribute first, then text
@@ -146,17 +123,17 @@ class GlassDoorScraper(BaseScraper):
             
             # Additional LinkedIn-specific fields
             # Job level/seniority
-            seniority_elem = job_card.select_one('.job-flavors__item')
+            seniority_elem = select_first(job_card, self.SENIORITY_SELECTORS)
             job_info['seniority'] = seniority_elem.get_text(strip=True) if seniority_elem else 'N/A'
             
             # Salary (if available)
-            salary_elem = job_card.select_one('.job-search-card__salary-info')
+            salary_elem = select_first(job_card, self.SALARY_SELECTORS)
             job_info['salary'] = salary_elem.get_text(strip=True) if salary_elem else 'N/A'
             
             return job_info if self.validate_job_data(job_info) else None
             
         except Exception as e:
-            self.logger.error(f"Error extracting LinkedIn job info: {e}")
+            self.logger.error("Error extracting LinkedIn job info: %s", e)
             return None
 
 
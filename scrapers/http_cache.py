@@ -0,0 +1,87 @@
+"""
+Conditional-GET cache for search result pages.
+"""
+
+import shelve
+import threading
+from typing import List, Dict, Optional, Union
+
+import requests
+
+
+class ConditionalCache:
+    """
+    On-disk store of each page's ETag/Last-Modified and the jobs parsed from it.
+    
+    Scrapers send the stored validators with their next request for the page;
+    when the server answers 304 Not Modified the cached jobs are reused, so an
+    unchanged page costs neither the download nor the parse. Thread-safe, so
+    one cache can be shared by all scrapers.
+    """
+    
+    def __init__(self, path: str):
+        """
+        Initialize the cache.
+        
+        Args:
+            path: Database file path (passed to shelve.open)
+        """
+        self.path = path
+        self._db = shelve.open(path)
+        self._lock = threading.Lock()
+    
+    def get(self, url: str) -> Optional[Dict]:
+        """
+        Get the cache entry for a URL.
+        
+        Args:
+            url: Page URL
+            
+        Returns:
+            Dictionary with 'etag', 'last_modified' and 'jobs', or None
+        """
+        with self._lock:
+            return self._db.get(url)
+    
+    def put(self, url: str, response: Union[requests.Response, 'aiohttp.ClientResponse'],
+            jobs: List[Dict]):
+        """
+        Store the jobs parsed from a response, if the server sent validators.
+        
+        Args:
+            url: Page URL
+            response: requests or aiohttp response the jobs were parsed from
+            jobs: Job dictionaries parsed from the response
+        """
+        etag = response.headers.get('ETag')
+        last_modified = response.headers.get('Last-Modified')
+        if not etag and not last_modified:
+            return
+        
+        entry = {'etag': etag, 'last_modified': last_modified, 'jobs': jobs}
+        with self._lock:
+            self._db[url] = entry
+    
+    @staticmethod
+    def conditional_headers(entry: Optional[Dict]) -> Dict[str, str]:
+        """
+        Request headers that ask the server to skip an unchanged page.
+        
+        Args:
+            entry: Cache entry from get() (None = no headers)
+            
+        Returns:
+            Dictionary of If-None-Match/If-Modified-Since headers
+        """
+        headers = {}
+        if entry:
+            if entry.get('etag'):
+                headers['If-None-Match'] = entry['etag']
+            if entry.get('last_modified'):
+                headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+    
+    def close(self):
+        """Write the cache to disk and close it"""
+        with self._lock:
+            self._db.close()
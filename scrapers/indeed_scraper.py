@@ -3,14 +3,61 @@ Indeed job scraper implementation.
 """
 
 from typing import List, Dict, Optional
-from bs4 import BeautifulSoup
-from urllib.parse import quote_plus
-from .base_scraper import BaseScraper
+from bs4 import BeautifulSoup, SoupStrainer
+from .base_scraper import (BaseScraper, AnyStrainer, class_pattern, compile_selectors, select_first,
+                           select_cards, quote_query)
 
 
 class IndeedScraper(BaseScraper):
     """Indeed job scraper with enhanced features"""
     
+    # Selectors in priority order, compiled once per class
+    CARD_SELECTORS = compile_selectors(
+        'div.job_seen_beacon',
+        'div[data-jk]',
+        'div.jobsearch-SerpJobCard',
+        'div.slider_container div.slider_item',
+    )
+    # Page parts parse_jobs() builds a tree for: everything CARD_SELECTORS can match
+    CARD_STRAINER = AnyStrainer(
+        SoupStrainer('div', class_=class_pattern('job_seen_beacon', 'jobsearch-SerpJobCard', 'slider_container')),
+        SoupStrainer('div', attrs={'data-jk': True}),
+    )
+    TITLE_SELECTORS = compile_selectors(
+        'h2.jobTitle a[data-jk]',
+        'h2 a[data-jk]',
+        'a[data-jk] span[title]',
+        '.jobTitle a',
+    )
+    COMPANY_SELECTORS = compile_selectors(
+        'span.companyName a',
+        'span.companyName',
+        'a[data-testid="company-name"]',
+        '.companyName',
+    )
+    LOCATION_SELECTORS = compile_selectors(
+        'div.companyLocation',
+        '[data-testid="job-location"]',
+        '.companyLocation',
+    )
+    DATE_SELECTORS = compile_selectors(
+        'span.date',
+        '[data-testid="myJobsStateDate"]',
+        '.date',
+    )
+    SALARY_SELECTORS = compile_selectors(
+        '.salary-snippet',
+        '.salaryText',
+        '[data-testid="attribute_snippet_testid"]',
+    )
+    SNIPPET_SELECTORS = compile_selectors(
+        '.job-snippet',
+        '[data-testid="job-snippet"]',
+        '.summary',
+    )
+    TITLE_SPAN_SELECTORS = compile_selectors('span[title]')
+    JOB_TYPE_SELECTORS = compile_selectors('[data-testid="attribute_snippet_testid"]')
+    
     @property
     def platform_name(self) -> str:
         return "Indeed"
@@ -22,45 +69,25 @@ class IndeedScraper(BaseScraper):
     
     def build_search_url(self, search_term: str, location: str, page: int = 0) -> str:
         """Build Indeed job search URL"""
-        encoded_term = quote_plus(search_term) if search_term else ""
-        encoded_location = quote_plus(location) if location else ""
-        
-        url = f"{self.base_url}/jobs"
-        params = []
+        encoded_term = quote_query(search_term)
+        encoded_location = quote_query(location)
         
+        # The time filter param is always present, so every optional
+        # param can end in '&'
+        url = f"{self.base_url}/jobs?"
         if encoded_term:
-            params.append(f"q={encoded_term}")
+            url += f"q={encoded_term}&"
         if encoded_location:
-            params.append(f"l={encoded_location}")
+            url += f"l={encoded_location}&"
         if page > 0:
-            params.append(f"start={page * 10}")
-        
-        # Add time filter for recent jobs (last 3 days)
-        params.append("fromage=3")
+            url += f"start={page * 10}&"
         
-        if params:
-            url += "?" + "&".join(params)
-        
-        return url
+        # Time filter for recent jobs (last 3 days)
+        return url + "fromage=3"
     
     def extract_job_cards(self, soup: BeautifulSoup) -> List:
         """Extract job card elements from Indeed page"""
-        # Try multiple selectors as Indeed's structure may vary
-        selectors = [
-            'div.job_seen_beacon',
-            'div[data-jk]',
-            'div.jobsearch-SerpJobCard',
-            'div.slider_container div.slider_item'
-        ]
-        
-        job_cards = []
-        for selector in selectors:
-            cards = soup.select(selector)
-            if cards:
-                job_cards = cards
-                break
-        
-        return job_cards
+        return select_cards(soup, self.CARD_SELECTORS)
     
     def extract_job_info(self, job_card) -> Optional[Dict]:
         """Extract job information from an Indeed job card"""
@@ -68,23 +95,12 @@ class IndeedScraper(BaseScraper):
             job_info = {}
             
             # Job title - try multiple selectors
-            title_selectors = [
-                'h2.jobTitle a[data-jk]',
-                'h2 a[data-jk]',
-                'a[data-jk] span[title]',
-                '.jobTitle a'
-            ]
-            
-            title_elem = None
-            for selector in title_selectors:
-                title_elem = job_card.select_one(selector)
-                if title_elem:
-                    break
+            title_elem = select_first(job_card, self.TITLE_SELECTORS)
             
             # Get title text
             if title_elem:
                 # Try span with title attribute first
-                title_span = title_elem.select_one('span[title]')
+                title_span = select_first(title_elem, self.TITLE_SPAN_SELECTORS)
                 if title_span:
                     job_info['title'] = title_span.get('title')
                 else:
@@ -93,33 +109,12 @@ class IndeedScraper(BaseScraper):
                 job_info['title'] = 'N/A'
             
             # Company name
-            company_selectors = [
-                'span.companyName a',
-                'span.companyName',
-                'a[data-testid="company-name"]',
-                '.companyName'
-            ]
-            
-            company_elem = None
-            for selector in company_selectors:
-                company_elem = job_card.select_one(selector)
-                if company_elem:
-                    break
+            company_elem = select_first(job_card, self.COMPANY_SELECTORS)
             
             job_info['company'] = company_elem.get_text(strip=True) if company_elem else 'N/A'
             
             # Location
-            location_selectors = [
-                'div.companyLocation',
-                '[data-testid="job-location"]',
-                '.companyLocation'
-            ]
-            
-            location_elem = None
-            for selector in location_selectors:
-                location_elem = job_card.select_one(selector)
-                if location_elem:
-                    break
+            location_elem = select_first(job_card, self.LOCATION_SELECTORS)
             
             job_info['location'] = location_elem.get_text(strip=True) if location_elem else 'N/A'
             
@@ -139,58 +134,28 @@ class IndeedScraper(BaseScraper):
                     job_info['link'] = 'N/A'
             
             # Posted date
-            date_selectors = [
-                'span.date',
-                '[data-testid="myJobsStateDate"]',
-                '.date'
-            ]
-            
-            date_elem = None
-            for selector in date_selectors:
-                date_elem = job_card.select_one(selector)
-                if date_elem:
-                    break
+            date_elem = select_first(job_card, self.DATE_SELECTORS)
             
             job_info['posted_date'] = date_elem.get_text(strip=True) if date_elem else 'N/A'
             
             # Salary (if available)
-            salary_selectors = [
-                '.salary-snippet',
-                '.salaryText',
-                '[data-testid="attribute_snippet_testid"]'
-            ]
-            
-            salary_elem = None
-            for selector in salary_selectors:
-                salary_elem = job_card.select_one(selector)
-                if salary_elem:
-                    break
+            salary_elem = select_first(job_card, self.SALARY_SELECTORS)
             
             job_info['salary'] = salary_elem.get_text(strip=True) if salary_elem else 'N/A'
             
             # Job snippet/description
-            snippet_selectors = [
-                '.job-snippet',
-                '[data-testid="job-snippet"]',
-                '.summary'
-            ]
-            
-            snippet_elem = None
-            for selector in snippet_selectors:
-                snippet_elem = job_card.select_one(selector)
-                if snippet_elem:
-                    break
+            snippet_elem = select_first(job_card, self.SNIPPET_SELECTORS)
             
             job_info['snippet'] = snippet_elem.get_text(strip=True) if snippet_elem else 'N/A'
             
             # Job type (full-time, part-time, etc.)
-            job_type_elem = job_card.select_one('[data-testid="attribute_snippet_testid"]')
+            job_type_elem = select_first(job_card, self.JOB_TYPE_SELECTORS)
             job_info['job_type'] = job_type_elem.get_text(strip=True) if job_type_elem else 'N/A'
             
             return job_info if self.validate_job_data(job_info) else None
             
         except Exception as e:
-            self.logger.error(f"Error extracting Indeed job info: {e}")
+            self.logger.error("Error extracting Indeed job info: %s", e)
             return None
 
 
@@ -0,0 +1,101 @@
+"""
+Per-host request rate limiting shared by the scrapers.
+"""
+
+import asyncio
+import random
+import threading
+import time
+from typing import Dict, Tuple
+
+
+class HostRateLimiter:
+    """
+    Token bucket per host: each host gets `rate` requests per second, with
+    bursts of up to `capacity` requests.
+    
+    Thread-safe, so one limiter can be shared by scrapers running in
+    parallel; scrapers hitting different hosts never wait on each other,
+    while scrapers hitting the same host share its budget.
+    """
+    
+    def __init__(self, rate: float, capacity: float = 1.0, jitter: float = 0.0):
+        """
+        Initialize the rate limiter.
+        
+        Args:
+            rate: Requests per second allowed per host (<= 0 disables limiting)
+            capacity: Maximum burst size per host
+            jitter: Extra random wait of up to this fraction of the request
+                interval whenever a request has to wait, so requests to a
+                host don't arrive on a fixed beat
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self.jitter = jitter
+        self._buckets: Dict[str, Tuple[float, float]] = {}  # host -> (tokens, last refill time)
+        self._lock = threading.Lock()
+    
+    @classmethod
+    def from_delay(cls, delay: float, jitter: float = 0.3) -> 'HostRateLimiter':
+        """Limiter allowing one request per host every `delay` seconds (plus jitter)"""
+        return cls(rate=1.0 / delay if delay > 0 else 0, jitter=jitter)
+    
+    def _reserve(self, host: str) -> float:
+        """
+        Take a token for the host if one is available.
+        
+        Args:
+            host: Host name
+            
+        Returns:
+            0 if the token was taken, otherwise how long to wait before retrying
+        """
+        with self._lock:
+            now = time.monotonic()
+            tokens, last_refill = self._buckets.get(host, (self.capacity, now))
+            tokens = min(self.capacity, tokens + (now - last_refill) * self.rate)
+            if tokens >= 1:
+                self._buckets[host] = (tokens - 1, now)
+                return 0
+            self._buckets[host] = (tokens, now)
+            wait = (1 - tokens) / self.rate
+            if self.jitter > 0:
+                wait += random.uniform(0, self.jitter / self.rate)
+            return wait
+    
+    def acquire(self, host: str):
+        """
+        Block until a request to the host is allowed, then take its token.
+        
+        Args:
+            host: Host name (e.g. urlparse(url).netloc)
+        """
+        if self.rate <= 0:
+            return
+        
+        while True:
+            wait = self._reserve(host)
+            if wait <= 0:
+                return
+            # Sleep outside the lock so other hosts aren't held up
+            time.sleep(wait)
+    
+    async def acquire_async(self, host: str):
+        """
+        Asyncio version of acquire(): waits without blocking the event loop.
+        
+        Shares buckets with acquire(), so threaded and asyncio scrapers split
+        one budget per host.
+        
+        Args:
+            host: Host name (e.g. urlparse(url).netloc)
+        """
+        if self.rate <= 0:
+            return
+        
+        while True:
+            wait = self._reserve(host)
+            if wait <= 0:
+                return
+            await asyncio.sleep(wait)
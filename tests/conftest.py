@@ -0,0 +1,8 @@
+"""
+Shared test setup: make the project packages importable from any directory.
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,125 @@
+"""
+Tests for the EmailService bulk sending
+"""
+
+import smtplib
+import types
+import unittest
+from unittest import mock
+
+from utils.emailer import EmailService, _domain_accepts_mail
+
+
+class FakeSMTP:
+    """Stand-in for a logged-in smtplib.SMTP connection"""
+    
+    def __init__(self, fail_sends: bool = False):
+        self.fail_sends = fail_sends
+        self.attempts = 0
+        self.sent = []
+        self.closed = False
+    
+    def send_message(self, msg, to_addrs=None):
+        self.attempts += 1
+        if self.fail_sends:
+            raise smtplib.SMTPDataError(554, b'rejected')
+        self.sent.append(msg['To'])
+        return {}
+    
+    def quit(self):
+        self.closed = True
+    
+    def close(self):
+        self.closed = True
+
+
+class TestSendBulk(unittest.TestCase):
+    """Test cases for EmailService.send_bulk"""
+    
+    def setUp(self):
+        """Set up a service whose connections are FakeSMTP objects"""
+        self.service = EmailService('smtp.example.com', 587, 'sender@example.com', 'password')
+        self.connections = []
+        patcher = mock.patch('utils.emailer._is_deliverable', return_value=True)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+    
+    def connect(self, fail_sends: bool = False):
+        server = FakeSMTP(fail_sends)
+        self.connections.append(server)
+        return server
+    
+    def recipients(self, count: int) -> dict:
+        return {f'u{i}@example.com': [{'title': 'Python Developer'}] for i in range(count)}
+    
+    def test_reopens_connections_after_max_per_connection(self):
+        """Test every message is sent and each connection carries at most max_per_connection"""
+        with mock.patch.object(self.service, '_connect', side_effect=self.connect):
+            results = self.service.send_bulk(self.recipients(5), pool_size=1, max_per_connection=2)
+        
+        self.assertTrue(all(results.values()))
+        self.assertEqual([len(server.sent) for server in self.connections], [2, 2, 1])
+        self.assertTrue(all(server.closed for server in self.connections))
+    
+    def test_recovers_from_failed_reconnect(self):
+        """Test a failed connect only fails the message it was opened for"""
+        attempts = iter([self.connect, ConnectionRefusedError, self.connect, self.connect])
+        
+        def connect():
+            step = next(attempts)
+            if step is ConnectionRefusedError:
+                raise ConnectionRefusedError('refused')
+            return step()
+        
+        with mock.patch.object(self.service, '_connect', side_effect=connect):
+            results = self.service.send_bulk(self.recipients(6), pool_size=1, max_per_connection=2)
+        
+        self.assertEqual(list(results.values()), [True, True, False, True, True, True])
+        self.assertTrue(all(server.closed for server in self.connections))
+    
+    def test_aborts_when_too_many_sends_fail(self):
+        """Test remaining recipients are skipped once a third of ABORT_MIN_SENDS sends fail"""
+        with mock.patch.object(self.service, '_connect',
+                               side_effect=lambda: self.connect(fail_sends=True)):
+            results = self.service.send_bulk(self.recipients(50), pool_size=1)
+        
+        self.assertEqual(len(results), 50)
+        self.assertFalse(any(results.values()))
+        self.assertEqual(sum(server.attempts for server in self.connections),
+                         EmailService.ABORT_MIN_SENDS)
+
+
+class TestDomainAcceptsMail(unittest.TestCase):
+    """Test cases for the recipient domain DNS check"""
+    
+    def check(self, records: set) -> bool:
+        """Run the check against a resolver that only has the given record types"""
+        class NXDOMAIN(Exception):
+            pass
+        
+        class NoAnswer(Exception):
+            pass
+        
+        def resolve(domain, rdtype, lifetime=None):
+            if rdtype not in records:
+                raise NoAnswer()
+        
+        resolver = types.SimpleNamespace(resolve=resolve, NXDOMAIN=NXDOMAIN, NoAnswer=NoAnswer)
+        dns = types.SimpleNamespace(resolver=resolver,
+                                    exception=types.SimpleNamespace(DNSException=Exception))
+        _domain_accepts_mail.cache_clear()
+        self.addCleanup(_domain_accepts_mail.cache_clear)
+        with mock.patch('utils.emailer.HAS_DNSPYTHON', True), \
+                mock.patch('utils.emailer.dns', dns, create=True):
+            return _domain_accepts_mail('example.com')
+    
+    def test_implicit_mx(self):
+        """Test A or AAAA records stand in for a missing MX record"""
+        self.assertTrue(self.check({'MX'}))
+        self.assertTrue(self.check({'A'}))
+        self.assertTrue(self.check({'AAAA'}))
+        self.assertFalse(self.check(set()))
+
+
+if __name__ == '__main__':
+    unittest.main()
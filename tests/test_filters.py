@@ -0,0 +1,174 @@
+"""
+Tests for the job filters
+"""
+
+import unittest
+
+from filters.job_filter import (
+    DuplicateRemover, KeywordFilter, CompanyFilter, SalaryFilter, JobTypeFilter, FilterPipeline,
+    HAS_PANDAS, sort_jobs, get_main_filter, filter_jobs_by_criteria
+)
+
+
+class TestDuplicateRemover(unittest.TestCase):
+    """Test cases for DuplicateRemover"""
+    
+    def setUp(self):
+        """Set up test fixtures"""
+        self.jobs = [
+            {'title': 'Senior Python Developer', 'company': 'Acme', 'location': 'Remote'},
+            {'title': 'Senior Python Developer', 'company': 'Acme', 'location': 'Remote'},
+            {'title': 'Python Developer Senior', 'company': 'Acme Inc', 'location': 'NYC'},
+            {'title': 'Data Scientist', 'company': 'Globex', 'location': 'Remote'},
+            {'title': '', 'company': '', 'location': ''},
+            {'title': '', 'company': '', 'location': 'Boston'},
+        ]
+    
+    def test_removes_exact_and_near_duplicates(self):
+        """Test exact and word-reordered duplicates are removed"""
+        unique = DuplicateRemover(similarity_threshold=0.8).filter(self.jobs)
+        self.assertEqual([job['title'] for job in unique],
+                         ['Senior Python Developer', 'Data Scientist', ''])
+    
+    def test_matches_pairwise_similarity(self):
+        """Test the indexed pass keeps the same jobs as a pairwise comparison"""
+        for threshold in (0.0, 0.3, 0.5, 0.8, 1.0):
+            remover = DuplicateRemover(similarity_threshold=threshold)
+            expected = []
+            for job in self.jobs:
+                if not any(remover._calculate_similarity(job, kept) >= threshold for kept in expected):
+                    expected.append(job)
+            self.assertEqual(remover.filter(self.jobs), expected, threshold)
+    
+    def test_company_suffix_variants(self):
+        """Test short and long company suffixes count as the same company"""
+        jobs = [
+            {'title': 'Analyst', 'company': 'Cera Ltd', 'location': 'Leeds'},
+            {'title': 'Analyst', 'company': 'Cera Limited', 'location': 'Leeds'},
+            {'title': 'Analyst', 'company': 'Globex Corporation', 'location': 'Leeds'},
+            {'title': 'Analyst', 'company': 'Globex Corp.', 'location': 'Leeds'},
+        ]
+        unique = DuplicateRemover(similarity_threshold=1.0).filter(jobs)
+        self.assertEqual([job['company'] for job in unique], ['Cera Ltd', 'Globex Corporation'])
+    
+    def test_stats(self):
+        """Test duplicate statistics"""
+        remover = DuplicateRemover(similarity_threshold=0.8)
+        remover.filter(self.jobs)
+        stats = remover.get_stats()
+        self.assertEqual(stats['original_count'], 6)
+        self.assertEqual(stats['duplicates_removed'], 3)
+
+
+class TestSortJobs(unittest.TestCase):
+    """Test cases for sort_jobs"""
+    
+    def test_sorts_dates_and_salaries_by_value(self):
+        """Test relative dates and salaries sort by what they mean, unparsed last"""
+        jobs = [
+            {'title': 'a', 'posted_date': '1 week ago', 'salary': '$90,000'},
+            {'title': 'b', 'posted_date': 'N/A', 'salary': 'N/A'},
+            {'title': 'c', 'posted_date': '3 hours ago', 'salary': '$120K'},
+            {'title': 'd', 'posted_date': '2 days ago', 'salary': '$100,000'},
+        ]
+        newest = sort_jobs(jobs, 'posted_date', descending=True)
+        self.assertEqual([job['title'] for job in newest], ['c', 'd', 'a', 'b'])
+        
+        lowest = sort_jobs(jobs, 'salary')
+        self.assertEqual([job['title'] for job in lowest], ['a', 'd', 'c', 'b'])
+        
+        by_title = sort_jobs(jobs, 'title', descending=True)
+        self.assertEqual([job['title'] for job in by_title], ['d', 'c', 'b', 'a'])
+
+
+class TestKeywordFilter(unittest.TestCase):
+    """Test cases for KeywordFilter"""
+    
+    def test_required_and_excluded_keywords(self):
+        """Test any required keyword keeps a job and any excluded one drops it"""
+        jobs = [
+            {'title': 'Python Developer', 'description': 'Build APIs'},
+            {'title': 'Sales Engineer', 'description': 'python scripting'},
+            {'title': 'Java Developer', 'description': 'Spring (boot)'},
+            {'title': 'C++ Engineer', 'description': ''},
+        ]
+        keyword_filter = KeywordFilter(['python', 'c++', '(boot)'], ['sales'])
+        self.assertEqual([job['title'] for job in keyword_filter.filter(jobs)],
+                         ['Python Developer', 'Java Developer', 'C++ Engineer'])
+
+
+@unittest.skipUnless(HAS_PANDAS, "pandas not installed")
+class TestFilterMasks(unittest.TestCase):
+    """Test the column-wise masks agree with the per-job filters"""
+    
+    def test_masks_match_filter(self):
+        """Test each mask keeps exactly the jobs filter() keeps"""
+        jobs = [
+            {'title': 'Python Developer', 'company': 'Google Inc', 'location': 'Remote',
+             'salary': '$120,000', 'job_type': 'Full-time', 'description': 'APIs'},
+            {'title': 'Sales Lead', 'company': 'BadCompany', 'location': 'Austin, TX',
+             'salary': '$80K - $100K', 'job_type': 'Part-time', 'description': 'python'},
+            {'title': 'Data Scientist', 'company': 'Meta', 'location': 'New York',
+             'salary': 'N/A', 'job_type': '', 'description': 'go and rust'},
+            {'title': 'Full-time Analyst', 'company': 'Acme', 'location': 'remote, US',
+             'salary': None, 'job_type': 'part-time contract'},
+        ]
+        filters = [
+            CompanyFilter(['google', 'meta'], ['bad']),
+            KeywordFilter(['python', 'go'], ['sales']),
+            SalaryFilter(min_salary=90000, max_salary=150000),
+            JobTypeFilter(remote_only=True),
+            JobTypeFilter(full_time_only=True),
+        ]
+        for job_filter in filters:
+            masked = [job for job, keep in zip(jobs, job_filter.mask(jobs)) if keep]
+            self.assertEqual(masked, job_filter.filter(jobs), type(job_filter).__name__)
+
+
+class TestFilterPipeline(unittest.TestCase):
+    """Test cases for FilterPipeline"""
+    
+    def test_matches_filters_applied_in_sequence(self):
+        """Test the pipeline keeps the same jobs as calling each filter in turn"""
+        jobs = [
+            {'title': 'Python Developer', 'company': 'Acme', 'job_type': 'Full-time'},
+            {'title': 'Python Developer', 'company': 'Acme', 'job_type': 'Full-time'},
+            {'title': 'Sales Rep', 'company': 'Acme', 'job_type': 'Full-time'},
+            {'title': 'Python Tutor', 'company': 'BadCorp', 'job_type': 'Part-time'},
+            {'title': 'Data Engineer', 'company': 'Globex', 'job_type': ''},
+        ]
+        filters = [
+            CompanyFilter(exclude_companies=['badcorp']),
+            DuplicateRemover(similarity_threshold=0.9),
+            JobTypeFilter(full_time_only=True),
+            KeywordFilter(['python', 'data'], ['sales']),
+        ]
+        pipeline = FilterPipeline()
+        expected = jobs
+        for job_filter in filters:
+            pipeline.add_filter(job_filter)
+            expected = job_filter.filter(expected)
+        
+        self.assertEqual(pipeline.apply_filters(jobs), expected)
+        self.assertEqual(pipeline.get_pipeline_stats()['KeywordFilter']['final_count'], 2)
+
+
+class TestGetMainFilter(unittest.TestCase):
+    """Test cases for get_main_filter"""
+    
+    def test_filters_for_equal_configs_are_independent(self):
+        """Test filter_jobs() with another config doesn't change filters handed out later"""
+        jobs = [
+            {'title': 'Python Developer', 'company': 'Acme'},
+            {'title': 'Java Developer', 'company': 'Acme'},
+        ]
+        config = {'keywords': ['python']}
+        other_config = {'keywords': ['developer']}
+        
+        self.assertEqual(len(get_main_filter(config).filter_jobs(jobs, other_config)), 2)
+        self.assertEqual(len(get_main_filter(config).filter(jobs)), 1)
+        self.assertEqual(len(filter_jobs_by_criteria(jobs, config)), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -3,11 +3,6 @@ Tests for the ScraperManager class
 """
 
 import unittest
-import sys
-import os
-
-# Add parent directory to path for imports
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from manager.scraper_manager import ScraperManager
 
@@ -15,9 +10,18 @@ from manager.scraper_manager import ScraperManager
 class TestScraperManager(unittest.TestCase):
     """Test cases for ScraperManager"""
     
+    @classmethod
+    def setUpClass(cls):
+        """Set up one manager for all tests"""
+        cls.manager = ScraperManager(max_workers=2, default_delay=1.0)
+    
+    @classmethod
+    def tearDownClass(cls):
+        cls.manager.close()
+    
     def setUp(self):
-        """Set up test fixtures"""
-        self.manager = ScraperManager(max_workers=2, default_delay=1.0)
+        """Start every test from empty statistics"""
+        self.manager.reset_stats()
     
     def test_initialization(self):
         """Test manager initialization"""
@@ -62,6 +66,33 @@ class TestScraperManager(unittest.TestCase):
         reset_stats = self.manager.get_scraping_stats()
         self.assertEqual(reset_stats['total_jobs'], 0)
         self.assertEqual(len(reset_stats['jobs_by_source']), 0)
+    
+    def test_scrapers_share_rate_limiter(self):
+        """Test every scraper paces its requests through the manager's limiter"""
+        for scraper in self.manager.scrapers.values():
+            self.assertIs(scraper.rate_limiter, self.manager.rate_limiter)
+        
+        limiter = self.manager.rate_limiter
+        limiter.acquire('example.com')
+        tokens, _ = limiter._buckets['example.com']
+        self.assertLess(tokens, 1)  # a second request to the host would wait
+        self.assertNotIn('example.org', limiter._buckets)  # other hosts are unaffected
+    
+    def test_scrapers_created_lazily(self):
+        """Test looking up one scraper doesn't create the others"""
+        with ScraperManager(max_workers=1, default_delay=1.0) as manager:
+            scrapers = manager.scrapers
+            self.assertEqual(set(scrapers), set(manager.get_available_scrapers()))
+            self.assertEqual(manager._instances, {})
+            
+            indeed = scrapers['indeed']
+            self.assertEqual(list(manager._instances), ['indeed'])
+            self.assertIs(scrapers['indeed'], indeed)
+            
+            with self.assertRaises(TypeError):
+                scrapers['custom'] = indeed
+            with self.assertRaises(KeyError):
+                scrapers['missing']
 
 
 if __name__ == '__main__':
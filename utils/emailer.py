@@ -4,19 +4,298 @@ Email service for sending job recommendations.
 
 import smtplib
 import ssl
-from email.mime.multipart import MIMEMultipart
-from email.mime.text import MIMEText
-from email.mime.base import MIMEBase
-from email import encoders
+from email import policy
+from email.message import EmailMessage, MIMEPart
+from email.utils import parseaddr
+import base64
+import functools
 import os
-from typing import List, Dict, Optional
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Optional, Tuple
 from datetime import datetime
 import logging
+from html import escape
+
+try:
+    import dns.exception
+    import dns.resolver
+    HAS_DNSPYTHON = True
+except ImportError:
+    HAS_DNSPYTHON = False
+
+
+# Report stylesheet, as one compact rule per line to keep the message small
+# (Gmail clips messages over ~100KB). Hover effects and transitions are left
+# out since email clients ignore them.
+_CSS_BLOCK = """\
+body { font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif; margin: 0; padding: 20px; background-color: #f5f5f5; line-height: 1.6; }
+.container { max-width: 800px; margin: 0 auto; background-color: white; border-radius: 10px; box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1); overflow: hidden; }
+.header { background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); color: white; padding: 30px; text-align: center; }
+.header h1 { margin: 0; font-size: 28px; }
+.header p { margin: 10px 0 0 0; opacity: 0.9; }
+.summary { background-color: #f8f9fa; padding: 25px; margin: 0; border-left: 4px solid #667eea; }
+.summary h2 { margin: 0 0 15px 0; color: #333; }
+.summary ul { margin: 0; padding-left: 20px; }
+.summary li { margin: 8px 0; }
+.job-card { border: 1px solid #e0e0e0; margin: 0 20px 20px 20px; padding: 25px; border-radius: 8px; background-color: white; }
+.job-header { display: flex; justify-content: space-between; align-items: flex-start; }
+.job-title { color: #2c5aa0; font-size: 20px; font-weight: 600; margin: 0; text-decoration: none; }
+.company { color: #555; font-size: 16px; margin: 8px 0; font-weight: 500; }
+.location { color: #777; font-size: 14px; margin: 5px 0; }
+.posted-date { color: #999; font-size: 12px; margin: 10px 0; }
+.job-meta { margin: 15px 0; }
+.job-link { margin-top: 15px; }
+.job-link a { display: inline-block; background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); color: white; padding: 10px 20px; border-radius: 5px; text-decoration: none; font-weight: 500; }
+.experience-badge { display: inline-block; padding: 5px 12px; border-radius: 15px; font-size: 12px; color: white; margin: 8px 8px 8px 0; font-weight: 500; }
+.entry { background: linear-gradient(135deg, #28a745, #20c997); }
+.mid { background: linear-gradient(135deg, #ffc107, #fd7e14); color: #333; }
+.senior { background: linear-gradient(135deg, #dc3545, #e83e8c); }
+.score { background: linear-gradient(135deg, #17a2b8, #6f42c1); color: white; padding: 8px 15px; border-radius: 20px; font-size: 14px; font-weight: 600; text-align: center; min-width: 60px; }
+.footer { padding: 30px; background-color: #f8f9fa; text-align: center; border-top: 1px solid #e0e0e0; }
+.footer p { margin: 5px 0; color: #666; }
+.no-jobs { text-align: center; padding: 60px 30px; color: #666; }
+.no-jobs h2 { color: #999; }
+@media (max-width: 600px) {
+    .container { margin: 10px; }
+    .job-header { flex-direction: column; }
+    .score { margin-top: 10px; }
+}
+"""
+
+
+@functools.lru_cache(maxsize=None)
+def _ssl_context() -> ssl.SSLContext:
+    """TLS context shared by all connections, so the CA store is loaded once"""
+    return ssl.create_default_context()
+
+
+@functools.lru_cache(maxsize=1024)
+def _domain_accepts_mail(domain: str) -> bool:
+    """
+    Check DNS for a mail server for a domain (MX, or A/AAAA as the implicit MX).
+    
+    Only a definite answer that the domain or all three records don't exist
+    counts as undeliverable; without dnspython, or when the lookup itself
+    fails, the domain is assumed to accept mail.
+    
+    Args:
+        domain: Lowercased domain name
+        
+    Returns:
+        False if the domain can't receive mail, True otherwise
+    """
+    if not HAS_DNSPYTHON:
+        return True
+    for rdtype in ('MX', 'A', 'AAAA'):
+        try:
+            dns.resolver.resolve(domain, rdtype, lifetime=5)
+            return True
+        except dns.resolver.NXDOMAIN:
+            return False
+        except dns.resolver.NoAnswer:
+            continue
+        except dns.exception.DNSException:
+            return True
+    return False
+
+
+def _is_deliverable(recipient: str) -> bool:
+    """
+    Cheap preflight check of a recipient address: syntax, then DNS (cached per domain).
+    
+    Args:
+        recipient: Email address, optionally with a display name
+        
+    Returns:
+        False if mail to the address is certain to bounce, True otherwise
+    """
+    _, address = parseaddr(recipient)
+    local, at, domain = address.rpartition('@')
+    if not at or not local or '.' not in domain.strip('.') or any(c.isspace() for c in address):
+        return False
+    return _domain_accepts_mail(domain.lower())
+
+
+def _minify_html(markup: str) -> str:
+    """
+    Strip source indentation and blank lines from an HTML template.
+    
+    Args:
+        markup: HTML template
+        
+    Returns:
+        Same markup with each line's leading whitespace removed
+    """
+    return re.sub(r'^\s+', '', markup, flags=re.MULTILINE)
+
+
+# Report templates, built once at import; create_job_report_html() only
+# fills in the fields. Values are HTML-escaped before formatting. Their
+# indentation is stripped, which is most of a 25-card report's whitespace.
+_REPORT_HEAD_TEMPLATE = _minify_html("""\
+<!DOCTYPE html>
+<html>
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <style>
+{css}    </style>
+</head>
+<body>
+    <div class="container">
+        <div class="header">
+            <h1>🎯 Your Personalized Job Recommendations</h1>
+            <p>Generated on {generated}</p>
+        </div>
+
+        <div class="summary">
+            <h2>📊 Summary</h2>
+            <ul>
+                <li><strong>Total Jobs Found:</strong> {total}</li>
+                <li><strong>Search Criteria:</strong> {job_titles}</li>
+                <li><strong>Locations:</strong> {locations}</li>
+                <li><strong>Experience Levels:</strong> {experience_levels}</li>
+                <li><strong>Sites Searched:</strong> {sites}</li>
+            </ul>
+        </div>
+""")
+
+_JOB_CARD_TEMPLATE = _minify_html("""\
+        <div class="job-card">
+            <div class="job-header">
+                <div>
+                    <a href="{link}" class="job-title">{title}</a>
+                    <div class="company">🏢 {company}</div>
+                    <div class="location">📍 {location}</div>
+                </div>
+                <div class="score">Match: {score:.1f}%</div>
+            </div>
+
+            <div class="job-meta">
+                <span class="experience-badge {experience}">{experience_title} Level</span>
+                <div class="posted-date">📅 Posted: {posted_date} | Source: {source}</div>
+            </div>
+
+            <div class="job-link">
+                <a href="{link}" target="_blank">🔗 View Job Details</a>
+            </div>
+        </div>
+""")
+
+_NO_JOBS_HTML = _minify_html("""\
+        <div class="no-jobs">
+            <h2>😔 No jobs found matching your criteria</h2>
+            <p>Try adjusting your search parameters or check back later!</p>
+        </div>
+""")
+
+_REPORT_FOOTER_HTML = _minify_html("""\
+        <div class="footer">
+            <p><strong>Happy job hunting! 🎉</strong></p>
+            <p style="font-size: 12px; color: #999;">
+                This is an automated job recommendation email generated by your Job Recommender System.
+            </p>
+        </div>
+    </div>
+</body>
+</html>
+""")
+
+# Stylesheet rules the empty-state page uses
+_EMPTY_CSS_SELECTORS = {
+    'body', '.container', '.header', '.header h1', '.no-jobs', '.no-jobs h2',
+    '.footer', '.footer p',
+}
+
+# Complete page sent when a search found nothing: no summary or job cards,
+# so it's built once here rather than rendered per send
+_EMPTY_HTML = _minify_html("""\
+<!DOCTYPE html>
+<html>
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <style>
+""") + ''.join(
+    line + '\n' for line in _CSS_BLOCK.splitlines()
+    if line.split(' {')[0] in _EMPTY_CSS_SELECTORS
+) + _minify_html("""\
+    </style>
+</head>
+<body>
+    <div class="container">
+        <div class="header">
+            <h1>🎯 Your Personalized Job Recommendations</h1>
+        </div>
+""") + _NO_JOBS_HTML + _REPORT_FOOTER_HTML
+
+
+# Preferences listed in the report summary, with the text shown when unset
+_SUMMARY_PREFS = (
+    ('job_titles', 'Any'),
+    ('locations', 'Any'),
+    ('experience_levels', 'All'),
+    ('sites_to_scrape', ''),
+)
+
+
+@functools.lru_cache(maxsize=64)
+def _render_report(generated: str, total: int, prefs_key: Tuple[str, ...],
+                   jobs_key: Tuple[Tuple, ...]) -> str:
+    """
+    Render the report page; cached so bulk sends of the same jobs render once.
+    
+    Args:
+        generated: Formatted generation timestamp
+        total: Total number of jobs found
+        prefs_key: Joined job titles, locations, experience levels and sites
+        jobs_key: Displayed fields of each job card, in template order
+        
+    Returns:
+        HTML page
+    """
+    job_titles, locations, experience_levels, sites = prefs_key
+    head = _REPORT_HEAD_TEMPLATE.format(
+        css=_CSS_BLOCK,
+        generated=generated,
+        total=total,
+        job_titles=escape(job_titles),
+        locations=escape(locations),
+        experience_levels=escape(experience_levels),
+        sites=escape(sites),
+    )
+    
+    cards = ''.join(
+        _JOB_CARD_TEMPLATE.format(
+            link=escape(link),
+            title=escape(title),
+            company=escape(company),
+            location=escape(location),
+            score=score,
+            experience=escape(experience),
+            experience_title=escape(experience.title()),
+            posted_date=escape(posted_date),
+            source=escape(source),
+        )
+        for link, title, company, location, score, experience, posted_date, source in jobs_key
+    )
+    return head + cards + _REPORT_FOOTER_HTML
 
 
 class EmailService:
     """Professional email service for job recommendations"""
     
+    # Larger attachments are skipped rather than base64-encoded into the message
+    MAX_ATTACH_BYTES = 10 * 1024 * 1024
+    
+    # Bulk sends stop once at least a third of ABORT_MIN_SENDS or more sends
+    # have failed: that points at auth, quota or blocklisting problems, and
+    # retrying the rest only risks the sender account
+    ABORT_MIN_SENDS = 30
+    ABORT_FAILURE_RATIO = 1 / 3
+    
     def __init__(self, smtp_server: str, smtp_port: int, sender_email: str, 
                  sender_password: str, use_tls: bool = True):
         """
@@ -35,215 +314,210 @@ class EmailService:
         self.sender_password = sender_password
         self.use_tls = use_tls
         self.logger = logging.getLogger(self.__class__.__name__)
+        
+        # Logged-in SMTP connection reused across sends (opened on first use)
+        self._smtp: Optional[smtplib.SMTP] = None
+        self._smtp_lock = threading.Lock()
     
-    def create_job_report_html(self, jobs: List[Dict], user_preferences: Optional[Dict] = None) -> str:
-        """Create beautiful HTML email content with job recommendations"""
-        prefs = user_preferences or {}
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
+    def _connect(self) -> smtplib.SMTP:
+        """Open a new SMTP connection, with STARTTLS if enabled, and log in"""
+        server = smtplib.SMTP(self.smtp_server, self.smtp_port)
+        try:
+            if self.use_tls:
+                server.starttls(context=_ssl_context())
+            server.login(self.sender_email, self.sender_password)
+        except Exception:
+            server.close()
+            raise
+        return server
+    
+    def _get_server(self) -> smtplib.SMTP:
+        """
+        Get the cached SMTP connection, reconnecting if the server dropped it.
         
-        html_content = f"""
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <meta charset="UTF-8">
-            <meta name="viewport" content="width=device-width, initial-scale=1.0">
-            <style>
-                body {{ 
-                    font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif; 
-                    margin: 0; 
-                    padding: 20px; 
-                    background-color: #f5f5f5;
-                    line-height: 1.6;
-                }}
-                .container {{ 
-                    max-width: 800px; 
-                    margin: 0 auto; 
-                    background-color: white; 
-                    border-radius: 10px;
-                    box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1);
-                    overflow: hidden;
-                }}
-                .header {{ 
-                    background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-                    color: white; 
-                    padding: 30px; 
-                    text-align: center; 
-                }}
-                .header h1 {{ margin: 0; font-size: 28px; }}
-                .header p {{ margin: 10px 0 0 0; opacity: 0.9; }}
-                
-                .summary {{ 
-                    background-color: #f8f9fa; 
-                    padding: 25px; 
-                    margin: 0;
-                    border-left: 4px solid #667eea;
-                }}
-                .summary h2 {{ margin: 0 0 15px 0; color: #333; }}
-                .summary ul {{ margin: 0; padding-left: 20px; }}
-                .summary li {{ margin: 8px 0; }}
-                
-                .job-card {{ 
-                    border: 1px solid #e0e0e0; 
-                    margin: 0 20px 20px 20px; 
-                    padding: 25px; 
-                    border-radius: 8px;
-                    background-color: white;
-                    transition: box-shadow 0.3s ease;
-                }}
-                .job-card:hover {{ box-shadow: 0 4px 12px rgba(0, 0, 0, 0.1); }}
-                
-                .job-header {{ display: flex; justify-content: space-between; align-items: flex-start; }}
-                .job-title {{ 
-                    color: #2c5aa0; 
-                    font-size: 20px; 
-                    font-weight: 600; 
-                    margin: 0;
-                    text-decoration: none;
-                }}
-                .job-title:hover {{ text-decoration: underline; }}
-                
-                .company {{ 
-                    color: #555; 
-                    font-size: 16px; 
-                    margin: 8px 0; 
-                    font-weight: 500;
-                }}
-                .location {{ 
-                    color: #777; 
-                    font-size: 14px;
-                    margin: 5px 0;
-                }}
-                .posted-date {{ 
-                    color: #999; 
-                    font-size: 12px; 
-                    margin: 10px 0;
-                }}
-                
-                .job-meta {{ margin: 15px 0; }}
-                .job-link {{ margin-top: 15px; }}
-                .job-link a {{ 
-                    display: inline-block;
-                    background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-                    color: white;
-                    padding: 10px 20px;
-                    border-radius: 5px;
-                    text-decoration: none;
-                    font-weight: 500;
-                    transition: transform 0.2s ease;
-                }}
-                .job-link a:hover {{ transform: translateY(-2px); }}
-                
-                .experience-badge {{ 
-                    display: inline-block; 
-                    padding: 5px 12px; 
-                    border-radius: 15px; 
-                    font-size: 12px; 
-                    color: white; 
-                    margin: 8px 8px 8px 0; 
-                    font-weight: 500;
-                }}
-                .entry {{ background: linear-gradient(135deg, #28a745, #20c997); }}
-                .mid {{ background: linear-gradient(135deg, #ffc107, #fd7e14); color: #333; }}
-                .senior {{ background: linear-gradient(135deg, #dc3545, #e83e8c); }}
-                
-                .score {{ 
-                    background: linear-gradient(135deg, #17a2b8, #6f42c1);
-                    color: white; 
-                    padding: 8px 15px; 
-                    border-radius: 20px; 
-                    font-size: 14px; 
-                    font-weight: 600;
-                    text-align: center;
-                    min-width: 60px;
-                }}
-                
-                .footer {{ 
-                    padding: 30px; 
-                    background-color: #f8f9fa; 
-                    text-align: center; 
-                    border-top: 1px solid #e0e0e0;
-                }}
-                .footer p {{ margin: 5px 0; color: #666; }}
-                
-                .no-jobs {{ 
-                    text-align: center; 
-                    padding: 60px 30px; 
-                    color: #666;
-                }}
-                .no-jobs h2 {{ color: #999; }}
-                
-                @media (max-width: 600px) {{
-                    .container {{ margin: 10px; }}
-                    .job-header {{ flex-direction: column; }}
-                    .score {{ margin-top: 10px; }}
-                }}
-            </style>
-        </head>
-        <body>
-            <div class="container">
-                <div class="header">
-                    <h1>🎯 Your Personalized Job Recommendations</h1>
-                    <p>Generated on {datetime.now().strftime('%B %d, %Y at %I:%M %p')}</p>
-                </div>
-                
-                <div class="summary">
-                    <h2>📊 Summary</h2>
-                    <ul>
-                        <li><strong>Total Jobs Found:</strong> {len(jobs)}</li>
-                        <li><strong>Search Criteria:</strong> {', '.join(prefs.get('job_titles', ['Any']))}</li>
-                        <li><strong>Locations:</strong> {', '.join(prefs.get('locations', ['Any']))}</li>
-                        <li><strong>Experience Levels:</strong> {', '.join(prefs.get('experience_levels', ['All']))}</li>
-                        <li><strong>Sites Searched:</strong> {', '.join(prefs.get('sites_to_scrape', []))}</li>
-                    </ul>
-                </div>
+        Returns:
+            Logged-in SMTP connection
+        """
+        if self._smtp is not None:
+            try:
+                self._smtp.noop()
+                return self._smtp
+            except OSError:  # SMTPException, or the socket itself failing
+                self._smtp.close()
+                self._smtp = None
+        self._smtp = self._connect()
+        return self._smtp
+    
+    def close(self):
+        """Close the cached SMTP connection, if any"""
+        with self._smtp_lock:
+            if self._smtp is None:
+                return
+            try:
+                self._smtp.quit()
+            except OSError:
+                self._smtp.close()
+            self._smtp = None
+    
+    def create_job_report_html(self, jobs: List[Dict], user_preferences: Optional[Dict] = None,
+                               now_formatted: Optional[str] = None) -> str:
         """
+        Create beautiful HTML email content with job recommendations.
         
+        Args:
+            jobs: List of job dictionaries
+            user_preferences: User preferences for personalization
+            now_formatted: Generation timestamp to show (default: formatted now)
+            
+        Returns:
+            HTML page
+        """
         if not jobs:
-            html_content += """
-                <div class="no-jobs">
-                    <h2>😔 No jobs found matching your criteria</h2>
-                    <p>Try adjusting your search parameters or check back later!</p>
-                </div>
-            """
+            return _EMPTY_HTML
+        
+        prefs = user_preferences or {}
+        
+        # Key the cached render on exactly what the page shows; the timestamp
+        # has minute resolution, so repeat sends within a minute are cache hits
+        prefs_key = tuple(
+            ', '.join(prefs[key]) if key in prefs else default
+            for key, default in _SUMMARY_PREFS
+        )
+        jobs_key = tuple(
+            (str(job.get('link', '#')), str(job.get('title', 'N/A')),
+             str(job.get('company', 'N/A')), str(job.get('location', 'N/A')),
+             job.get('recommendation_score', 0), job.get('experience_level', 'unknown'),
+             str(job.get('posted_date', 'N/A')), str(job.get('source', 'N/A')))
+            for job in jobs[:25]  # Limit to top 25 jobs
+        )
+        if now_formatted is None:
+            now_formatted = datetime.now().strftime('%B %d, %Y at %I:%M %p')
+        return _render_report(now_formatted, len(jobs), prefs_key, jobs_key)
+    
+    @staticmethod
+    def _encode_file_base64(file_path: str) -> str:
+        """
+        Base64-encode a file chunk by chunk, without reading it whole.
+        
+        Args:
+            file_path: Path of the file to encode
+            
+        Returns:
+            Base64 text in 76-character lines
+        """
+        lines = []
+        with open(file_path, "rb") as attachment:
+            # Multiple of 57 bytes, so each chunk encodes to whole 76-char lines
+            for chunk in iter(lambda: attachment.read(57 * 1024), b''):
+                lines.append(base64.encodebytes(chunk).decode('ascii'))
+        return ''.join(lines)
+    
+    def _build_message(self, recipient_email: str, jobs: List[Dict],
+                       user_preferences: Optional[Dict] = None,
+                       attach_files: Optional[List[str]] = None) -> EmailMessage:
+        """
+        Build the recommendation email for one recipient.
+        
+        Args:
+            recipient_email: Recipient's email address
+            jobs: List of job dictionaries
+            user_preferences: User preferences for personalization
+            attach_files: List of file paths to attach
+            
+        Returns:
+            Message ready to send
+        """
+        # One timestamp for the whole message, so its parts can't disagree
+        now = datetime.now()
+        date_short = now.strftime('%B %d, %Y')
+        
+        # Create message
+        msg = EmailMessage(policy=policy.SMTP)
+        msg['From'] = self.sender_email
+        msg['To'] = recipient_email
+        if jobs:
+            msg['Subject'] = f"🎯 {len(jobs)} New Job Recommendations - {date_short}"
         else:
-            for i, job in enumerate(jobs[:25], 1):  # Limit to top 25 jobs
-                experience = job.get('experience_level', 'unknown')
-                score = job.get('recommendation_score', 0)
-                
-                html_content += f"""
-                <div class="job-card">
-                    <div class="job-header">
-                        <div>
-                            <a href="{job.get('link', '#')}" class="job-title">{job.get('title', 'N/A')}</a>
-                            <div class="company">🏢 {job.get('company', 'N/A')}</div>
-                            <div class="location">📍 {job.get('location', 'N/A')}</div>
-                        </div>
-                        <div class="score">Match: {score:.1f}%</div>
-                    </div>
+            msg['Subject'] = f"No New Job Recommendations - {date_short}"
+        
+        # Create HTML content
+        html_content = self.create_job_report_html(
+            jobs, user_preferences, now.strftime('%B %d, %Y at %I:%M %p'))
+        
+        # Plain text version (fallback)
+        text_content = f"""
+Job Recommendations - {date_short}
+
+Found {len(jobs)} job recommendations for you:
+
+"""
+        text_content += ''.join(
+            f"\n{i}. {job.get('title', 'N/A')}\n"
+            f"   Company: {job.get('company', 'N/A')}\n"
+            f"   Location: {job.get('location', 'N/A')}\n"
+            f"   Link: {job.get('link', 'N/A')}\n\n"
+            for i, job in enumerate(jobs[:10], 1)
+        )
+        
+        # Email body: plain text, with the HTML report as the preferred alternative
+        msg.set_content(text_content)
+        msg.add_alternative(html_content, subtype='html')
+        
+        # Attach files if provided
+        if attach_files:
+            for file_path in attach_files:
+                if os.path.exists(file_path):
+                    size = os.path.getsize(file_path)
+                    if size > self.MAX_ATTACH_BYTES:
+                        self.logger.warning(
+                            "Skipping attachment %s: %d bytes exceeds the %d byte limit",
+                            file_path, size, self.MAX_ATTACH_BYTES
+                        )
+                        continue
                     
-                    <div class="job-meta">
-                        <span class="experience-badge {experience}">{experience.title()} Level</span>
-                        <div class="posted-date">📅 Posted: {job.get('posted_date', 'N/A')} | Source: {job.get('source', 'N/A')}</div>
-                    </div>
+                    # Built by hand rather than with add_attachment() so the
+                    # file is base64-encoded in chunks, not read whole
+                    part = MIMEPart(policy=policy.SMTP)
+                    part['Content-Type'] = 'application/octet-stream'
+                    part['Content-Transfer-Encoding'] = 'base64'
+                    part.add_header('Content-Disposition', 'attachment',
+                                    filename=os.path.basename(file_path))
+                    part.set_payload(self._encode_file_base64(file_path))
                     
-                    <div class="job-link">
-                        <a href="{job.get('link', '#')}" target="_blank">🔗 View Job Details</a>
-                    </div>
-                </div>
-                """
-        
-        html_content += """
-                <div class="footer">
-                    <p><strong>Happy job hunting! 🎉</strong></p>
-                    <p style="font-size: 12px; color: #999;">
-                        This is an automated job recommendation email generated by your Job Recommender System.
-                    </p>
-                </div>
-            </div>
-        </body>
-        </html>
+                    if msg.get_content_subtype() != 'mixed':
+                        msg.make_mixed()
+                    msg.attach(part)
+        
+        return msg
+    
+    def _send(self, msg: EmailMessage, to_addrs: Optional[List[str]] = None) -> Dict:
         """
+        Send a message over the cached connection.
+        
+        Connect, STARTTLS and login happen once per service, not once per message.
         
-        return html_content
+        Args:
+            msg: Message to send
+            to_addrs: Envelope recipients (default: taken from the headers)
+            
+        Returns:
+            Dictionary of refused recipients, as returned by send_message
+        """
+        with self._smtp_lock:
+            try:
+                return self._get_server().send_message(msg, to_addrs=to_addrs)
+            except smtplib.SMTPServerDisconnected:
+                # Dropped between the health check and the send; retry once
+                if self._smtp is not None:
+                    self._smtp.close()
+                    self._smtp = None
+                return self._get_server().send_message(msg, to_addrs=to_addrs)
     
     def send_job_recommendations(self, recipient_email: str, jobs: List[Dict], 
                                user_preferences: Optional[Dict] = None, 
@@ -260,86 +534,196 @@ class EmailService:
         Returns:
             True if email sent successfully, False otherwise
         """
+        if not _is_deliverable(recipient_email):
+            self.logger.warning("Skipping undeliverable address %s", recipient_email)
+            return False
+        
         try:
-            # Create message
-            msg = MIMEMultipart('mixed')
-            msg['From'] = self.sender_email
-            msg['To'] = recipient_email
-            msg['Subject'] = f"🎯 {len(jobs)} New Job Recommendations - {datetime.now().strftime('%B %d, %Y')}"
+            msg = self._build_message(recipient_email, jobs, user_preferences, attach_files)
+            self._send(msg)
             
-            # Create HTML content
-            html_content = self.create_job_report_html(jobs, user_preferences)
-            
-            # Create alternative part for email body
-            msg_alternative = MIMEMultipart('alternative')
+            self.logger.info("Job recommendations sent successfully to %s", recipient_email)
+            return True
             
-            # Plain text version (fallback)
-            text_content = f"""
-Job Recommendations - {datetime.now().strftime('%B %d, %Y')}
-
-Found {len(jobs)} job recommendations for you:
-
-"""
-            for i, job in enumerate(jobs[:10], 1):
-                text_content += f"""
-{i}. {job.get('title', 'N/A')}
-   Company: {job.get('company', 'N/A')}
-   Location: {job.get('location', 'N/A')}
-   Link: {job.get('link', 'N/A')}
-
-"""
+        except Exception as e:
+            self.logger.error("Error sending email to %s: %s", recipient_email, e)
+            return False
+    
+    def _failure_rate_exceeded(self, failures: int, total: int) -> bool:
+        """Whether enough sends have failed that a bulk send should stop"""
+        return total >= self.ABORT_MIN_SENDS and failures >= total * self.ABORT_FAILURE_RATIO
+    
+    def send_to_many(self, recipients: List[str], jobs: List[Dict],
+                     user_preferences: Optional[Dict] = None,
+                     attach_files: Optional[List[str]] = None,
+                     batch_size: int = 100) -> Dict[str, bool]:
+        """
+        Send the same job recommendations to many recipients at once.
+        
+        The message is built once and sent as a Bcc with one SMTP transaction
+        per batch_size recipients (servers cap recipients per message), so
+        the body goes over the wire once per batch instead of once per
+        recipient. Use send_bulk() when recipients get different jobs.
+        
+        Args:
+            recipients: Recipient email addresses
+            jobs: List of job dictionaries
+            user_preferences: User preferences for personalization
+            attach_files: List of file paths to attach
+            batch_size: Maximum recipients per SMTP transaction
             
-            text_part = MIMEText(text_content, 'plain')
-            html_part = MIMEText(html_content, 'html')
+        Returns:
+            Dictionary mapping recipient addresses to whether the server accepted
+            them (False for undeliverable addresses and for recipients skipped
+            after too many failures)
+        """
+        results = dict.fromkeys(recipients, False)
+        deliverable = [recipient for recipient in recipients if _is_deliverable(recipient)]
+        if len(deliverable) < len(recipients):
+            self.logger.warning("Skipping %d undeliverable addresses",
+                                len(recipients) - len(deliverable))
+        
+        failures = 0
+        try:
+            # Addressed to the sender; recipients only appear in the envelope
+            msg = self._build_message(self.sender_email, jobs, user_preferences, attach_files)
+        except Exception as e:
+            self.logger.error("Error building email for %d recipients: %s", len(recipients), e)
+            return results
+        
+        for start in range(0, len(deliverable), batch_size):
+            batch = deliverable[start:start + batch_size]
+            try:
+                refused = self._send(msg, to_addrs=batch)
+            except smtplib.SMTPRecipientsRefused as e:
+                refused = e.recipients
+            except Exception as e:
+                self.logger.error("Error sending email to %d recipients: %s", len(batch), e)
+                refused = batch
             
-            msg_alternative.attach(text_part)
-            msg_alternative.attach(html_part)
-            msg.attach(msg_alternative)
+            for recipient in batch:
+                results[recipient] = recipient not in refused
+            self.logger.info("Job recommendations sent to %d of %d recipients",
+                             len(batch) - len(refused), len(batch))
             
-            # Attach files if provided
-            if attach_files:
-                for file_path in attach_files:
-                    if os.path.exists(file_path):
-                        with open(file_path, "rb") as attachment:
-                            part = MIMEBase('application', 'octet-stream')
-                            part.set_payload(attachment.read())
-                        
-                        encoders.encode_base64(part)
-                        filename = os.path.basename(file_path)
-                        part.add_header(
-                            'Content-Disposition',
-                            f'attachment; filename= {filename}',
-                        )
-                        msg.attach(part)
+            failures += len(refused)
+            total = start + len(batch)
+            if self._failure_rate_exceeded(failures, total):
+                self.logger.error("Aborting send: %d of %d recipients failed, skipping %d",
+                                  failures, total, len(deliverable) - total)
+                break
+        
+        return results
+    
+    def send_bulk(self, jobs_by_recipient: Dict[str, List[Dict]],
+                  user_preferences: Optional[Dict] = None, pool_size: int = 5,
+                  max_per_connection: int = 100) -> Dict[str, bool]:
+        """
+        Send job recommendations to many recipients over parallel connections.
+        
+        Messages are built up front, then sent by pool_size worker threads,
+        each with its own SMTP connection that is reopened after
+        max_per_connection messages (providers cap messages per connection).
+        Sending stops early if too many messages fail.
+        
+        Args:
+            jobs_by_recipient: Jobs to send, by recipient email address
+            user_preferences: User preferences for personalization
+            pool_size: Number of concurrent SMTP connections
+            max_per_connection: Messages sent before a connection is reopened
             
-            # Send email
-            context = ssl.create_default_context()
-            with smtplib.SMTP(self.smtp_server, self.smtp_port) as server:
-                if self.use_tls:
-                    server.starttls(context=context)
-                server.login(self.sender_email, self.sender_password)
-                server.send_message(msg)
+        Returns:
+            Dictionary mapping recipient addresses to whether their email was sent
+            (False for undeliverable addresses and for recipients skipped after
+            too many failures)
+        """
+        results = dict.fromkeys(jobs_by_recipient, False)
+        messages = []
+        for recipient, jobs in jobs_by_recipient.items():
+            if _is_deliverable(recipient):
+                messages.append((recipient, self._build_message(recipient, jobs, user_preferences)))
+            else:
+                self.logger.warning("Skipping undeliverable address %s", recipient)
+        if not messages:
+            return results
+        
+        local = threading.local()  # Each worker's connection and its message count
+        opened = []
+        opened_lock = threading.Lock()
+        counts = {'failures': 0, 'total': 0}
+        counts_lock = threading.Lock()
+        aborted = threading.Event()
+        
+        def reconnect() -> smtplib.SMTP:
+            old = getattr(local, 'server', None)
+            # Cleared first, so a failed connect below leaves the worker to
+            # retry on its next message rather than reuse the closed server
+            local.server = None
+            if old is not None:
+                try:
+                    old.quit()
+                except OSError:
+                    old.close()
+                with opened_lock:
+                    if old in opened:
+                        opened.remove(old)
+            local.server, local.sent = self._connect(), 0
+            with opened_lock:
+                opened.append(local.server)
+            return local.server
+        
+        def send(item) -> bool:
+            recipient, msg = item
+            if aborted.is_set():
+                return False
             
-            self.logger.info(f"Job recommendations sent successfully to {recipient_email}")
-            return True
+            try:
+                server = getattr(local, 'server', None)
+                if server is None or local.sent >= max_per_connection:
+                    server = reconnect()
+                try:
+                    server.send_message(msg)
+                except smtplib.SMTPServerDisconnected:
+                    reconnect().send_message(msg)
+                local.sent += 1
+                self.logger.info("Job recommendations sent successfully to %s", recipient)
+                sent = True
+            except Exception as e:
+                self.logger.error("Error sending email to %s: %s", recipient, e)
+                sent = False
             
-        except Exception as e:
-            self.logger.error(f"Error sending email to {recipient_email}: {e}")
-            return False
+            with counts_lock:
+                counts['total'] += 1
+                counts['failures'] += not sent
+                if (not aborted.is_set()
+                        and self._failure_rate_exceeded(counts['failures'], counts['total'])):
+                    aborted.set()
+                    self.logger.error("Aborting bulk send: %d of %d emails failed",
+                                      counts['failures'], counts['total'])
+            return sent
+        
+        try:
+            with ThreadPoolExecutor(max_workers=min(pool_size, len(messages))) as executor:
+                sent = list(executor.map(send, messages))
+        finally:
+            for server in opened:
+                try:
+                    server.quit()
+                except OSError:
+                    server.close()
+        
+        results.update((recipient, ok) for (recipient, _), ok in zip(messages, sent))
+        return results
     
     def test_connection(self) -> bool:
         """Test email server connection"""
         try:
-            context = ssl.create_default_context()
-            with smtplib.SMTP(self.smtp_server, self.smtp_port) as server:
-                if self.use_tls:
-                    server.starttls(context=context)
-                server.login(self.sender_email, self.sender_password)
+            self._connect().quit()
             
             self.logger.info("Email connection test successful")
             return True
         except Exception as e:
-            self.logger.error(f"Email connection test failed: {e}")
+            self.logger.error("Email connection test failed: %s", e)
             return False
 
 
@@ -23,6 +23,20 @@ try:
 except ImportError:
     HAS_OPENPYXL = False
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+
+# Write buffer for CSV exports (1 MiB)
+CSV_WRITE_BUFFER = 1 << 20
+
+# Helper fields added to jobs during processing (see
+# filters.job_filter.add_posting_timestamps), left out of exports
+INTERNAL_FIELDS = frozenset({'posted_ts'})
+
 
 class BaseExporter:
     """Base class for all exporters"""
@@ -49,6 +63,14 @@ class BaseExporter:
             return [metadata_row] + data
         
         return data
+    
+    @staticmethod
+    def _strip_internal(jobs: List[Dict]) -> List[Dict]:
+        """Copies of the jobs without INTERNAL_FIELDS (the jobs themselves if none have them)"""
+        if not any(INTERNAL_FIELDS.intersection(job) for job in jobs):
+            return jobs
+        return [{key: value for key, value in job.items() if key not in INTERNAL_FIELDS}
+                for job in jobs]
 
 
 class CSVExporter(BaseExporter):
@@ -82,6 +104,7 @@ class CSVExporter(BaseExporter):
             return output_file
         
         self._ensure_directory_exists(output_file)
+        jobs = self._strip_internal(jobs)
         
         try:
             # Get all possible fieldnames from all jobs
@@ -104,7 +127,9 @@ class CSVExporter(BaseExporter):
             # Add remaining fields
             ordered_fieldnames.extend(sorted(fieldnames))
             
-            with open(output_file, 'w', newline='', encoding=self.encoding) as csvfile:
+            # Large write buffer: rows go out in few big writes instead of many small ones
+            with open(output_file, 'w', newline='', encoding=self.encoding,
+                      buffering=CSV_WRITE_BUFFER) as csvfile:
                 writer = csv.DictWriter(csvfile, fieldnames=ordered_fieldnames, 
                                       extrasaction='ignore', restval='')
                 
@@ -120,19 +145,8 @@ class CSVExporter(BaseExporter):
                     }
                     writer.writerow(metadata)
                 
-                # Write job data
-                for job in jobs:
-                    # Clean data for CSV export
-                    cleaned_job = {}
-                    for key, value in job.items():
-                        if isinstance(value, (list, dict)):
-                            cleaned_job[key] = json.dumps(value) if value else ''
-                        elif value is None:
-                            cleaned_job[key] = ''
-                        else:
-                            cleaned_job[key] = str(value)
-                    
-                    writer.writerow(cleaned_job)
+                # Write job data, cleaning one row at a time as the writer consumes it
+                writer.writerows(map(self._clean_row, jobs))
             
             self.logger.info(f"Successfully exported {len(jobs)} jobs to {output_file}")
             return output_file
@@ -141,6 +155,19 @@ class CSVExporter(BaseExporter):
             self.logger.error(f"Failed to export to CSV: {e}")
             raise
     
+    @staticmethod
+    def _clean_row(job: Dict[str, Any]) -> Dict[str, str]:
+        """Convert a job's values to CSV cells (lists/dicts as JSON, None as empty)"""
+        cleaned_job = {}
+        for key, value in job.items():
+            if isinstance(value, (list, dict)):
+                cleaned_job[key] = json.dumps(value) if value else ''
+            elif value is None:
+                cleaned_job[key] = ''
+            else:
+                cleaned_job[key] = str(value)
+        return cleaned_job
+    
     def export_to_csv(self, jobs: List[Dict[str, Any]], output_file: str) -> str:
         """Backward compatibility method"""
         return self.export(jobs, output_file)
@@ -177,6 +204,7 @@ class JSONExporter(BaseExporter):
             jobs = []
         
         self._ensure_directory_exists(output_file)
+        jobs = self._strip_internal(jobs)
         
         try:
             export_data = {
@@ -188,9 +216,14 @@ class JSONExporter(BaseExporter):
                 }
             } if include_metadata else jobs
             
-            with open(output_file, 'w', encoding='utf-8') as jsonfile:
-                json.dump(export_data, jsonfile, indent=self.indent, 
-                         ensure_ascii=False, default=str)
+            content = self._dumps_orjson(export_data) if HAS_ORJSON and self.indent == 2 else None
+            if content is not None:
+                with open(output_file, 'wb') as jsonfile:
+                    jsonfile.write(content)
+            else:
+                with open(output_file, 'w', encoding='utf-8') as jsonfile:
+                    json.dump(export_data, jsonfile, indent=self.indent, 
+                             ensure_ascii=False, default=str)
             
             self.logger.info(f"Successfully exported {len(jobs)} jobs to {output_file}")
             return output_file
@@ -199,6 +232,25 @@ class JSONExporter(BaseExporter):
             self.logger.error(f"Failed to export to JSON: {e}")
             raise
     
+    @staticmethod
+    def _dumps_orjson(data: Any) -> Optional[bytes]:
+        """
+        Serialize like json.dump(indent=2, ensure_ascii=False, default=str), but natively.
+        
+        Args:
+            data: Data to serialize
+            
+        Returns:
+            UTF-8 encoded JSON, or None if orjson can't serialize the data
+        """
+        try:
+            # Datetimes go through default=str as with json, not orjson's ISO format
+            return orjson.dumps(data, default=str,
+                                option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+                                | orjson.OPT_PASSTHROUGH_DATETIME)
+        except TypeError:
+            return None
+    
     def export_to_json(self, jobs: List[Dict[str, Any]], output_file: str) -> str:
         """Backward compatibility method"""
         return self.export(jobs, output_file)
@@ -244,7 +296,7 @@ class ExcelExporter(BaseExporter):
         
         try:
             # Convert jobs to DataFrame
-            df = pd.DataFrame(jobs)
+            df = pd.DataFrame(self._strip_internal(jobs))
             
             # Clean data for Excel export
             for col in df.columns:
@@ -2,8 +2,11 @@
 Logging utilities for the job scraper project.
 """
 
+import atexit
 import logging
 import logging.handlers
+import os
+import queue
 import sys
 from pathlib import Path
 from typing import Optional
@@ -33,8 +36,24 @@ def setup_logger(name: str,
     logger = logging.getLogger(name)
     logger.setLevel(level)
     
-    # Clear existing handlers to avoid duplicates
-    logger.handlers.clear()
+    # Keep handlers from an earlier call that still match, so calling this
+    # again (e.g. to change the level) doesn't close and reopen the log file
+    log_path = os.path.abspath(log_file) if log_file else None
+    console_handler = None
+    queue_handler = None
+    for handler in list(logger.handlers):
+        if isinstance(handler, logging.handlers.QueueHandler):
+            listener = getattr(handler, 'listener', None)
+            if (queue_handler is None and listener is not None
+                    and getattr(listener.handlers[0], 'baseFilename', None) == log_path):
+                queue_handler = handler
+                continue
+        elif (console_output and console_handler is None
+              and isinstance(handler, logging.StreamHandler) and handler.stream is sys.stdout):
+            console_handler = handler
+            continue
+        logger.removeHandler(handler)
+        _close_handler(handler)
     
     # Create formatter
     formatter = logging.Formatter(
@@ -44,31 +63,55 @@ def setup_logger(name: str,
     
     # Console handler
     if console_output:
-        console_handler = logging.StreamHandler(sys.stdout)
+        if console_handler is None:
+            console_handler = logging.StreamHandler(sys.stdout)
+            logger.addHandler(console_handler)
         console_handler.setLevel(level)
         console_handler.setFormatter(formatter)
-        logger.addHandler(console_handler)
     
-    # File handler
+    # File handler, written from a background thread: the logger only
+    # queues records, so callers never wait on file writes or rotation
     if log_file:
-        # Ensure log directory exists
-        log_path = Path(log_file)
-        log_path.parent.mkdir(parents=True, exist_ok=True)
-        
-        # Use rotating file handler to manage log file size
-        file_handler = logging.handlers.RotatingFileHandler(
-            log_file,
-            maxBytes=max_size_mb * 1024 * 1024,  # Convert MB to bytes
-            backupCount=backup_count,
-            encoding='utf-8'
-        )
+        if queue_handler is None:
+            # Ensure log directory exists
+            Path(log_file).parent.mkdir(parents=True, exist_ok=True)
+            
+            # Use rotating file handler to manage log file size
+            file_handler = logging.handlers.RotatingFileHandler(
+                log_file,
+                maxBytes=max_size_mb * 1024 * 1024,  # Convert MB to bytes
+                backupCount=backup_count,
+                encoding='utf-8'
+            )
+            queue_handler = logging.handlers.QueueHandler(queue.SimpleQueue())
+            queue_handler.listener = logging.handlers.QueueListener(
+                queue_handler.queue, file_handler, respect_handler_level=True
+            )
+            queue_handler.listener.start()
+            atexit.register(queue_handler.listener.stop)  # Flush queued records
+            logger.addHandler(queue_handler)
+        else:
+            file_handler = queue_handler.listener.handlers[0]
+            file_handler.maxBytes = max_size_mb * 1024 * 1024
+            file_handler.backupCount = backup_count
+        queue_handler.setLevel(level)
         file_handler.setLevel(level)
         file_handler.setFormatter(formatter)
-        logger.addHandler(file_handler)
     
     return logger
 
 
+def _close_handler(handler: logging.Handler):
+    """Close a handler, first draining and stopping its queue listener if any"""
+    listener = getattr(handler, 'listener', None)
+    if listener is not None:
+        atexit.unregister(listener.stop)
+        listener.stop()
+        for target in listener.handlers:
+            target.close()
+    handler.close()
+
+
 def get_logger(name: str) -> logging.Logger:
     """Get an existing logger by name"""
     return logging.getLogger(name)
@@ -79,9 +122,13 @@ def set_log_level(logger_name: str, level: int):
     logger = logging.getLogger(logger_name)
     logger.setLevel(level)
     
-    # Update all handlers
+    # Update all handlers, including those behind a queue listener
     for handler in logger.handlers:
         handler.setLevel(level)
+        listener = getattr(handler, 'listener', None)
+        if listener is not None:
+            for target in listener.handlers:
+                target.setLevel(level)
 
 
 def main():